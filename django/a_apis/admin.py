@@ -1,4 +1,5 @@
 from a_apis.models.chat import ChatMessage, ChatRoom
+from a_apis.models.email_outbox import EmailOutbox
 from a_apis.models.email_verification import EmailVerification
 from a_apis.models.products import (
     ProductAddress,
@@ -13,10 +14,17 @@ from django.contrib import admin
 admin.site.register(EmailVerification)
 
 
+@admin.register(EmailOutbox)
+class EmailOutboxAdmin(admin.ModelAdmin):
+    list_display = ("id", "to_email", "subject", "status", "attempts", "sent_at")
+    list_filter = ("status",)
+    search_fields = ("to_email",)
+
+
 # ProductAddress 관리자 클래스
 @admin.register(ProductAddress)
 class ProductAddressAdmin(admin.ModelAdmin):
-    list_display = ("id", "add_new", "add_old", "latitude", "longitude")
+    list_display = ("id", "add_new", "add_old", "latitude", "longitude", "geohash")
     search_fields = ("add_new", "add_old")
 
 
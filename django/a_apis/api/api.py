@@ -1,9 +1,11 @@
 from a_apis.service.common_parser import CommonParser
+from a_apis.service.common_renderer import CommonRenderer
 from ninja import NinjaAPI
 
 from .auth import router as auth_router
 from .chat import router as chat_router
 from .health import router as health_router
+from .health import staff_router as health_staff_router
 from .legal import router as legal_router
 from .products import public_router as product_public_router
 from .products import router as product_router
@@ -17,6 +19,7 @@ api = NinjaAPI(
     description="chaeuda API documentation",
     version="1.0.0",
     parser=CommonParser(),
+    renderer=CommonRenderer(),
 )
 
 
@@ -26,6 +29,7 @@ api.add_router("/users/", user_nomal_router, tags=["Users"])
 # api.add_router("/users/", user_cutom_router, tags=["Users"])
 api.add_router("/legal/", legal_router, tags=["Test"])
 api.add_router("/", health_router, tags=["Test"])
+api.add_router("/", health_staff_router, tags=["Test"])
 api.add_router("/product/", product_router, tags=["Products"])
 api.add_router("/product/", product_public_router, tags=["Products"])
 api.add_router("/chat/", chat_router, tags=["Chat"])
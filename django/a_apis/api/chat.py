@@ -3,6 +3,7 @@ from a_apis.schema.chat import (
     ChatRoomResponse,
     CreateChatRoomRequest,
     GetChatRoomsResponse,
+    UnreadCountResponse,
 )
 from a_apis.service.chat import ChatService
 from ninja import Router
@@ -18,6 +19,14 @@ def get_chat_rooms(request):
     return ChatService.get_chat_rooms(request)
 
 
+@router.get("/unread", response=UnreadCountResponse)
+def get_unread_count(request):
+    """
+    전체 채팅방의 안 읽은 메시지 수 (알림 배지용)
+    """
+    return ChatService.get_unread_count(request)
+
+
 @router.post("/create", response=ChatRoomResponse)
 def create_chat_room(request, data: CreateChatRoomRequest):
     """
@@ -1,8 +1,37 @@
+from a_apis.auth.bearer import StaffAuthBearer
+from a_apis.service.email_outbox import EmailOutboxService
+from a_core.db import get_pool_stats, get_query_stats
 from ninja import Router
 
 router = Router()
+# 커넥션 풀/쿼리/발송 대기열 등 내부 통계는 스태프 계정만 조회
+staff_router = Router(auth=StaffAuthBearer())
 
 
 @router.get("/health")
 def health_check(request):
     return {"status": "ok"}
+
+
+@staff_router.get("/health/db-pool")
+def db_pool_stats(request):
+    """
+    비동기(asyncpg) 커넥션 풀 통계 - 현재 워커 프로세스 기준
+    """
+    return get_pool_stats()
+
+
+@staff_router.get("/health/db-queries")
+def db_query_stats(request):
+    """
+    비동기(asyncpg) 쿼리 이름별 실행 시간 통계 - 현재 워커 프로세스 기준
+    """
+    return get_query_stats()
+
+
+@staff_router.get("/health/email-outbox")
+def email_outbox_stats(request):
+    """
+    이메일 발송 대기열 통계 - 대기열 상태별 건수, 현재 워커 프로세스의 발송 결과
+    """
+    return EmailOutboxService.get_stats()
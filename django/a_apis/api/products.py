@@ -6,6 +6,7 @@ from a_apis.auth.decorators import optional_auth
 from a_apis.models import ProductDetail
 from a_apis.schema.products import (
     MyProductsSchemaResponseSchema,
+    NearbyProductsResponseSchema,
     ProductAllResponseSchema,
     ProductDeleteResponseSchema,
     ProductDetailAllResponseSchema,
@@ -14,6 +15,7 @@ from a_apis.schema.products import (
     ProductUpdateResponseSchema,
     UserLikedProductsResponseSchema,
 )
+from a_apis.service.pagination import DEFAULT_PAGE_LIMIT
 from a_apis.service.products import ProductService
 from ninja import Body, File, Router
 from ninja.errors import HttpError
@@ -205,12 +207,16 @@ def toggle_like_product(
 
 @router.get("/like-mylist", response=UserLikedProductsResponseSchema)
 @login_required
-def mylist_like_products(request):
+def mylist_like_products(
+    request, cursor: Optional[str] = None, limit: int = DEFAULT_PAGE_LIMIT
+):
     """
     사용자가 찜한 매물 목록 조회 API
     ```
     Args:
         request: Django 요청 객체
+        cursor (Optional[str]): 이전 응답의 next_cursor (첫 페이지는 생략)
+        limit (int): 페이지 크기 (기본값 20, 최대 100)
 
     Returns:
         UserLikedProductsResponseSchema: 찜한 매물 목록 조회 결과
@@ -226,10 +232,11 @@ def mylist_like_products(request):
             - add_new: str (매물 도로명주소)
             - images: Optional[str] (매물 대표 이미지 URL -첫 번째 이미지 사용)
             - created_at: datetime (찜한 시간)
+        - next_cursor: Optional[str] (다음 페이지 커서, 마지막 페이지면 null)
     ```
     """
     try:
-        response_data = ProductService.mylist_like_products(request.user)
+        response_data = ProductService.mylist_like_products(request.user, cursor, limit)
         return response_data
     except HttpError as e:
         return Response({"success": False, "message": str(e)}, status=e.status_code)
@@ -241,12 +248,16 @@ def mylist_like_products(request):
 
 @router.get("/products-mylist", response=MyProductsSchemaResponseSchema)
 @login_required
-def mylist_products(request):
+def mylist_products(
+    request, cursor: Optional[str] = None, limit: int = DEFAULT_PAGE_LIMIT
+):
     """
     사용자가 등록한 매물 목록 조회 API
     ```
     Args:
         request: Django 요청 객체
+        cursor (Optional[str]): 이전 응답의 next_cursor (첫 페이지는 생략)
+        limit (int): 페이지 크기 (기본값 20, 최대 100)
 
     Returns:
         MyProductsSchemaResponseSchema: 등록한 매물 목록 조회 결과
@@ -262,10 +273,11 @@ def mylist_products(request):
             - add_new: str (매물 도로명주소)
             - images: Optional[str] (매물 대표 이미지 URL - 첫번째 이미지 사용)
             - created_at: datetime (등록 시간)
+        - next_cursor: Optional[str] (다음 페이지 커서, 마지막 페이지면 null)
     ```
     """
     try:
-        response_data = ProductService.mylist_products(request.user)
+        response_data = ProductService.mylist_products(request.user, cursor, limit)
         return response_data
     except HttpError as e:
         return Response({"success": False, "message": str(e)}, status=e.status_code)
@@ -319,13 +331,15 @@ def get_product_detail(request, product_id: int):
         )
 
 
-@public_router.get("/nearby", response=MyProductsSchemaResponseSchema)
+@public_router.get("/nearby", response=NearbyProductsResponseSchema)
 @optional_auth
 def get_nearby_products(
     request,
     latitude: float,
     longitude: float,
     zoom: int = 13,  # 기본값 13 (적당한 view)
+    cursor: Optional[str] = None,
+    limit: int = DEFAULT_PAGE_LIMIT,
 ):
     """
     주변 매물 조회 API
@@ -339,9 +353,20 @@ def get_nearby_products(
                    13: 광역시 기준 여러 구 단위 (~20km)
                    16: 동/읍 단위 (~2km)
                    19: 건물 단위 (~100m)
+        cursor (Optional[str]): 이전 응답의 next_cursor (개별 매물 응답에서만 사용)
+        limit (int): 페이지 크기 (기본값 20, 최대 100)
 
     Returns:
-        MyProductsSchemaResponseSchema: 주변 매물 목록
+        NearbyProductsResponseSchema: 주변 매물 목록
+        - clustered: bool (클러스터 응답 여부)
+        - products: list[MyProductsSchema] (개별 매물 목록 - 줌 13 이상)
+        - next_cursor: Optional[str] (다음 페이지 커서, 마지막 페이지면 null)
+        - clusters: list[ProductClusterSchema] (격자 셀별 매물 집계 - 줌 12 이하)
+            - cell: str (격자 셀 ID)
+            - count: int (매물 수)
+            - latitude, longitude: float (셀 안 매물들의 중심 좌표)
+            - min_price, max_price: int (최저/최고 가격)
+            - product_id: int (대표 매물 ID)
     ```
     """
     try:
@@ -352,7 +377,7 @@ def get_nearby_products(
             )
 
         response_data = ProductService.get_nearby_products(
-            request.user, latitude, longitude, zoom
+            request.user, latitude, longitude, zoom, cursor, limit
         )
         return response_data
     except Exception as e:
@@ -43,17 +43,20 @@ def signup(request, data: SignupSchema):
 
 
 @router.get("/me", response=AuthResponseSchema)
-def get_user(request):
+def get_user(request, check: bool = True):
     """
     사용자 정보 조회 엔드포인트
 
     Args:
         request: HTTP 요청 객체
+        check: 기본값 True - 토큰을 발급하지 않고 사용자 정보와 토큰 만료 시간만 반환
+               토큰 재발급은 /refresh 사용
+               False(토큰 발급)는 지원 중단 예정이며 2027-01-31 이후 제거
 
     Returns:
         AuthResponseSchema: 사용자 정보 및 토큰 정보
     """
-    return UserService.get_user(request)
+    return UserService.get_user(request, check)
 
 
 @nomal_router.post("/refresh", response=TokenResponseSchema)
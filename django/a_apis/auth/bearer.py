@@ -1,17 +1,21 @@
+from a_apis.auth.user_cache import resolve_request_user
 from ninja.security import HttpBearer
-from rest_framework_simplejwt.tokens import AccessToken
-
-from django.contrib.auth import get_user_model
-
-User = get_user_model()
 
 
 class AuthBearer(HttpBearer):
     def authenticate(self, request, token):
         try:
-            access_token = AccessToken(token)
-            user = User.objects.get(id=access_token["user_id"])
+            user = resolve_request_user(request, token)
             request.user = user
             return token
         except Exception:
             return None
+
+
+class StaffAuthBearer(AuthBearer):
+    # 운영 통계 등 내부 정보 조회용 - 스태프 계정만 허용
+    def authenticate(self, request, token):
+        token = super().authenticate(request, token)
+        if token is None or not request.user.is_staff:
+            return None
+        return token
@@ -1,11 +1,6 @@
 from functools import wraps
 
-from a_apis.auth.bearer import AuthBearer
-from rest_framework_simplejwt.tokens import AccessToken
-
-from django.contrib.auth import get_user_model
-
-User = get_user_model()
+from a_apis.auth.user_cache import resolve_request_user
 
 
 def optional_auth(func):
@@ -16,9 +11,8 @@ def optional_auth(func):
             if auth_header and auth_header.startswith("Bearer "):
                 token = auth_header.split(" ")[1]
                 try:
-                    # JWT 토큰 디코딩 및 유저 조회
-                    access_token = AccessToken(token)
-                    user = User.objects.get(id=access_token["user_id"])
+                    # JWT 토큰 디코딩 및 유저 조회 (캐시 사용)
+                    user = resolve_request_user(request, token)
                     request.user = user
                     print(f"Token authenticated, User: {user.username}")  # 디버깅용
                 except Exception as e:
@@ -0,0 +1,88 @@
+import logging
+from typing import Optional
+
+from rest_framework_simplejwt.tokens import AccessToken
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+User = get_user_model()
+
+
+# 인증된 유저 캐시 (유저 ID 기준, 짧은 TTL)
+# 인증/응답에 필요한 필드만 저장 (비밀번호 해시 등은 캐시에 저장하지 않음)
+# 캐시에서 만든 유저는 읽기 전용으로 사용 - 수정할 때는 DB에서 다시 조회(select_for_update)
+class UserCache:
+    KEY_PREFIX = "auth:user"
+    FIELDS = (
+        "id",
+        "username",
+        "email",
+        "phone_number",
+        "is_active",
+        "is_staff",
+        "is_superuser",
+        "is_email_verified",
+        "is_social_login",
+    )
+
+    @staticmethod
+    def key(user_id: int) -> str:
+        return f"{UserCache.KEY_PREFIX}:{user_id}"
+
+    @staticmethod
+    def get(user_id: int) -> User:
+        key = UserCache.key(user_id)
+        try:
+            data = cache.get(key)
+        except Exception as e:
+            logger.warning(f"User cache get failed: {e}")
+            data = None
+
+        # 이전 형식(User 객체 전체)으로 저장된 값은 사용하지 않음
+        if not isinstance(data, dict):
+            data = User.objects.values(*UserCache.FIELDS).get(id=user_id)
+            try:
+                cache.set(
+                    key, data, timeout=getattr(settings, "AUTH_USER_CACHE_TIMEOUT", 60)
+                )
+            except Exception as e:
+                logger.warning(f"User cache set failed: {e}")
+
+        # 나머지 필드는 지연 로딩(deferred)되어 접근할 때만 조회
+        # from_db는 모델 필드 순서대로 값을 받음
+        field_names = [
+            field.attname
+            for field in User._meta.concrete_fields
+            if field.attname in data
+        ]
+        return User.from_db(
+            User.objects.db, field_names, [data[name] for name in field_names]
+        )
+
+    @staticmethod
+    def invalidate(user_id: int):
+        try:
+            cache.delete(UserCache.key(user_id))
+        except Exception as e:
+            logger.warning(f"User cache delete failed: {e}")
+
+
+def resolve_request_user(request, token: Optional[str] = None) -> User:
+    """
+    요청의 유저를 한 번만 조회해서 request에 저장
+    같은 요청 안에서 다시 호출하면 토큰 디코딩/조회 없이 저장된 유저를 반환
+    """
+    user = getattr(request, "_auth_user", None)
+    if user is not None:
+        return user
+
+    access_token = AccessToken(token or request.auth)
+    user = UserCache.get(access_token["user_id"])
+    request._auth_user = user
+    # 만료 시간 등 토큰 정보를 다시 디코딩하지 않도록 함께 저장
+    request._access_token = access_token
+    return user
@@ -0,0 +1,46 @@
+from a_apis.models import ProductAddress, ProductDetail, ProductImg
+from a_apis.service.geo import GeoService
+
+from django.core.management.base import BaseCommand
+from django.db.models import OuterRef, Subquery
+
+
+class Command(BaseCommand):
+    help = "기존 매물 데이터의 비정규화 컬럼(geohash, 대표 이미지)을 채웁니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size", type=int, default=1000, help="한 번에 갱신할 행 수"
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+
+        # 주소 geohash
+        updated = 0
+        batch = []
+        for address in ProductAddress.objects.filter(geohash="").iterator(
+            chunk_size=batch_size
+        ):
+            address.geohash = GeoService.encode_geohash(
+                address.latitude, address.longitude
+            )
+            batch.append(address)
+            if len(batch) >= batch_size:
+                updated += ProductAddress.objects.bulk_update(batch, ["geohash"])
+                batch = []
+        if batch:
+            updated += ProductAddress.objects.bulk_update(batch, ["geohash"])
+
+        self.stdout.write(self.style.SUCCESS(f"geohash가 갱신된 주소: {updated}건"))
+
+        # 대표 이미지 (첫 번째 이미지)
+        first_image = (
+            ProductImg.objects.filter(product_detail=OuterRef("pk"))
+            .order_by("pk")
+            .values("img_url")[:1]
+        )
+        updated = ProductDetail.objects.filter(cover_image__isnull=True).update(
+            cover_image=Subquery(first_image)
+        )
+        self.stdout.write(self.style.SUCCESS(f"대표 이미지가 갱신된 매물: {updated}건"))
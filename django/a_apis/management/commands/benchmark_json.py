@@ -0,0 +1,158 @@
+import json
+import timeit
+from datetime import datetime
+from decimal import Decimal
+
+from a_apis.service.common_parser import CommonParser
+from a_apis.service.common_renderer import CommonRenderer, dumps_str
+from ninja.renderers import JSONRenderer
+
+from django.core.management.base import BaseCommand
+
+
+def nearby_products_payload(count: int) -> dict:
+    # 주변 매물 조회 응답과 같은 구조의 데이터
+    return {
+        "success": True,
+        "message": "주변 매물 목록을 조회했습니다.",
+        "total_count": count,
+        "next_cursor": "MjAyNC0wMS0wMVQwMDowMDowMHwxMjM",
+        "clustered": False,
+        "clusters": [],
+        "products": [
+            {
+                "product_id": i,
+                "pro_title": f"햇살 좋은 단독주택 {i}",
+                "pro_price": 10000 + i,
+                "pro_type": "detached",
+                "pro_supply_a": Decimal("84.25"),
+                "add_new": "서울특별시 중구 세종대로 110",
+                "latitude": 37.5665 + i * 0.0001,
+                "longitude": 126.978 + i * 0.0001,
+                "images": f"https://cdn.example.com/products/thumbnails/{i:08d}.jpg",
+                "is_liked": i % 3 == 0,
+                "is_deleted": False,
+                "created_at": datetime(2024, 1, 1, 12, 30, 15, 123456),
+            }
+            for i in range(count)
+        ],
+    }
+
+
+def chat_frame() -> dict:
+    return {
+        "id": 123456,
+        "message": "안녕하세요, 매물 아직 있나요?",
+        "sender": {"id": 1, "username": "buyer", "email": "buyer@example.com"},
+        "created_at": datetime(2024, 1, 1, 12, 30, 15, 123456).isoformat(),
+    }
+
+
+def signup_body() -> bytes:
+    return json.dumps(
+        {
+            "email": "user@example.com",
+            "password": "P@ssw0rd!2024",
+            "username": "채우다유저",
+            "phone_number": "01012345678",
+            "marketing_agreed": True,
+        },
+        ensure_ascii=False,
+    ).encode()
+
+
+def product_body() -> bytes:
+    # 매물 등록/수정 요청과 같은 구조 (설명에 ':'가 들어가 검사 경로도 포함)
+    return json.dumps(
+        {
+            "pro_title": "햇살 좋은 단독주택",
+            "pro_price": 35000,
+            "management_cost": 50,
+            "pro_supply_a": 84.25,
+            "pro_site_a": 120.5,
+            "pro_heat": "gas",
+            "pro_type": "detached",
+            "pro_floor": 2,
+            "description": "남향, 주차 가능. 방문 가능 시간: 평일 18:00 이후" * 10,
+            "sale": True,
+            "pro_rooms": 3,
+            "pro_bathrooms": 2,
+            "pro_construction_year": 1998,
+            "add_new": "서울특별시 중구 세종대로 110",
+            "add_old": "서울특별시 중구 태평로1가 31",
+            "latitude": 37.5665,
+            "longitude": 126.978,
+        },
+        ensure_ascii=False,
+    ).encode()
+
+
+def strict_loads(body: bytes):
+    # 기존 CommonParser 방식
+    return json.loads(
+        body, object_pairs_hook=CommonParser.no_duplicates_object_pairs_hook
+    )
+
+
+class Command(BaseCommand):
+    help = "JSON 직렬화/파싱(기존 json 모듈 vs orjson 기반 CommonRenderer/CommonParser) 성능을 비교합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--products", type=int, default=200, help="매물 수")
+        parser.add_argument("--number", type=int, default=200, help="반복 횟수")
+
+    def bench(self, label: str, func, number: int) -> float:
+        seconds = min(timeit.repeat(func, number=number, repeat=5)) / number
+        self.stdout.write(f"  {label:<28} {seconds * 1_000_000:>10.1f} us")
+        return seconds
+
+    def compare(self, title: str, baseline, candidate, number: int):
+        self.stdout.write(title)
+        base = self.bench("stdlib", baseline, number)
+        fast = self.bench("orjson", candidate, number)
+        self.stdout.write(f"  speedup {base / fast:.1f}x")
+
+    def handle(self, *args, **options):
+        number = options["number"]
+        payload = nearby_products_payload(options["products"])
+        frame = chat_frame()
+        stdlib_renderer = JSONRenderer()
+        fast_renderer = CommonRenderer()
+
+        self.compare(
+            f"API 응답 (매물 {options['products']}개)",
+            lambda: stdlib_renderer.render(None, payload, response_status=200),
+            lambda: fast_renderer.render(None, payload, response_status=200),
+            number,
+        )
+
+        self.compare(
+            "웹소켓 채팅 프레임",
+            lambda: json.dumps(frame),
+            lambda: dumps_str(frame),
+            number * 100,
+        )
+
+        signup = signup_body()
+        self.compare(
+            "요청 파싱 (회원가입)",
+            lambda: strict_loads(signup),
+            lambda: CommonParser.loads(signup),
+            number * 100,
+        )
+
+        product = product_body()
+        self.compare(
+            "요청 파싱 (매물, 문자열에 ':' 포함)",
+            lambda: strict_loads(product),
+            lambda: CommonParser.loads(product),
+            number * 100,
+        )
+
+        listing = json.dumps(payload, default=str).encode()
+        self.compare(
+            f"요청 파싱 (매물 {options['products']}개 목록)",
+            lambda: strict_loads(listing),
+            lambda: CommonParser.loads(listing),
+            number,
+        )
@@ -0,0 +1,49 @@
+import timeit
+
+from a_apis.service.users import UserService
+from rest_framework_simplejwt.tokens import AccessToken
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.test import RequestFactory
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = "/users/me 기본(check) 모드와 지원 중단 예정인 토큰 발급 모드의 처리 시간을 비교합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--number", type=int, default=500, help="반복 횟수")
+
+    def bench(self, label: str, func, number: int) -> float:
+        seconds = min(timeit.repeat(func, number=number, repeat=5)) / number
+        self.stdout.write(f"  {label:<24} {seconds * 1_000_000:>10.1f} us")
+        return seconds
+
+    def handle(self, *args, **options):
+        number = options["number"]
+        factory = RequestFactory()
+
+        # 벤치마크용 유저는 트랜잭션을 롤백해 남기지 않음
+        with transaction.atomic():
+            user = User.objects.create_user(
+                username="benchmark",
+                email="benchmark-users-me@example.com",
+                password="benchmark-password",
+                phone_number="01000000000",
+            )
+            token = str(AccessToken.for_user(user))
+
+            def call(check: bool):
+                request = factory.get("/api/users/me")
+                request.auth = token
+                return UserService.get_user(request, check)
+
+            self.stdout.write("/users/me")
+            issue = self.bench("토큰 발급 (지원 중단)", lambda: call(False), number)
+            check = self.bench("check 모드 (기본)", lambda: call(True), number)
+            self.stdout.write(f"  speedup {issue / check:.1f}x")
+
+            transaction.set_rollback(True)
@@ -0,0 +1,87 @@
+import time
+
+from a_apis.service.email_outbox import EmailOutboxService
+from a_apis.service.email_verification import prune_expired_verifications
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+
+class Command(BaseCommand):
+    help = "이메일 발송 대기열을 발송합니다. (--loop: 워커로 계속 실행)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size", type=int, default=None, help="SMTP 연결 하나로 보낼 최대 수"
+        )
+        parser.add_argument(
+            "--loop", action="store_true", help="대기열을 계속 확인하며 발송"
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=None,
+            help="대기열이 비었을 때 다시 확인하는 간격 (초)",
+        )
+
+    def drain_all(self, batch_size) -> dict:
+        total = {"claimed": 0, "sent": 0, "retried": 0, "failed": 0}
+        while True:
+            result = EmailOutboxService.drain(batch_size)
+            if not result["claimed"]:
+                return total
+            for key, value in result.items():
+                total[key] += value
+
+    def prune_if_due(self, last_pruned: float) -> float:
+        """
+        EMAIL_OUTBOX_PRUNE_INTERVAL마다 보관 기간이 지난 이메일과 만료된 이메일 인증 정리
+        마지막 정리 시각(time.monotonic)을 반환
+        """
+        now = time.monotonic()
+        if now - last_pruned < getattr(settings, "EMAIL_OUTBOX_PRUNE_INTERVAL", 3600):
+            return last_pruned
+
+        # 정리 실패로 발송 워커가 멈추지 않도록 각각 처리
+        try:
+            result = EmailOutboxService.prune()
+            if any(result.values()):
+                self.stdout.write(
+                    f"정리: 발송 완료 {result['sent']}건, 발송 실패 {result['failed']}건"
+                )
+        except Exception as e:
+            self.stderr.write(f"이메일 정리 실패: {e}")
+
+        try:
+            result = prune_expired_verifications()
+            if any(result.values()):
+                self.stdout.write(
+                    f"정리: 만료된 미인증 {result['unverified']}건, "
+                    f"인증 완료 {result['verified']}건"
+                )
+        except Exception as e:
+            self.stderr.write(f"이메일 인증 정리 실패: {e}")
+        return now
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        interval = options["interval"] or getattr(
+            settings, "EMAIL_OUTBOX_POLL_INTERVAL", 5
+        )
+        # 워커 시작 직후 한 번 정리
+        last_pruned = float("-inf")
+
+        while True:
+            if options["loop"]:
+                last_pruned = self.prune_if_due(last_pruned)
+            result = self.drain_all(batch_size)
+            if result["claimed"] or not options["loop"]:
+                self.stdout.write(
+                    f"발송 {result['sent']}건, 재시도 예정 {result['retried']}건, "
+                    f"실패 {result['failed']}건"
+                )
+            if not options["loop"]:
+                return
+            close_old_connections()
+            time.sleep(interval)
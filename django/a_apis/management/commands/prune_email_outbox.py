@@ -0,0 +1,20 @@
+from a_apis.service.email_outbox import EmailOutboxService
+
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = "보관 기간이 지난 발송 완료/실패 이메일을 삭제합니다. (drain_email_outbox --loop에서도 주기적으로 실행)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size", type=int, default=1000, help="한 번에 삭제할 행 수"
+        )
+
+    def handle(self, *args, **options):
+        result = EmailOutboxService.prune(options["batch_size"])
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"발송 완료 {result['sent']}건, 발송 실패 {result['failed']}건을 삭제했습니다."
+            )
+        )
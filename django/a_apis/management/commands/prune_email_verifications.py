@@ -0,0 +1,21 @@
+from a_apis.service.email_verification import prune_expired_verifications
+
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = "만료된 이메일 인증 데이터를 삭제합니다. (drain_email_outbox --loop에서도 주기적으로 실행)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size", type=int, default=1000, help="한 번에 삭제할 행 수"
+        )
+
+    def handle(self, *args, **options):
+        result = prune_expired_verifications(options["batch_size"])
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"만료된 미인증 {result['unverified']}건, "
+                f"인증 완료 {result['verified']}건을 삭제했습니다."
+            )
+        )
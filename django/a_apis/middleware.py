@@ -1,19 +1,108 @@
-from django.http import JsonResponse
+from io import BytesIO
+
+from django.conf import settings
+from django.core.files.uploadhandler import (
+    FileUploadHandler,
+    MemoryFileUploadHandler,
+    TemporaryFileUploadHandler,
+)
+from django.http import JsonResponse, QueryDict
+from django.http.multipartparser import MultiPartParser, MultiPartParserError
+from django.utils.datastructures import MultiValueDict
+
+
+class UploadTooLarge(Exception):
+    pass
+
+
+class UploadLimitHandler(FileUploadHandler):
+    """
+    파일별/전체 업로드 크기 제한
+    Content-Length로 먼저 검사하고, 스트리밍 중에도 초과하는 즉시 업로드를 중단
+    """
+
+    def __init__(self, request=None):
+        super().__init__(request)
+        self.max_file_size = getattr(
+            settings, "PUT_UPLOAD_MAX_FILE_SIZE", 100 * 1024 * 1024
+        )
+        self.max_total_size = getattr(
+            settings, "PUT_UPLOAD_MAX_TOTAL_SIZE", 300 * 1024 * 1024
+        )
+        self.file_size = 0
+        self.total_size = 0
+
+    def handle_raw_input(
+        self, input_data, META, content_length, boundary, encoding=None
+    ):
+        if content_length > self.max_total_size:
+            raise UploadTooLarge("전체 업로드 크기 제한을 초과했습니다.")
+
+    def new_file(self, *args, **kwargs):
+        super().new_file(*args, **kwargs)
+        self.file_size = 0
+
+    def receive_data_chunk(self, raw_data, start):
+        self.file_size += len(raw_data)
+        self.total_size += len(raw_data)
+        if self.file_size > self.max_file_size:
+            raise UploadTooLarge(f"파일 크기 제한을 초과했습니다: {self.file_name}")
+        if self.total_size > self.max_total_size:
+            raise UploadTooLarge("전체 업로드 크기 제한을 초과했습니다.")
+        # 다음 핸들러(메모리/임시 파일)로 그대로 전달
+        return raw_data
+
+    def file_complete(self, file_size):
+        return None
+
+
+class SmallMemoryFileUploadHandler(MemoryFileUploadHandler):
+    # 요청 전체가 PUT_UPLOAD_MEMORY_THRESHOLD 이하일 때만 메모리에 보관
+    def handle_raw_input(
+        self, input_data, META, content_length, boundary, encoding=None
+    ):
+        self.activated = content_length <= getattr(
+            settings, "PUT_UPLOAD_MEMORY_THRESHOLD", 2621440
+        )
 
 
 class ProcessPUTPatchMiddleware:
+    """
+    PUT, PATCH 요청의 폼 데이터를 POST와 같이 request.POST / request.FILES로 파싱
+    multipart는 스트리밍으로 한 번만 파싱하고, 큰 파일은 임시 파일에 저장
+    """
+
     def __init__(self, get_response):
         self.get_response = get_response
 
     def __call__(self, request):
-        if (
-            request.method in ("PUT", "PATCH")
-            and request.content_type != "application/json"
-        ):
-            original_method = request.method
-            request.method = "POST"
-            request.META["REQUEST_METHOD"] = "POST"
-            request._load_post_and_files()  # 이 부분이 중요합니다!
-            request.META["REQUEST_METHOD"] = original_method
-            request.method = original_method
+        if request.method in ("PUT", "PATCH"):
+            try:
+                self.parse_form(request)
+            except UploadTooLarge as e:
+                return JsonResponse({"success": False, "message": str(e)}, status=413)
+            except MultiPartParserError as e:
+                return JsonResponse({"success": False, "message": str(e)}, status=400)
         return self.get_response(request)
+
+    @staticmethod
+    def parse_form(request):
+        if request.content_type == "multipart/form-data":
+            upload_handlers = [
+                UploadLimitHandler(request),
+                SmallMemoryFileUploadHandler(request),
+                TemporaryFileUploadHandler(request),
+            ]
+            # 앞선 미들웨어가 request.body를 이미 읽었으면 스트림이 비어 있으므로
+            # Django(HttpRequest._load_post_and_files)와 같이 읽어둔 본문에서 파싱
+            if hasattr(request, "_body"):
+                data = BytesIO(request._body)
+            else:
+                data = request
+            # 파싱 결과를 저장해두면 request.POST / request.FILES 접근 시 다시 파싱하지 않음
+            request._post, request._files = MultiPartParser(
+                request.META, data, upload_handlers, request.encoding
+            ).parse()
+        elif request.content_type == "application/x-www-form-urlencoded":
+            request._post = QueryDict(request.body, encoding=request.encoding)
+            request._files = MultiValueDict()
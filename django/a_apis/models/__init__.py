@@ -1,4 +1,5 @@
 from .chat import ChatMessage, ChatRoom
+from .email_outbox import EmailOutbox
 from .email_verification import EmailVerification
 from .products import (
     ProductAddress,
@@ -10,6 +11,7 @@ from .products import (
 
 __all__ = [
     "EmailVerification",
+    "EmailOutbox",
     "ProductDetail",
     "ProductAddress",
     "ProductImg",
@@ -15,6 +15,9 @@ class ChatRoom(CommonModel):
         User, related_name="chat_rooms_as_buyer", on_delete=models.CASCADE
     )
     is_active = models.BooleanField(default=True)
+    # 구매자/판매자가 마지막으로 읽은 메시지 ID (안 읽은 메시지 수 계산용)
+    buyer_last_read_id = models.BigIntegerField(default=0)
+    seller_last_read_id = models.BigIntegerField(default=0)
 
     class Meta:
         db_table = "chat_room"
@@ -41,6 +44,10 @@ class ChatMessage(CommonModel):
         db_table = "chat_message"
         verbose_name = "채팅 메시지"
         verbose_name_plural = "채팅 메시지"
+        indexes = [
+            # 채팅방별 최근 메시지 / 이전 페이지 조회용
+            models.Index(fields=["chat_room", "id"], name="chat_msg_room_id_idx"),
+        ]
 
     def __str__(self):
         return f"{self.sender.username}: {self.message[:20]}"
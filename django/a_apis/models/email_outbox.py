@@ -0,0 +1,48 @@
+from a_common.models import CommonModel
+
+from django.db import models
+from django.utils import timezone
+
+
+class EmailOutbox(CommonModel):
+    """발송 대기 이메일 (요청 처리와 분리해서 워커가 모아서 발송)"""
+
+    STATUS_PENDING = "pending"
+    STATUS_SENT = "sent"
+    STATUS_FAILED = "failed"
+    STATUS_CHOICES = [
+        (STATUS_PENDING, "대기"),
+        (STATUS_SENT, "발송 완료"),
+        (STATUS_FAILED, "발송 실패"),
+    ]
+
+    to_email = models.EmailField()
+    subject = models.CharField(max_length=255)
+    body = models.TextField()
+    html_body = models.TextField(blank=True, default="")
+    status = models.CharField(
+        max_length=10, choices=STATUS_CHOICES, default=STATUS_PENDING
+    )
+    attempts = models.PositiveSmallIntegerField(default=0)
+    # 다음 발송 시도 시각 (워커가 가져가면 처리 시간만큼 미뤄두고, 실패 시 backoff 만큼 미룸)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    last_error = models.TextField(blank=True, default="")
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = "email_outbox"
+        verbose_name = "이메일 발송 대기열"
+        verbose_name_plural = "이메일 발송 대기열"
+        indexes = [
+            # 워커의 발송 대상 조회용
+            models.Index(
+                fields=["status", "next_attempt_at"], name="email_outbox_due_idx"
+            ),
+            # 보관 기간이 지난 발송 완료/실패 이메일 정리용
+            models.Index(
+                fields=["status", "created_at"], name="email_outbox_prune_idx"
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.to_email} - {self.subject} ({self.status})"
@@ -3,23 +3,41 @@ from datetime import timedelta
 
 from a_common.models import CommonModel
 
+from django.conf import settings
 from django.db import models
 from django.utils import timezone
 
 
+def generate_verification_code() -> str:
+    return str(random.randint(100000, 999999))
+
+
 class EmailVerification(CommonModel):
     email = models.EmailField()
     verification_code = models.CharField(max_length=6)
     is_verified = models.BooleanField(default=False)
     expires_at = models.DateTimeField()
 
+    class Meta:
+        indexes = [
+            # 이메일 기준 조회 (인증번호 확인, 회원가입 시 인증 여부 확인, 재발급 시 삭제)
+            models.Index(
+                fields=["email", "is_verified", "verification_code"],
+                name="email_verif_lookup_idx",
+            ),
+            # 만료된 인증 정리용
+            models.Index(fields=["expires_at"], name="email_verif_expires_idx"),
+        ]
+
     def __str__(self):
         return f"{self.email} - {'Verified' if self.is_verified else 'Not Verified'}"
 
     def save(self, *args, **kwargs):
         if not self.pk:  # Only set expires_at when creating new object
-            self.verification_code = str(random.randint(100000, 999999))
-            self.expires_at = timezone.now() + timedelta(minutes=30)
+            self.verification_code = generate_verification_code()
+            self.expires_at = timezone.now() + timedelta(
+                seconds=getattr(settings, "EMAIL_VERIFICATION_CODE_TTL", 60 * 30)
+            )
         super().save(*args, **kwargs)
 
     @property
@@ -1,3 +1,4 @@
+from a_apis.service.geo import GeoService
 from a_common.models import CommonModel
 from a_user.models import User
 
@@ -10,6 +11,9 @@ class ProductAddress(CommonModel):
     add_old = models.CharField(max_length=200, verbose_name="구주소")
     latitude = models.FloatField(verbose_name="위도")
     longitude = models.FloatField(verbose_name="경도")
+    geohash = models.CharField(
+        max_length=12, default="", blank=True, db_index=True, verbose_name="지오해시"
+    )
     is_deleted = models.BooleanField(default=False, verbose_name="삭제 여부")
 
     class Meta:
@@ -20,6 +24,18 @@ class ProductAddress(CommonModel):
     def __str__(self):
         return self.add_new
 
+    def save(self, *args, **kwargs):
+        # 위경도가 바뀔 때마다 지도 조회용 geohash 셀을 함께 갱신
+        self.geohash = GeoService.encode_geohash(
+            float(self.latitude), float(self.longitude)
+        )
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and (
+            "latitude" in update_fields or "longitude" in update_fields
+        ):
+            kwargs["update_fields"] = {*update_fields, "geohash"}
+        super().save(*args, **kwargs)
+
 
 class ProductVideo(CommonModel):
     id = models.BigAutoField(primary_key=True, verbose_name="동영상 ID")
@@ -97,12 +113,27 @@ class ProductDetail(CommonModel):
         verbose_name="유저-매물 찜 목록",
         related_name="product_likes",
     )
+    # 목록 조회 시 이미지 테이블을 조회하지 않도록 첫 번째 이미지 URL을 비정규화
+    cover_image = models.CharField(
+        max_length=500, null=True, blank=True, verbose_name="대표 이미지 URL"
+    )
+    # 대표 이미지의 썸네일 (백그라운드 생성 완료 전에는 null)
+    cover_thumbnail = models.CharField(
+        max_length=500, null=True, blank=True, verbose_name="대표 썸네일 URL"
+    )
     is_deleted = models.BooleanField(default=False, verbose_name="삭제 여부")
 
     class Meta:
         db_table = "product_detail"
         verbose_name = "매물정보"
         verbose_name_plural = "매물정보"
+        indexes = [
+            # 목록 커서 페이지네이션 (created_at, id) 정렬용
+            models.Index(
+                fields=["user", "-created_at", "-id"], name="product_user_created_idx"
+            ),
+            models.Index(fields=["-created_at", "-id"], name="product_created_idx"),
+        ]
 
     def __str__(self):
         return self.pro_title
@@ -116,6 +147,13 @@ class ProductDetail(CommonModel):
 class ProductImg(CommonModel):
     id = models.BigAutoField(primary_key=True, verbose_name="이미지 ID")
     img_url = models.FileField(upload_to="img/", verbose_name="이미지 URL")
+    # 백그라운드에서 생성되는 파생본 (생성 전에는 null)
+    thumbnail_url = models.CharField(
+        max_length=500, null=True, blank=True, verbose_name="썸네일 URL"
+    )
+    web_url = models.CharField(
+        max_length=500, null=True, blank=True, verbose_name="웹 최적화 이미지 URL"
+    )
     product_detail = models.ForeignKey(
         ProductDetail,
         on_delete=models.CASCADE,
@@ -156,3 +194,9 @@ class ProductLikes(CommonModel):
         verbose_name_plural = "찜 목록"
         # 동일한 유저가 같은 매물을 중복해서 찜하지 못하도록
         unique_together = ("user", "product")
+        indexes = [
+            # 찜 목록 커서 페이지네이션 (created_at, id) 정렬용
+            models.Index(
+                fields=["user", "-created_at", "-id"], name="like_user_created_idx"
+            ),
+        ]
@@ -1,3 +1,4 @@
+from datetime import datetime
 from typing import Optional
 
 from ninja import Schema
@@ -15,6 +16,9 @@ class ChatRoom(Schema):
     product_address: str
     seller: str
     buyer: str
+    last_message: Optional[str] = None
+    last_message_at: Optional[datetime] = None
+    unread_count: int = 0
 
 
 class ChatRoomResponse(Schema):
@@ -24,4 +28,10 @@ class ChatRoomResponse(Schema):
 class GetChatRoomsResponse(Schema):
     success: bool
     message: str
-    chat_rooms: Optional[ChatRoomResponse] = None
+    chat_rooms: Optional[list[ChatRoom]] = None
+
+
+class UnreadCountResponse(Schema):
+    success: bool
+    message: str
+    unread_count: int = 0
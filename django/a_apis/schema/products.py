@@ -127,7 +127,9 @@ class UserLikedProductsSchema(Schema):
     pro_type: str = Field(..., description="건물 유형")
     pro_supply_a: float = Field(..., description="공급면적")
     add_new: str = Field(..., description="매물 주소(도로명)")
-    images: Optional[str] = Field(None, description="매물 이미지 URL(첫 번째 이미지)")
+    images: Optional[str] = Field(
+        None, description="매물 썸네일 URL(첫 번째 이미지, 썸네일 생성 전에는 원본)"
+    )
     is_liked: bool = Field(..., description="현재 사용자의 찜 여부")
     is_deleted: bool = Field(default=False, description="삭제 여부")
     created_at: datetime = Field(..., description="찜한 시간")
@@ -137,8 +139,11 @@ class UserLikedProductsSchema(Schema):
 class UserLikedProductsResponseSchema(Schema):
     success: bool = Field(..., description="요청 처리 성공 여부")
     message: str = Field(..., description="응답 메시지")
-    total_count: int = Field(..., description="전체 찜한 매물 수")
+    total_count: int = Field(..., description="이번 페이지의 찜한 매물 수")
     products: list[UserLikedProductsSchema] = Field(..., description="찜한 매물 목록")
+    next_cursor: Optional[str] = Field(
+        None, description="다음 페이지 커서 (마지막 페이지면 null)"
+    )
 
 
 # 유저가 등록한 매물 목록 조회 스키마
@@ -151,7 +156,9 @@ class MyProductsSchema(Schema):
     add_new: str = Field(..., description="매물 주소(도로명)")
     latitude: float = Field(..., description="위도")
     longitude: float = Field(..., description="경도")
-    images: Optional[str] = Field(None, description="매물 이미지 URL(첫 번째 이미지)")
+    images: Optional[str] = Field(
+        None, description="매물 썸네일 URL(첫 번째 이미지, 썸네일 생성 전에는 원본)"
+    )
     is_liked: bool = Field(..., description="현재 사용자의 찜 여부")
     is_deleted: bool = Field(default=False, description="삭제 여부")
     created_at: datetime = Field(..., description="찜한 시간")
@@ -161,8 +168,30 @@ class MyProductsSchema(Schema):
 class MyProductsSchemaResponseSchema(Schema):
     success: bool = Field(..., description="요청 처리 성공 여부")
     message: str = Field(..., description="응답 메시지")
-    total_count: int = Field(..., description="전체 등록 매물 수")
+    total_count: int = Field(..., description="이번 페이지의 매물 수")
     products: list[MyProductsSchema] = Field(..., description="등록한 매물 목록")
+    next_cursor: Optional[str] = Field(
+        None, description="다음 페이지 커서 (마지막 페이지면 null)"
+    )
+
+
+# 지도 매물 클러스터 스키마 (낮은 줌 레벨)
+class ProductClusterSchema(Schema):
+    cell: str = Field(..., description="격자 셀 ID(geohash)")
+    count: int = Field(..., description="셀 안의 매물 수")
+    latitude: float = Field(..., description="셀 안 매물들의 중심 위도")
+    longitude: float = Field(..., description="셀 안 매물들의 중심 경도")
+    min_price: int = Field(..., description="셀 안 최저 매물 가격")
+    max_price: int = Field(..., description="셀 안 최고 매물 가격")
+    product_id: int = Field(..., description="대표 매물 ID")
+
+
+# 주변 매물 조회 응답 스키마
+class NearbyProductsResponseSchema(MyProductsSchemaResponseSchema):
+    clustered: bool = Field(default=False, description="클러스터 응답 여부")
+    clusters: list[ProductClusterSchema] = Field(
+        default=[], description="매물 클러스터 목록 (낮은 줌 레벨에서만 사용)"
+    )
 
 
 # 매물 상세조회를 위한 유저 정보 스키마
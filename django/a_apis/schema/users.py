@@ -1,3 +1,4 @@
+from datetime import datetime
 from typing import Optional
 
 from ninja import Schema
@@ -41,6 +42,8 @@ class AuthResponseSchema(Schema):
     message: str
     tokens: Optional[TokenSchema] = None
     user: Optional[UserResponseSchema] = None
+    # /users/me - 현재 access 토큰 만료 시간
+    expires_at: Optional[datetime] = None
 
 
 class RefreshTokenSchema(Schema):
@@ -1,58 +1,136 @@
-import requests
-from a_apis.models.email_verification import EmailVerification
+import hashlib
+import inspect
+from functools import wraps
+from logging import getLogger
+
+from a_apis.auth.user_cache import UserCache
+from a_apis.service.email_verification import get_verification_store
+from a_apis.service.oauth_client import OAuthHttpClient
 from a_user.models import SocialUser
 from ninja.errors import HttpError
 from rest_framework_simplejwt.tokens import RefreshToken
 
+from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import transaction
 
 User = get_user_model()
 
+logger = getLogger(__name__)
+
 
 class SocialLoginService:
     @staticmethod
     def create_or_get_user(
         email: str, username: str, social_type: str, phone_number: str
     ) -> User:
-        user, created = User.objects.get_or_create(
-            email=email,
-            defaults={
-                "username": username,
-                "is_email_verified": True,
-                "is_social_login": True,
-                "phone_number": phone_number,
-            },
-        )
+        """
+        소셜 로그인 유저 조회/생성
+        기존 소셜 로그인 회원은 SELECT 한 번으로 끝나고,
+        쓰기가 필요한 경우에는 User 생성(잠금)과 SocialUser 연결을 한 트랜잭션에서 처리
+        (SocialUser 생성이 실패하면 User 생성도 롤백되어 연결되지 않은 회원이 남지 않음)
+        """
+        user = User.objects.filter(
+            email=email, is_social_login=True, is_active=True
+        ).first()
+        if user:
+            return user
+
+        with transaction.atomic():
+            # get_or_create는 동시 생성 시 IntegrityError를 잡아 다시 조회하므로 중복 생성되지 않음
+            # 기존 회원은 행을 잠가 동시 콜백이 같은 회원을 함께 수정하지 않도록 함
+            # 처음 가입한 회원은 회원정보 입력 전까지 비활성 상태로 바로 생성 (추가 save 없음)
+            user, created = User.objects.select_for_update().get_or_create(
+                email=email,
+                defaults={
+                    "username": username,
+                    "is_email_verified": True,
+                    "is_social_login": True,
+                    "is_active": False,
+                    "phone_number": phone_number,
+                },
+            )
 
-        if created:
-            user.is_active = False
-            user.save()
+            # 처음 가입했거나, 일반 회원이 처음 소셜 로그인한 경우에만 SocialUser 연결
+            link_social = created or not user.is_social_login
 
-            # SocialUser 생성
-            SocialUser.objects.create(
-                user=user,
-                social_id=email,
-                social_type=social_type,
-            )
+            if not user.is_social_login:
+                User.objects.filter(id=user.id).update(is_social_login=True)
+                user.is_social_login = True
+                transaction.on_commit(lambda: UserCache.invalidate(user.id))
 
-        elif not user.is_social_login:
-            user.is_social_login = True
-            user.save()
+            if link_social:
+                # SocialUser 생성 - 동시 콜백이 먼저 만든 경우 무시 (ON CONFLICT DO NOTHING)
+                SocialUser.objects.bulk_create(
+                    [SocialUser(user=user, social_id=email, social_type=social_type)],
+                    ignore_conflicts=True,
+                )
 
-            # SocialUser 생성
-            SocialUser.objects.create(
-                user=user,
-                social_id=email,
-                social_type=social_type,
+            # 기존 회원이 아니라, 처음 소셜로 회원가입시 회원정보 입력을 위해서, 이메일인증
+            if not user.is_active:
+                get_verification_store().mark_verified(email)
+
+        return user
+
+
+# 중복 콜백 처리 상태 (토큰 등 처리 결과는 캐시에 저장하지 않음)
+CALLBACK_PROCESSING = "processing"
+CALLBACK_DONE = "done"
+
+
+def deduplicate_callback(social_type: str):
+    """
+    같은 인가 코드로 들어온 콜백(새로고침, 중복 제출, 재전송)은 한 번만 처리
+    먼저 도착한 요청만 코드 교환/사용자 정보 조회/유저 생성을 하고 토큰을 받음
+    뒤에 도착한 요청은 기다리지 않고 바로 409로 거절 (워커를 붙잡지 않고, 토큰을 받지 않음)
+    처리 중 오류가 나면 상태를 지워서 다시 시도할 수 있도록 함
+    """
+
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            # code를 위치 인자로 넘겨도 중복 처리되도록 시그니처로 찾음
+            code = signature.bind(*args, **kwargs).arguments.get("code")
+            if not code:
+                return func(*args, **kwargs)
+
+            code_hash = hashlib.sha256(code.encode()).hexdigest()
+            key = f"oauth:callback:{social_type}:{code_hash}"
+            try:
+                acquired = cache.add(
+                    key,
+                    CALLBACK_PROCESSING,
+                    timeout=getattr(settings, "OAUTH_CALLBACK_LOCK_TIMEOUT", 30),
+                )
+                state = None if acquired else cache.get(key)
+            except Exception as e:
+                logger.warning(f"OAuth callback cache failed: {e}")
+                return func(*args, **kwargs)
+
+            if not acquired:
+                if state == CALLBACK_DONE:
+                    raise HttpError(409, "이미 처리된 로그인 요청입니다")
+                raise HttpError(409, "이미 처리 중인 로그인 요청입니다")
+
+            try:
+                result = func(*args, **kwargs)
+            except Exception:
+                cache.delete(key)
+                raise
+            cache.set(
+                key,
+                CALLBACK_DONE,
+                timeout=getattr(settings, "OAUTH_CALLBACK_DONE_TIMEOUT", 600),
             )
+            return result
 
-        # 기존 회원이 아니라, 처음 소셜로 회원가입시 회원정보 입력을 위해서, 이메일인증
-        if not user.is_active:
-            EmailVerification.objects.filter(email=email, is_verified=False).delete()
-            EmailVerification.objects.create(email=email, is_verified=True)
+        return wrapper
 
-        return user
+    return decorator
 
 
 class GoogleAuthService:
@@ -72,6 +150,7 @@ class GoogleAuthService:
         )
 
     @staticmethod
+    @deduplicate_callback("google")
     def callback_google_auth(
         code: str,
         server_base_url: str,
@@ -82,7 +161,7 @@ class GoogleAuthService:
         if not code:
             raise HttpError(400, "No code provided by Google")
 
-        token_url = "https://oauth2.googleapis.com/token"
+        token_url = OAuthHttpClient.endpoint("google", "token_url")
         data = {
             "code": code,
             "client_id": client_id,
@@ -91,7 +170,7 @@ class GoogleAuthService:
             "grant_type": "authorization_code",
         }
 
-        token_resp = requests.post(token_url, data=data)
+        token_resp = OAuthHttpClient.post("google", token_url, data=data)
         if token_resp.status_code != 200:
             raise HttpError(400, "Failed to exchange code for token")
 
@@ -100,8 +179,12 @@ class GoogleAuthService:
         if not access_token:
             raise HttpError(400, "No access_token received")
 
-        userinfo_url = f"https://www.googleapis.com/oauth2/v1/userinfo?alt=json&access_token={access_token}"
-        userinfo_resp = requests.get(userinfo_url)
+        userinfo_url = OAuthHttpClient.endpoint("google", "userinfo_url")
+        userinfo_resp = OAuthHttpClient.get(
+            "google",
+            userinfo_url,
+            params={"alt": "json", "access_token": access_token},
+        )
         if userinfo_resp.status_code != 200:
             raise HttpError(400, "Failed to get user info from Google")
 
@@ -145,6 +228,7 @@ class KakaoAuthService:
         )
 
     @staticmethod
+    @deduplicate_callback("kakao")
     def callback_kakao_auth(
         code: str,
         server_base_url: str,
@@ -155,7 +239,7 @@ class KakaoAuthService:
         if not code:
             raise HttpError(400, "카카오에서 제공한 코드가 없습니다")
 
-        token_url = "https://kauth.kakao.com/oauth/token"
+        token_url = OAuthHttpClient.endpoint("kakao", "token_url")
         data = {
             "grant_type": "authorization_code",
             "client_id": client_id,
@@ -164,7 +248,7 @@ class KakaoAuthService:
             "redirect_uri": f"{server_base_url}/auth/kakao/callback",
         }
 
-        token_resp = requests.post(token_url, data=data)
+        token_resp = OAuthHttpClient.post("kakao", token_url, data=data)
         if token_resp.status_code != 200:
             raise HttpError(400, "토큰 교환에 실패했습니다")
 
@@ -173,13 +257,13 @@ class KakaoAuthService:
         if not access_token:
             raise HttpError(400, "액세스 토큰을 받지 못했습니다")
 
-        user_info_url = "https://kapi.kakao.com/v2/user/me"
+        user_info_url = OAuthHttpClient.endpoint("kakao", "userinfo_url")
         headers = {
             "Authorization": f"Bearer {access_token}",
             "Content-type": "application/x-www-form-urlencoded;charset=utf-8",
         }
 
-        user_info_resp = requests.get(user_info_url, headers=headers)
+        user_info_resp = OAuthHttpClient.get("kakao", user_info_url, headers=headers)
 
         if user_info_resp.status_code != 200:
             raise HttpError(400, "카카오에서 사용자 정보를 가져오는데 실패했습니다")
@@ -230,6 +314,7 @@ class NaverAuthService:
         )
 
     @staticmethod
+    @deduplicate_callback("naver")
     def callback_naver_auth(
         code: str,
         server_base_url: str,
@@ -240,7 +325,7 @@ class NaverAuthService:
         if not code:
             raise HttpError(400, "네이버에서 제공한 코드가 없습니다")
 
-        token_url = "https://nid.naver.com/oauth2.0/token"
+        token_url = OAuthHttpClient.endpoint("naver", "token_url")
         data = {
             "grant_type": "authorization_code",
             "client_id": client_id,
@@ -250,7 +335,7 @@ class NaverAuthService:
             "redirect_uri": f"{server_base_url}/auth/naver/callback",
         }
 
-        token_resp = requests.post(token_url, data=data)
+        token_resp = OAuthHttpClient.post("naver", token_url, data=data)
         if token_resp.status_code != 200:
             raise HttpError(400, "토큰 교환에 실패했습니다")
 
@@ -259,12 +344,12 @@ class NaverAuthService:
         if not access_token:
             raise HttpError(400, "액세스 토큰을 받지 못했습니다")
 
-        user_info_url = "https://openapi.naver.com/v1/nid/me"
+        user_info_url = OAuthHttpClient.endpoint("naver", "userinfo_url")
         headers = {
             "Authorization": f"Bearer {access_token}",
         }
 
-        user_info_resp = requests.get(user_info_url, headers=headers)
+        user_info_resp = OAuthHttpClient.get("naver", user_info_url, headers=headers)
         if user_info_resp.status_code != 200:
             raise HttpError(400, "네이버에서 사용자 정보를 가져오는데 실패했습니다")
 
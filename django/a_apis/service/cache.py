@@ -0,0 +1,43 @@
+import logging
+from typing import Optional
+
+from django.conf import settings
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+
+# 매물 상세 조회 캐시 (사용자와 무관한 부분만 저장, 찜 여부는 요청 시 합침)
+class ProductDetailCache:
+    KEY_PREFIX = "product:detail"
+
+    @staticmethod
+    def key(product_id: int) -> str:
+        return f"{ProductDetailCache.KEY_PREFIX}:{product_id}"
+
+    @staticmethod
+    def get(product_id: int) -> Optional[dict]:
+        try:
+            return cache.get(ProductDetailCache.key(product_id))
+        except Exception as e:
+            # 캐시 장애 시에도 DB 조회로 응답할 수 있도록 무시
+            logger.warning(f"Product detail cache get failed: {e}")
+            return None
+
+    @staticmethod
+    def set(product_id: int, data: dict):
+        try:
+            cache.set(
+                ProductDetailCache.key(product_id),
+                data,
+                timeout=getattr(settings, "PRODUCT_DETAIL_CACHE_TIMEOUT", 300),
+            )
+        except Exception as e:
+            logger.warning(f"Product detail cache set failed: {e}")
+
+    @staticmethod
+    def invalidate(product_id: int):
+        try:
+            cache.delete(ProductDetailCache.key(product_id))
+        except Exception as e:
+            logger.warning(f"Product detail cache delete failed: {e}")
@@ -1,16 +1,66 @@
-from a_apis.models.chat import ChatRoom
+from a_apis.auth.user_cache import resolve_request_user
+from a_apis.models.chat import ChatMessage, ChatRoom
 from a_apis.models.products import ProductDetail
 from a_apis.schema.chat import ChatRoomResponse, CreateChatRoomRequest
 from ninja.responses import Response
-from rest_framework_simplejwt.tokens import AccessToken
 
 from django.contrib.auth import get_user_model
-from django.db.models import Q
+from django.db.models import Case, Count, F, OuterRef, Q, Subquery, Sum, Value, When
+from django.db.models.functions import Coalesce
 
 User = get_user_model()
 
 
 class ChatService:
+    @staticmethod
+    def unread_rooms_queryset(user):
+        """
+        유저의 채팅방에 안 읽은 메시지 수(unread_count)를 붙인 쿼리셋
+        내 읽음 커서(마지막으로 읽은 메시지 ID) 이후의 상대방 메시지만
+        (chat_room_id, id) 인덱스 범위로 셈
+        """
+        unread_count = (
+            ChatMessage.objects.filter(
+                chat_room=OuterRef("pk"), id__gt=OuterRef("my_last_read_id")
+            )
+            .exclude(sender=user)
+            .values("chat_room")
+            .annotate(count=Count("id"))
+            .values("count")
+        )
+
+        return (
+            ChatRoom.objects.filter(Q(item__user=user) | Q(buyer=user))
+            .annotate(
+                my_last_read_id=Case(
+                    When(buyer=user, then=F("buyer_last_read_id")),
+                    default=F("seller_last_read_id"),
+                ),
+            )
+            .annotate(unread_count=Coalesce(Subquery(unread_count), Value(0)))
+        )
+
+    @staticmethod
+    def chat_rooms_queryset(user):
+        """
+        유저의 채팅방 목록을 한 번의 쿼리로 조회
+        매물/주소/판매자/구매자는 JOIN으로, 마지막 메시지와 안 읽은 메시지 수는 서브쿼리로 함께 조회
+        최근 대화가 있는 채팅방부터 정렬
+        """
+        last_message = ChatMessage.objects.filter(chat_room=OuterRef("pk")).order_by(
+            "-id"
+        )
+
+        return (
+            ChatService.unread_rooms_queryset(user)
+            .select_related("item__address", "item__user", "buyer")
+            .annotate(
+                last_message=Subquery(last_message.values("message")[:1]),
+                last_message_at=Subquery(last_message.values("created_at")[:1]),
+            )
+            .order_by(F("last_message_at").desc(nulls_last=True), "-created_at")
+        )
+
     @staticmethod
     def get_chat_rooms(request) -> Response:
         try:
@@ -24,10 +74,8 @@ class ChatService:
                     },
                 )
 
-            access_token = AccessToken(user)
-            user_id = access_token["user_id"]
-            user = User.objects.get(id=user_id)
-            chat_rooms = ChatRoom.objects.filter(Q(item__user=user) | Q(buyer=user))
+            user = resolve_request_user(request)
+            chat_rooms = list(ChatService.chat_rooms_queryset(user))
             if not chat_rooms:
                 return Response(
                     status=400,
@@ -51,6 +99,9 @@ class ChatService:
                             "product_address": room.item.address.add_new,
                             "seller": room.item.user.username,
                             "buyer": room.buyer.username,
+                            "last_message": room.last_message,
+                            "last_message_at": room.last_message_at,
+                            "unread_count": room.unread_count,
                         }
                         for room in chat_rooms
                     ],
@@ -63,6 +114,38 @@ class ChatService:
                 data={"success": False, "message": str(e)},
             )
 
+    @staticmethod
+    def get_unread_count(request) -> Response:
+        try:
+            user = request.auth
+            if not user:
+                return Response(
+                    status=400,
+                    data={
+                        "success": False,
+                        "message": "인증되지 않은 사용자입니다.",
+                    },
+                )
+
+            user = resolve_request_user(request)
+            unread_count = ChatService.unread_rooms_queryset(user).aggregate(
+                total=Coalesce(Sum("unread_count"), Value(0))
+            )["total"]
+
+            return Response(
+                status=200,
+                data={
+                    "success": True,
+                    "message": "안 읽은 메시지 수를 조회했습니다.",
+                    "unread_count": unread_count,
+                },
+            )
+        except Exception as e:
+            return Response(
+                status=500,
+                data={"success": False, "message": str(e)},
+            )
+
     @staticmethod
     def create_chat_room(request, data: CreateChatRoomRequest) -> Response:
         try:
@@ -76,9 +159,7 @@ class ChatService:
                     },
                 )
 
-            access_token = AccessToken(user)
-            user_id = access_token["user_id"]
-            user = User.objects.get(id=user_id)
+            user = resolve_request_user(request)
 
             product = ProductDetail.objects.filter(id=data.product_id).first()
             if not product:
@@ -1,8 +1,10 @@
 import json
 
+import orjson
 from ninja.errors import HttpError
 from ninja.parser import Parser
 
+from django.conf import settings
 from django.http import HttpRequest
 
 
@@ -16,11 +18,28 @@ class CommonParser(Parser):
             d[k] = v
         return d
 
+    @staticmethod
+    def loads(body: bytes):
+        """
+        orjson으로 먼저 파싱하고, 중복 키가 있을 수 있을 때만 엄격한 파서로 다시 파싱
+        orjson은 중복 키를 마지막 값으로 덮어쓰므로, 중복 키가 있으면 파싱 결과를 다시
+        직렬화했을 때 버려진 키의 ':'만큼 원본보다 ':'가 적어짐 (직렬화/개수 세기 모두 C 레벨)
+        ':'를 \\u003a로 이스케이프한 본문은 개수를 맞출 수 없으므로 기존 방식으로 검사
+        """
+        data = orjson.loads(body)
+        if b"\\u003" not in body and body.count(b":") == orjson.dumps(data).count(b":"):
+            return data
+        return json.loads(
+            body, object_pairs_hook=CommonParser.no_duplicates_object_pairs_hook
+        )
+
     def parse_body(self, request: HttpRequest):
+        body = request.body
+        max_size = getattr(settings, "API_JSON_MAX_BODY_SIZE", 1024 * 1024)
+        if len(body) > max_size:
+            raise HttpError(413, "요청 본문이 너무 큽니다.")
+
         try:
-            return json.loads(
-                request.body,
-                object_pairs_hook=CommonParser.no_duplicates_object_pairs_hook,
-            )
+            return CommonParser.loads(body)
         except ValueError as e:
             raise HttpError(400, str(e))
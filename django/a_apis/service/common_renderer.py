@@ -0,0 +1,44 @@
+from decimal import Decimal
+from typing import Any
+
+import orjson
+from ninja.renderers import BaseRenderer
+from ninja.responses import NinjaJSONEncoder
+
+from django.http import HttpRequest
+
+# orjson이 직접 처리하지 못하는 타입(pydantic 모델, Enum 등)은 기존 인코더로 처리
+_fallback_encoder = NinjaJSONEncoder()
+
+
+def default(obj: Any) -> Any:
+    if isinstance(obj, Decimal):
+        # 기존 응답(DjangoJSONEncoder)과 같이 문자열로 직렬화
+        return str(obj)
+    # datetime/date/time도 기존 인코더 형식 유지 (밀리초까지, UTC는 "Z")
+    return _fallback_encoder.default(obj)
+
+
+def dumps(data: Any) -> bytes:
+    """
+    orjson 기반 JSON 직렬화
+    UUID 등은 orjson이 C 레벨에서 직접 처리하고,
+    datetime은 API 응답 형식이 바뀌지 않도록 default(DjangoJSONEncoder)로 넘김
+    """
+    return orjson.dumps(
+        data,
+        default=default,
+        option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME,
+    )
+
+
+def dumps_str(data: Any) -> str:
+    # 웹소켓 text 프레임용
+    return dumps(data).decode()
+
+
+class CommonRenderer(BaseRenderer):
+    media_type = "application/json"
+
+    def render(self, request: HttpRequest, data: Any, *, response_status: int) -> Any:
+        return dumps(data)
@@ -1,11 +1,16 @@
-from a_apis.CRUD.userCRUD import UserCRUD
-from a_apis.models.email_verification import EmailVerification
+import math
+
+from a_apis.service.email_outbox import EmailOutboxService
+from a_apis.service.email_verification import (
+    EXPIRED,
+    INVALID,
+    code_ttl,
+    get_verification_store,
+)
 from a_user.models import User
 from ninja.responses import Response
 
-from django.conf import settings
 from django.core.exceptions import ValidationError
-from django.core.mail import send_mail
 from django.core.validators import validate_email
 
 
@@ -26,11 +31,10 @@ class EmailService:
                     },
                 )
 
-            # 기존 미인증 코드 삭제
-            EmailVerification.objects.filter(email=email, is_verified=False).delete()
-
-            # 새로운 인증 코드 생성
-            verification = EmailVerification.objects.create(email=email)
+            # 기존 미인증 코드를 지우고 새로운 인증 코드 생성
+            verification_code = get_verification_store().issue(email)
+            # 안내 문구의 유효 시간 (EMAIL_VERIFICATION_CODE_TTL, 분 단위 올림)
+            ttl_minutes = math.ceil(code_ttl() / 60)
 
             # 이메일 내용 구성
             subject = "이메일 인증번호 안내"
@@ -39,9 +43,9 @@ class EmailService:
                 
                 회원가입을 위한 인증번호는 다음과 같습니다:
                 
-                인증번호: {verification.verification_code}
+                인증번호: {verification_code}
                 
-                이 인증번호는 30분 동안 유효합니다.
+                이 인증번호는 {ttl_minutes}분 동안 유효합니다.
             """
             html_message = f"""
                 <html>
@@ -50,21 +54,19 @@ class EmailService:
                         <p>안녕하세요.</p>
                         <p>회원가입을 위한 인증번호는 다음과 같습니다:</p>
                         <h3 style="color: #4A90E2; font-size: 24px; letter-spacing: 3px;">
-                            {verification.verification_code}
+                            {verification_code}
                         </h3>
-                        <p>이 인증번호는 30분 동안 유효합니다.</p>
+                        <p>이 인증번호는 {ttl_minutes}분 동안 유효합니다.</p>
                     </body>
                 </html>
             """
 
-            # 이메일 전송
-            send_mail(
+            # 발송 대기열에 저장 (SMTP 발송은 커밋 이후 워커가 처리)
+            EmailOutboxService.enqueue(
+                to_email=email,
                 subject=subject,
-                message=message,
-                from_email=settings.EMAIL_HOST_USER,
-                recipient_list=[email],
-                html_message=html_message,
-                fail_silently=True,
+                body=message,
+                html_body=html_message,
             )
 
             return {
@@ -91,17 +93,20 @@ class EmailService:
 
     @staticmethod
     def verify_email(email: str, code: str) -> tuple[int, dict]:
-        verification = UserCRUD.email_verification(email, code)
+        result = get_verification_store().verify(email, code)
+
+        if result == INVALID:
+            return 500, {
+                "success": False,
+                "message": "유효하지 않은 인증번호입니다.",
+            }
 
-        if verification.is_expired:
+        if result == EXPIRED:
             return 400, {
                 "success": False,
                 "message": "인증번호가 만료되었습니다. 다시 시도해주세요.",
             }
 
-        verification.is_verified = True
-        verification.save()
-
         return 200, {
             "success": True,
             "message": "이메일 인증이 완료되었습니다.",
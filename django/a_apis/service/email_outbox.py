@@ -0,0 +1,298 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from logging import getLogger
+
+from a_apis.models.email_outbox import EmailOutbox
+
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.db import connections, transaction
+from django.db.models import Count, F, Min
+from django.utils import timezone
+
+logger = getLogger(__name__)
+
+
+# 이메일 발송 대기열 서비스
+# 요청에서는 대기열에 저장만 하고, 워커가 SMTP 연결 하나로 모아서 발송
+class EmailOutboxService:
+    _executor = None
+    _executor_lock = threading.Lock()
+    _drain_scheduled = False
+    # backoff/lease 중인 이메일의 다음 발송 예약
+    _retry_timer = None
+    _retry_at = 0.0
+
+    # 프로세스 단위 발송 통계
+    _stats_lock = threading.Lock()
+    _stats = {
+        "batches": 0,
+        "sent": 0,
+        "retried": 0,
+        "failed": 0,
+        "last_batch_size": 0,
+        "last_batch_ms": 0.0,
+        "last_error": "",
+    }
+
+    @staticmethod
+    def enqueue(
+        to_email: str, subject: str, body: str, html_body: str = ""
+    ) -> EmailOutbox:
+        """
+        이메일을 대기열에 저장
+        EMAIL_OUTBOX_DRAIN_ON_COMMIT이면 커밋 이후 백그라운드 스레드에서 바로 발송
+        """
+        message = EmailOutbox.objects.create(
+            to_email=to_email, subject=subject, body=body, html_body=html_body
+        )
+        if getattr(settings, "EMAIL_OUTBOX_DRAIN_ON_COMMIT", True):
+            transaction.on_commit(EmailOutboxService.schedule_drain)
+        return message
+
+    @staticmethod
+    def _get_executor() -> ThreadPoolExecutor:
+        with EmailOutboxService._executor_lock:
+            if EmailOutboxService._executor is None:
+                # 발송은 한 스레드에서 순서대로 (SMTP 연결을 배치 단위로 재사용)
+                EmailOutboxService._executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="email-outbox"
+                )
+            return EmailOutboxService._executor
+
+    @staticmethod
+    def schedule_drain():
+        # 이미 예약된 발송이 있으면 그 배치에 함께 발송되므로 다시 예약하지 않음
+        with EmailOutboxService._executor_lock:
+            if EmailOutboxService._drain_scheduled:
+                return
+            EmailOutboxService._drain_scheduled = True
+        EmailOutboxService._get_executor().submit(EmailOutboxService._run_drain)
+
+    @staticmethod
+    def _run_drain():
+        with EmailOutboxService._executor_lock:
+            EmailOutboxService._drain_scheduled = False
+        try:
+            while EmailOutboxService.drain()["claimed"]:
+                pass
+            EmailOutboxService.schedule_retry()
+        except Exception as e:
+            logger.error(f"Email outbox drain failed: {e}")
+        finally:
+            # 백그라운드 스레드에서 연 DB 연결 정리
+            connections.close_all()
+
+    @staticmethod
+    def schedule_retry():
+        """
+        발송 대기 중인 이메일(backoff 중이거나 다른 워커가 가져간 이메일)이 남아 있으면
+        가장 빠른 다음 시도 시간에 다시 발송하도록 예약
+        새 이메일이 들어오지 않는 한가한 시간에도 재시도/만료된 lease가 처리되도록 함
+        다른 워커가 잠근 이메일을 계속 확인하지 않도록 최소 EMAIL_OUTBOX_POLL_INTERVAL만큼 기다림
+        """
+        next_attempt_at = EmailOutbox.objects.filter(
+            status=EmailOutbox.STATUS_PENDING
+        ).aggregate(next=Min("next_attempt_at"))["next"]
+        if next_attempt_at is None:
+            return
+
+        delay = max(
+            (next_attempt_at - timezone.now()).total_seconds(),
+            getattr(settings, "EMAIL_OUTBOX_POLL_INTERVAL", 5),
+        )
+        run_at = time.monotonic() + delay
+        with EmailOutboxService._executor_lock:
+            timer = EmailOutboxService._retry_timer
+            # 더 빠르거나 거의 같은(1초 이내) 예약이 있으면 그대로 사용
+            if timer is not None and timer.is_alive():
+                if EmailOutboxService._retry_at <= run_at + 1:
+                    return
+                timer.cancel()
+            timer = threading.Timer(delay, EmailOutboxService.schedule_drain)
+            timer.daemon = True
+            EmailOutboxService._retry_timer = timer
+            EmailOutboxService._retry_at = run_at
+        timer.start()
+
+    @staticmethod
+    def claim(batch_size: int) -> list[EmailOutbox]:
+        """
+        발송할 이메일을 가져가고 처리 시간(EMAIL_OUTBOX_LEASE_SECONDS)만큼 다음 시도를 미뤄둠
+        여러 워커가 동시에 실행해도 같은 이메일을 가져가지 않고 (SKIP LOCKED),
+        발송 중 워커가 종료되면 미뤄둔 시간이 지난 뒤 다시 발송 대상이 됨
+        """
+        now = timezone.now()
+        with transaction.atomic():
+            messages = list(
+                EmailOutbox.objects.select_for_update(skip_locked=True)
+                .filter(status=EmailOutbox.STATUS_PENDING, next_attempt_at__lte=now)
+                .order_by("next_attempt_at", "id")[:batch_size]
+            )
+            if messages:
+                lease = getattr(settings, "EMAIL_OUTBOX_LEASE_SECONDS", 300)
+                EmailOutbox.objects.filter(id__in=[m.id for m in messages]).update(
+                    next_attempt_at=now + timedelta(seconds=lease)
+                )
+        return messages
+
+    @staticmethod
+    def build_message(message: EmailOutbox, connection) -> EmailMultiAlternatives:
+        email = EmailMultiAlternatives(
+            subject=message.subject,
+            body=message.body,
+            from_email=settings.EMAIL_HOST_USER,
+            to=[message.to_email],
+            connection=connection,
+        )
+        if message.html_body:
+            email.attach_alternative(message.html_body, "text/html")
+        return email
+
+    @staticmethod
+    def mark_failed(message: EmailOutbox, error: Exception) -> bool:
+        """
+        실패 기록 후 backoff(EMAIL_OUTBOX_RETRY_BACKOFF * 2^(시도 횟수 - 1))만큼 재시도를 미룸
+        최대 시도 횟수를 넘으면 실패 처리하고 False 반환
+        """
+        attempts = message.attempts + 1
+        max_attempts = getattr(settings, "EMAIL_OUTBOX_MAX_ATTEMPTS", 5)
+        backoff = getattr(settings, "EMAIL_OUTBOX_RETRY_BACKOFF", 30) * 2 ** (
+            attempts - 1
+        )
+        retry = attempts < max_attempts
+        EmailOutbox.objects.filter(id=message.id).update(
+            attempts=attempts,
+            last_error=str(error)[:1000],
+            status=EmailOutbox.STATUS_PENDING if retry else EmailOutbox.STATUS_FAILED,
+            next_attempt_at=timezone.now() + timedelta(seconds=backoff),
+        )
+        return retry
+
+    @staticmethod
+    def drain(batch_size: int = None) -> dict:
+        """
+        발송 대상 이메일을 한 배치 가져와 SMTP 연결 하나로 발송
+        반환값: 가져온 수(claimed), 발송(sent), 재시도 예정(retried), 최종 실패(failed)
+        """
+        batch_size = batch_size or getattr(settings, "EMAIL_OUTBOX_BATCH_SIZE", 50)
+        result = {"claimed": 0, "sent": 0, "retried": 0, "failed": 0}
+
+        messages = EmailOutboxService.claim(batch_size)
+        if not messages:
+            return result
+        result["claimed"] = len(messages)
+
+        started = time.monotonic()
+        sent_ids = []
+        last_error = ""
+        connection = get_connection(fail_silently=False)
+        try:
+            connection.open()
+        except Exception as e:
+            # 연결 자체가 실패하면 배치 전체를 재시도
+            logger.error(f"Email outbox SMTP connection failed: {e}")
+            last_error = str(e)
+            for message in messages:
+                if EmailOutboxService.mark_failed(message, e):
+                    result["retried"] += 1
+                else:
+                    result["failed"] += 1
+        else:
+            try:
+                for message in messages:
+                    try:
+                        EmailOutboxService.build_message(message, connection).send()
+                        sent_ids.append(message.id)
+                    except Exception as e:
+                        logger.warning(
+                            f"Email outbox send failed ({message.to_email}): {e}"
+                        )
+                        last_error = str(e)
+                        if EmailOutboxService.mark_failed(message, e):
+                            result["retried"] += 1
+                        else:
+                            result["failed"] += 1
+            finally:
+                connection.close()
+
+        if sent_ids:
+            EmailOutbox.objects.filter(id__in=sent_ids).update(
+                status=EmailOutbox.STATUS_SENT,
+                attempts=F("attempts") + 1,
+                sent_at=timezone.now(),
+                last_error="",
+            )
+        result["sent"] = len(sent_ids)
+
+        with EmailOutboxService._stats_lock:
+            stats = EmailOutboxService._stats
+            stats["batches"] += 1
+            stats["sent"] += result["sent"]
+            stats["retried"] += result["retried"]
+            stats["failed"] += result["failed"]
+            stats["last_batch_size"] = result["claimed"]
+            stats["last_batch_ms"] = round((time.monotonic() - started) * 1000, 2)
+            if last_error:
+                stats["last_error"] = last_error
+        return result
+
+    @staticmethod
+    def prune(batch_size: int = 1000) -> dict:
+        """
+        보관 기간이 지난 발송 완료/실패 이메일 삭제
+        발송 완료는 EMAIL_OUTBOX_SENT_RETENTION_DAYS, 실패는 EMAIL_OUTBOX_FAILED_RETENTION_DAYS
+        긴 잠금을 피하기 위해 batch_size 단위로 나누어 삭제
+        """
+        now = timezone.now()
+        retention = {
+            EmailOutbox.STATUS_SENT: getattr(
+                settings, "EMAIL_OUTBOX_SENT_RETENTION_DAYS", 7
+            ),
+            EmailOutbox.STATUS_FAILED: getattr(
+                settings, "EMAIL_OUTBOX_FAILED_RETENTION_DAYS", 30
+            ),
+        }
+
+        result = {}
+        for status, days in retention.items():
+            queryset = EmailOutbox.objects.filter(
+                status=status, created_at__lt=now - timedelta(days=days)
+            )
+            deleted = 0
+            while True:
+                ids = list(queryset.values_list("id", flat=True)[:batch_size])
+                if not ids:
+                    break
+                deleted += EmailOutbox.objects.filter(id__in=ids).delete()[0]
+            result[status] = deleted
+        return result
+
+    @staticmethod
+    def get_stats() -> dict:
+        """
+        발송 통계 - 대기열 상태별 건수와 가장 오래된 대기 이메일의 대기 시간(초),
+        현재 프로세스의 발송 결과
+        """
+        queue = {
+            row["status"]: row["count"]
+            for row in EmailOutbox.objects.values("status").annotate(count=Count("id"))
+        }
+        oldest = EmailOutbox.objects.filter(
+            status=EmailOutbox.STATUS_PENDING
+        ).aggregate(oldest=Min("created_at"))["oldest"]
+
+        with EmailOutboxService._stats_lock:
+            process = dict(EmailOutboxService._stats)
+
+        return {
+            "pending": queue.get(EmailOutbox.STATUS_PENDING, 0),
+            "sent": queue.get(EmailOutbox.STATUS_SENT, 0),
+            "failed": queue.get(EmailOutbox.STATUS_FAILED, 0),
+            "oldest_pending_seconds": (
+                round((timezone.now() - oldest).total_seconds(), 1) if oldest else 0
+            ),
+            "process": process,
+        }
@@ -0,0 +1,162 @@
+from datetime import timedelta
+
+from a_apis.CRUD.userCRUD import UserCRUD
+from a_apis.models.email_verification import (
+    EmailVerification,
+    generate_verification_code,
+)
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+
+# verify 결과
+VERIFIED = "verified"
+EXPIRED = "expired"
+INVALID = "invalid"
+
+
+def code_ttl() -> int:
+    return getattr(settings, "EMAIL_VERIFICATION_CODE_TTL", 60 * 30)
+
+
+def verified_ttl() -> int:
+    return getattr(settings, "EMAIL_VERIFICATION_VERIFIED_TTL", 60 * 60 * 24)
+
+
+# 이메일 인증 저장소 (DB) - 만료된 인증은 email-worker(drain_email_outbox --loop)가 주기적으로 정리
+class DatabaseVerificationStore:
+    @staticmethod
+    def issue(email: str) -> str:
+        """기존 미인증 코드를 지우고 새 인증번호를 발급"""
+        EmailVerification.objects.filter(email=email, is_verified=False).delete()
+        return EmailVerification.objects.create(email=email).verification_code
+
+    @staticmethod
+    def verify(email: str, code: str) -> str:
+        try:
+            verification = UserCRUD.email_verification(email, code)
+        except EmailVerification.DoesNotExist:
+            return INVALID
+
+        if verification.is_expired:
+            return EXPIRED
+
+        verification.is_verified = True
+        verification.save(update_fields=["is_verified", "updated_at"])
+        return VERIFIED
+
+    @staticmethod
+    def mark_verified(email: str):
+        """소셜 로그인처럼 이메일이 이미 확인된 경우 바로 인증 처리"""
+        EmailVerification.objects.filter(email=email, is_verified=False).delete()
+        EmailVerification.objects.create(email=email, is_verified=True)
+
+    @staticmethod
+    def is_verified(email: str) -> bool:
+        return EmailVerification.objects.filter(email=email, is_verified=True).exists()
+
+    @staticmethod
+    def clear(email: str):
+        EmailVerification.objects.filter(email=email).delete()
+
+
+# 이메일 인증 저장소 (캐시/Redis) - TTL로 자동 만료되어 테이블이 쌓이지 않음
+# 인증번호는 만료 안내를 위해 EMAIL_VERIFICATION_CODE_TTL보다 조금 더 보관
+class CacheVerificationStore:
+    KEY_PREFIX = "email_verification"
+    EXPIRED_GRACE = 60 * 10
+
+    @staticmethod
+    def code_key(email: str) -> str:
+        return f"{CacheVerificationStore.KEY_PREFIX}:code:{email}"
+
+    @staticmethod
+    def verified_key(email: str) -> str:
+        return f"{CacheVerificationStore.KEY_PREFIX}:verified:{email}"
+
+    @staticmethod
+    def issue(email: str) -> str:
+        code = generate_verification_code()
+        cache.set(
+            CacheVerificationStore.code_key(email),
+            {
+                "code": code,
+                "expires_at": timezone.now() + timedelta(seconds=code_ttl()),
+            },
+            timeout=code_ttl() + CacheVerificationStore.EXPIRED_GRACE,
+        )
+        return code
+
+    @staticmethod
+    def verify(email: str, code: str) -> str:
+        stored = cache.get(CacheVerificationStore.code_key(email))
+        if not stored or stored["code"] != code:
+            return INVALID
+
+        if timezone.now() > stored["expires_at"]:
+            return EXPIRED
+
+        CacheVerificationStore.mark_verified(email)
+        return VERIFIED
+
+    @staticmethod
+    def mark_verified(email: str):
+        cache.set(
+            CacheVerificationStore.verified_key(email), True, timeout=verified_ttl()
+        )
+        cache.delete(CacheVerificationStore.code_key(email))
+
+    @staticmethod
+    def is_verified(email: str) -> bool:
+        return cache.get(CacheVerificationStore.verified_key(email)) is not None
+
+    @staticmethod
+    def clear(email: str):
+        cache.delete_many(
+            [
+                CacheVerificationStore.code_key(email),
+                CacheVerificationStore.verified_key(email),
+            ]
+        )
+
+
+VERIFICATION_STORES = {
+    "database": DatabaseVerificationStore,
+    "cache": CacheVerificationStore,
+}
+
+
+def get_verification_store():
+    """EMAIL_VERIFICATION_STORE 설정에 따른 이메일 인증 저장소"""
+    return VERIFICATION_STORES[
+        getattr(settings, "EMAIL_VERIFICATION_STORE", "database")
+    ]
+
+
+def prune_expired_verifications(batch_size: int = 1000) -> dict:
+    """
+    DB 저장소의 만료된 인증 정리
+    미인증은 인증번호 만료 시점, 인증 완료는 만료 후 EMAIL_VERIFICATION_VERIFIED_TTL이 지나면 삭제
+    긴 잠금을 피하기 위해 batch_size 단위로 나누어 삭제
+    """
+    now = timezone.now()
+    targets = {
+        "unverified": EmailVerification.objects.filter(
+            is_verified=False, expires_at__lt=now
+        ),
+        "verified": EmailVerification.objects.filter(
+            is_verified=True, expires_at__lt=now - timedelta(seconds=verified_ttl())
+        ),
+    }
+
+    result = {}
+    for name, queryset in targets.items():
+        deleted = 0
+        while True:
+            ids = list(queryset.values_list("id", flat=True)[:batch_size])
+            if not ids:
+                break
+            deleted += EmailVerification.objects.filter(id__in=ids).delete()[0]
+        result[name] = deleted
+    return result
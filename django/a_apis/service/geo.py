@@ -0,0 +1,172 @@
+from math import cos, radians
+
+from django.db.models import Q
+
+GEOHASH_BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+GEOHASH_PRECISION = 12
+
+
+# 지도 좌표 <-> geohash 셀 변환 서비스
+class GeoService:
+    @staticmethod
+    def encode_geohash(
+        latitude: float, longitude: float, precision: int = GEOHASH_PRECISION
+    ) -> str:
+        lat_min, lat_max = -90.0, 90.0
+        lon_min, lon_max = -180.0, 180.0
+        geohash = []
+        bits = 0
+        bit_count = 0
+        is_lon = True  # geohash는 경도 비트부터 번갈아 채운다
+
+        while len(geohash) < precision:
+            if is_lon:
+                mid = (lon_min + lon_max) / 2
+                if longitude >= mid:
+                    bits = (bits << 1) | 1
+                    lon_min = mid
+                else:
+                    bits <<= 1
+                    lon_max = mid
+            else:
+                mid = (lat_min + lat_max) / 2
+                if latitude >= mid:
+                    bits = (bits << 1) | 1
+                    lat_min = mid
+                else:
+                    bits <<= 1
+                    lat_max = mid
+            is_lon = not is_lon
+            bit_count += 1
+
+            if bit_count == 5:
+                geohash.append(GEOHASH_BASE32[bits])
+                bits = 0
+                bit_count = 0
+
+        return "".join(geohash)
+
+    @staticmethod
+    def cell_size(precision: int) -> tuple[float, float]:
+        """precision 자리 geohash 셀 하나의 (위도, 경도) 크기(도 단위)"""
+        total_bits = precision * 5
+        lon_bits = (total_bits + 1) // 2
+        lat_bits = total_bits // 2
+        return 180.0 / (2**lat_bits), 360.0 / (2**lon_bits)
+
+    @staticmethod
+    def next_prefix(prefix: str) -> str:
+        """정렬 순서상 prefix 셀 바로 다음 셀 (범위 조회의 상한값)"""
+        chars = list(prefix)
+        while chars:
+            index = GEOHASH_BASE32.index(chars[-1])
+            if index < len(GEOHASH_BASE32) - 1:
+                chars[-1] = GEOHASH_BASE32[index + 1]
+                return "".join(chars)
+            chars.pop()
+        return ""  # 마지막 셀 이후로는 상한이 없음
+
+    @staticmethod
+    def bounding_box(
+        latitude: float, longitude: float, distance_km: float
+    ) -> tuple[float, float, float, float]:
+        """중심점과 반경(km)으로 (min_lat, min_lon, max_lat, max_lon) 계산 (근사값)"""
+        lat_range = distance_km / 111.0
+        lon_range = distance_km / (111.0 * max(cos(radians(latitude)), 0.01))
+        return (
+            max(latitude - lat_range, -90.0),
+            max(longitude - lon_range, -180.0),
+            min(latitude + lat_range, 90.0),
+            min(longitude + lon_range, 180.0),
+        )
+
+    @staticmethod
+    def covering_precision(
+        min_lat: float,
+        min_lon: float,
+        max_lat: float,
+        max_lon: float,
+        max_cells: int = 32,
+    ) -> int:
+        """bbox를 max_cells 개 이하의 셀로 덮을 수 있는 가장 세밀한 precision"""
+        precision = 1
+        for candidate in range(1, GEOHASH_PRECISION + 1):
+            cell_lat, cell_lon = GeoService.cell_size(candidate)
+            rows = int((max_lat - min_lat) / cell_lat) + 2
+            cols = int((max_lon - min_lon) / cell_lon) + 2
+            if rows * cols > max_cells:
+                break
+            precision = candidate
+        return precision
+
+    @staticmethod
+    def covering_cells(
+        min_lat: float,
+        min_lon: float,
+        max_lat: float,
+        max_lon: float,
+        precision: int,
+    ) -> list[str]:
+        """bbox와 겹치는 precision 자리 geohash 셀 목록 (정렬됨)"""
+        cell_lat, cell_lon = GeoService.cell_size(precision)
+        cells = set()
+
+        lat = min_lat
+        while True:
+            lon = min_lon
+            while True:
+                cells.add(GeoService.encode_geohash(lat, lon, precision))
+                if lon >= max_lon:
+                    break
+                lon = min(lon + cell_lon, max_lon)
+            if lat >= max_lat:
+                break
+            lat = min(lat + cell_lat, max_lat)
+
+        return sorted(cells)
+
+    @staticmethod
+    def covering_ranges(
+        min_lat: float,
+        min_lon: float,
+        max_lat: float,
+        max_lon: float,
+        max_cells: int = 32,
+    ) -> list[tuple[str, str]]:
+        """
+        bbox를 덮는 geohash 셀들을 인접한 것끼리 합쳐 [하한, 상한) 범위 목록으로 반환
+        geohash 인덱스에 대한 소수의 range scan으로 조회할 수 있다.
+        """
+        precision = GeoService.covering_precision(
+            min_lat, min_lon, max_lat, max_lon, max_cells
+        )
+        ranges: list[tuple[str, str]] = []
+        for cell in GeoService.covering_cells(
+            min_lat, min_lon, max_lat, max_lon, precision
+        ):
+            upper = GeoService.next_prefix(cell)
+            if ranges and ranges[-1][1] == cell:
+                ranges[-1] = (ranges[-1][0], upper)
+            else:
+                ranges.append((cell, upper))
+        return ranges
+
+    @staticmethod
+    def bbox_q(
+        min_lat: float,
+        min_lon: float,
+        max_lat: float,
+        max_lon: float,
+        field: str = "geohash",
+        max_cells: int = 32,
+    ) -> Q:
+        """bbox를 geohash 인덱스 범위 조건(Q)으로 변환"""
+        query = Q()
+        for lower, upper in GeoService.covering_ranges(
+            min_lat, min_lon, max_lat, max_lon, max_cells
+        ):
+            condition = Q(**{f"{field}__gte": lower})
+            if upper:
+                condition &= Q(**{f"{field}__lt": upper})
+            query |= condition
+        return query
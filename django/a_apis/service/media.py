@@ -0,0 +1,209 @@
+import logging
+import os
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from typing import Optional
+
+from a_apis.models.products import ProductDetail, ProductImg
+from a_apis.service.cache import ProductDetailCache
+from PIL import Image, ImageOps
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import UploadedFile
+from django.db import connections, transaction
+
+logger = logging.getLogger(__name__)
+
+PRODUCT_IMAGE_DIR = "products/images"
+PRODUCT_VIDEO_DIR = "products/videos"
+PRODUCT_THUMBNAIL_DIR = "products/thumbnails"
+PRODUCT_WEB_IMAGE_DIR = "products/web"
+
+
+# 매물 이미지/동영상 스토리지(S3) 업로드 서비스
+class MediaUploadService:
+    @staticmethod
+    def build_path(directory: str, file: UploadedFile) -> str:
+        # uuid를 사용하여 고유한 파일명 생성
+        file_extension = file.name.split(".")[-1]
+        return f"{directory}/{str(uuid.uuid4())[:8]}.{file_extension}"
+
+    @staticmethod
+    def upload_files(files: list[tuple[str, UploadedFile]]) -> list[str]:
+        """
+        (저장 경로, 파일) 목록을 제한된 스레드 풀로 동시에 업로드하고
+        입력 순서대로 실제 저장된 경로를 반환
+        하나라도 실패하면 이미 올라간 파일을 모두 삭제한 뒤 예외를 다시 발생
+        """
+        if not files:
+            return []
+
+        max_workers = min(len(files), getattr(settings, "MEDIA_UPLOAD_MAX_WORKERS", 4))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(default_storage.save, path, file)
+                for path, file in files
+            ]
+
+        saved_paths = []
+        error = None
+        for future in futures:
+            try:
+                saved_paths.append(future.result())
+            except Exception as e:
+                logger.error(f"Media upload failed: {e}")
+                error = error or e
+
+        if error:
+            MediaUploadService.delete_files(saved_paths)
+            raise error
+        return saved_paths
+
+    @staticmethod
+    def upload_product_media(
+        images: list[UploadedFile], video: Optional[UploadedFile]
+    ) -> tuple[list[str], Optional[str]]:
+        """매물 이미지와 동영상을 한 번에 동시 업로드 (이미지 경로 목록, 동영상 경로)"""
+        files = [
+            (MediaUploadService.build_path(PRODUCT_IMAGE_DIR, image), image)
+            for image in images
+        ]
+        if video:
+            files.append(
+                (MediaUploadService.build_path(PRODUCT_VIDEO_DIR, video), video)
+            )
+
+        saved_paths = MediaUploadService.upload_files(files)
+        if video:
+            return saved_paths[:-1], saved_paths[-1]
+        return saved_paths, None
+
+    @staticmethod
+    def delete_files(paths: list[str]):
+        """업로드된 파일 정리 (실패해도 원래 에러 처리를 방해하지 않도록 로그만 남김)"""
+        for path in paths:
+            try:
+                default_storage.delete(path)
+            except Exception as e:
+                logger.error(f"Media cleanup failed ({path}): {e}")
+
+
+# 이미지 파생본(썸네일/웹 최적화본) 생성 서비스
+# 요청 처리와 분리하기 위해 프로세스 단위 백그라운드 스레드 풀에서 실행
+class ImageDerivativeService:
+    _executor = None
+    _executor_lock = threading.Lock()
+
+    @staticmethod
+    def _get_executor() -> ThreadPoolExecutor:
+        with ImageDerivativeService._executor_lock:
+            if ImageDerivativeService._executor is None:
+                ImageDerivativeService._executor = ThreadPoolExecutor(
+                    max_workers=getattr(settings, "IMAGE_DERIVATIVE_MAX_WORKERS", 2),
+                    thread_name_prefix="image-derivative",
+                )
+            return ImageDerivativeService._executor
+
+    @staticmethod
+    def schedule(product_id: int, images: list[tuple[int, str]]):
+        """
+        트랜잭션 커밋 이후 (이미지 ID, 원본 저장 경로) 목록의 파생본 생성을 예약
+        요청 스레드는 이미지 처리를 기다리지 않음
+        """
+        if not images:
+            return
+        transaction.on_commit(
+            lambda: ImageDerivativeService._get_executor().submit(
+                ImageDerivativeService._run, product_id, images
+            )
+        )
+
+    @staticmethod
+    def render(source: Image.Image, size: tuple[int, int], crop: bool) -> bytes:
+        """JPEG 파생본 생성 (crop=True면 고정 크기로 잘라내고, 아니면 비율 유지 축소)"""
+        if crop:
+            image = ImageOps.fit(source, size, Image.Resampling.LANCZOS)
+        else:
+            image = source.copy()
+            image.thumbnail(size, Image.Resampling.LANCZOS)
+
+        buffer = BytesIO()
+        image.save(
+            buffer,
+            format="JPEG",
+            quality=getattr(settings, "IMAGE_DERIVATIVE_QUALITY", 80),
+            optimize=True,
+            progressive=True,
+        )
+        return buffer.getvalue()
+
+    @staticmethod
+    def generate_image(path: str) -> tuple[str, str]:
+        """원본 이미지 하나로 썸네일/웹 최적화본을 만들어 업로드하고 저장 경로를 반환"""
+        with default_storage.open(path, "rb") as f:
+            source = Image.open(f)
+            # 휴대폰 사진의 EXIF 회전 정보 반영 후 JPEG 저장을 위해 RGB로 변환
+            source = ImageOps.exif_transpose(source).convert("RGB")
+
+        name = os.path.splitext(os.path.basename(path))[0]
+        thumbnail = ImageDerivativeService.render(
+            source, getattr(settings, "PRODUCT_THUMBNAIL_SIZE", (320, 320)), crop=True
+        )
+        web = ImageDerivativeService.render(
+            source,
+            getattr(settings, "PRODUCT_WEB_IMAGE_SIZE", (1280, 1280)),
+            crop=False,
+        )
+        return MediaUploadService.upload_files(
+            [
+                (f"{PRODUCT_THUMBNAIL_DIR}/{name}.jpg", ContentFile(thumbnail)),
+                (f"{PRODUCT_WEB_IMAGE_DIR}/{name}.jpg", ContentFile(web)),
+            ]
+        )
+
+    @staticmethod
+    def generate(product_id: int, images: list[tuple[int, str]]):
+        """
+        매물 이미지 파생본 생성 후 ProductImg에 기록
+        첫 번째 이미지의 썸네일은 목록 조회용 대표 썸네일로 사용
+        실패한 이미지는 원본을 그대로 사용하도록 로그만 남김
+        """
+        for index, (image_id, path) in enumerate(images):
+            try:
+                thumbnail_path, web_path = ImageDerivativeService.generate_image(path)
+            except Exception as e:
+                logger.error(f"Image derivative failed ({path}): {e}")
+                continue
+
+            thumbnail_url = default_storage.url(thumbnail_path)
+            updated = ProductImg.objects.filter(id=image_id).update(
+                thumbnail_url=thumbnail_url,
+                web_url=default_storage.url(web_path),
+            )
+            if not updated:
+                # 처리 중 이미지가 교체/삭제된 경우 파생본 정리
+                MediaUploadService.delete_files([thumbnail_path, web_path])
+                continue
+
+            if index == 0:
+                # 그 사이 대표 이미지가 바뀌지 않은 경우에만 대표 썸네일 갱신
+                ProductDetail.objects.filter(
+                    id=product_id, cover_image=default_storage.url(path)
+                ).update(cover_thumbnail=thumbnail_url)
+
+        # 상세 조회 캐시가 웹 최적화본을 사용하도록 무효화
+        ProductDetailCache.invalidate(product_id)
+
+    @staticmethod
+    def _run(product_id: int, images: list[tuple[int, str]]):
+        try:
+            ImageDerivativeService.generate(product_id, images)
+        except Exception as e:
+            logger.error(f"Image derivative task failed (product {product_id}): {e}")
+        finally:
+            # 백그라운드 스레드에서 연 DB 연결 정리
+            connections.close_all()
@@ -0,0 +1,110 @@
+import threading
+from logging import getLogger
+
+import requests
+from asgiref.sync import sync_to_async
+from ninja.errors import HttpError
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from django.conf import settings
+
+logger = getLogger(__name__)
+
+DEFAULT_TIMEOUT = (3, 5)
+
+
+class OAuthHttpClient:
+    """
+    소셜 로그인 제공자 HTTP 클라이언트 (프로세스 단위로 Session 공유)
+    keep-alive 연결을 재사용해 로그인마다 TLS 연결을 새로 맺지 않고,
+    제공자별 timeout으로 느린 제공자가 워커를 무한정 붙잡지 않도록 함
+    """
+
+    _session = None
+    _lock = threading.Lock()
+
+    @staticmethod
+    def build_session() -> requests.Session:
+        retries = getattr(settings, "OAUTH_HTTP_RETRIES", 2)
+        # POST(코드 교환)는 인증 코드가 일회용이므로 요청이 전송되지 않은 연결 실패만 재시도
+        # GET(사용자 정보)은 5xx 응답도 재시도
+        # 응답 대기 timeout은 재시도하지 않음 (재시도하면 최대 대기 시간이 배로 늘어남)
+        retry = Retry(
+            total=retries,
+            connect=retries,
+            read=False,
+            status=retries,
+            backoff_factor=getattr(settings, "OAUTH_HTTP_BACKOFF", 0.2),
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset(["GET"]),
+            raise_on_status=False,
+        )
+        pool_maxsize = getattr(settings, "OAUTH_HTTP_POOL_MAXSIZE", 10)
+        adapter = HTTPAdapter(
+            pool_connections=len(getattr(settings, "OAUTH_PROVIDERS", {})) or 3,
+            pool_maxsize=pool_maxsize,
+            max_retries=retry,
+        )
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    @staticmethod
+    def get_session() -> requests.Session:
+        if OAuthHttpClient._session is None:
+            with OAuthHttpClient._lock:
+                if OAuthHttpClient._session is None:
+                    OAuthHttpClient._session = OAuthHttpClient.build_session()
+        return OAuthHttpClient._session
+
+    @staticmethod
+    def close():
+        with OAuthHttpClient._lock:
+            if OAuthHttpClient._session is not None:
+                OAuthHttpClient._session.close()
+                OAuthHttpClient._session = None
+
+    @staticmethod
+    def provider(name: str) -> dict:
+        return getattr(settings, "OAUTH_PROVIDERS", {}).get(name, {})
+
+    @staticmethod
+    def endpoint(name: str, key: str) -> str:
+        return OAuthHttpClient.provider(name)[key]
+
+    @staticmethod
+    def request(name: str, method: str, url: str, **kwargs) -> requests.Response:
+        timeout = OAuthHttpClient.provider(name).get("timeout", DEFAULT_TIMEOUT)
+        try:
+            return OAuthHttpClient.get_session().request(
+                method, url, timeout=timeout, **kwargs
+            )
+        except requests.Timeout:
+            logger.warning(f"OAuth provider timeout: {name} {method} {url}")
+            raise HttpError(504, "소셜 로그인 제공자 응답 시간이 초과되었습니다")
+        except requests.RequestException as e:
+            logger.warning(f"OAuth provider request failed: {name} {method} {url}: {e}")
+            raise HttpError(502, "소셜 로그인 제공자에 연결하지 못했습니다")
+
+    @staticmethod
+    def post(name: str, url: str, **kwargs) -> requests.Response:
+        return OAuthHttpClient.request(name, "POST", url, **kwargs)
+
+    @staticmethod
+    def get(name: str, url: str, **kwargs) -> requests.Response:
+        return OAuthHttpClient.request(name, "GET", url, **kwargs)
+
+    # ASGI(async) 뷰용 - 이벤트 루프를 막지 않도록 스레드에서 같은 Session으로 요청
+    @staticmethod
+    async def apost(name: str, url: str, **kwargs) -> requests.Response:
+        return await sync_to_async(OAuthHttpClient.post, thread_sensitive=False)(
+            name, url, **kwargs
+        )
+
+    @staticmethod
+    async def aget(name: str, url: str, **kwargs) -> requests.Response:
+        return await sync_to_async(OAuthHttpClient.get, thread_sensitive=False)(
+            name, url, **kwargs
+        )
@@ -0,0 +1,57 @@
+import base64
+import binascii
+from datetime import datetime
+from typing import Optional
+
+from django.db.models import Q, QuerySet
+
+DEFAULT_PAGE_LIMIT = 20
+MAX_PAGE_LIMIT = 100
+
+
+# (created_at, id) 기준 커서 페이지네이션 - OFFSET 없이 인덱스 범위 조회만 수행
+class KeysetPaginator:
+    @staticmethod
+    def encode_cursor(created_at: datetime, pk: int) -> str:
+        raw = f"{created_at.isoformat()}|{pk}".encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> tuple[datetime, int]:
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            raw = base64.urlsafe_b64decode(padded.encode()).decode()
+            created_at, pk = raw.split("|")
+            return datetime.fromisoformat(created_at), int(pk)
+        except (binascii.Error, UnicodeDecodeError, ValueError):
+            raise ValueError("유효하지 않은 커서입니다.")
+
+    @staticmethod
+    def paginate(
+        queryset: QuerySet,
+        cursor: Optional[str] = None,
+        limit: int = DEFAULT_PAGE_LIMIT,
+    ) -> tuple[list, Optional[str]]:
+        """
+        최신순((created_at, id) 내림차순)으로 limit 개를 조회
+        다음 페이지가 있으면 마지막 항목 기준 커서를 함께 반환
+        """
+        if limit < 1:
+            raise ValueError("limit은 1 이상이어야 합니다.")
+        limit = min(limit, MAX_PAGE_LIMIT)
+
+        queryset = queryset.order_by("-created_at", "-id")
+        if cursor:
+            created_at, pk = KeysetPaginator.decode_cursor(cursor)
+            queryset = queryset.filter(
+                Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=pk)
+            )
+
+        # 다음 페이지 존재 여부 확인을 위해 하나 더 조회
+        items = list(queryset[: limit + 1])
+        if len(items) <= limit:
+            return items, None
+
+        items = items[:limit]
+        last = items[-1]
+        return items, KeysetPaginator.encode_cursor(last.created_at, last.id)
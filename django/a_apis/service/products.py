@@ -1,8 +1,7 @@
 import os
-import uuid
-from math import cos, radians
 from typing import Optional
 
+from a_apis.auth.user_cache import UserCache
 from a_apis.models.products import (
     ProductAddress,
     ProductDetail,
@@ -13,7 +12,9 @@ from a_apis.models.products import (
 from a_apis.schema.products import (
     MyProductsSchema,
     MyProductsSchemaResponseSchema,
+    NearbyProductsResponseSchema,
     ProductAllResponseSchema,
+    ProductClusterSchema,
     ProductDeleteResponseSchema,
     ProductDetailAllResponseSchema,
     ProductInformationResponseSchema,
@@ -22,10 +23,13 @@ from a_apis.schema.products import (
     ProductResponseDetailSchema,
     ProductUpdateResponseDetailSchema,
     ProductUpdateResponseSchema,
-    UserDetailSchema,
     UserLikedProductsResponseSchema,
     UserLikedProductsSchema,
 )
+from a_apis.service.cache import ProductDetailCache
+from a_apis.service.geo import GeoService
+from a_apis.service.media import ImageDerivativeService, MediaUploadService
+from a_apis.service.pagination import DEFAULT_PAGE_LIMIT, KeysetPaginator
 from dotenv import load_dotenv
 from ninja.errors import HttpError
 from ninja.responses import Response
@@ -36,12 +40,32 @@ from django.core.files.base import ContentFile
 from django.core.files.storage import default_storage
 from django.core.files.uploadedfile import UploadedFile
 from django.db import transaction
+from django.db.models import Avg, Count, Max, Min
+from django.db.models.functions import Substr
 
 load_dotenv()
 
+# 이 줌 레벨 이하(광역 화면)에서는 매물을 격자 셀 단위로 묶어서 반환
+CLUSTER_MAX_ZOOM = 12
+# 한 화면에 반환할 최대 클러스터(셀) 수
+CLUSTER_MAX_CELLS = 64
+
 
 # 매물 관련 서비스
 class ProductService:
+    # 현재 사용자가 찜한 매물 ID 집합 (목록 조회 시 매물마다 조회하지 않도록 한 번에 조회)
+    @staticmethod
+    def get_liked_product_ids(
+        user: Optional[User], product_ids: Optional[list[int]] = None
+    ) -> set[int]:
+        if not user or not user.is_authenticated:
+            return set()
+
+        likes = ProductLikes.objects.filter(user=user, is_liked=True)
+        if product_ids is not None:
+            likes = likes.filter(product_id__in=product_ids)
+        return set(likes.values_list("product_id", flat=True))
+
     # 매물 등록
     @staticmethod
     def create_product(
@@ -59,62 +83,76 @@ class ProductService:
             if len(images) > 10:
                 raise ValueError("최대 10장의 이미지만 업로드할 수 있습니다.")
 
-            # ProductAddress 객체 생성
-            product_address = ProductAddress.objects.create(
-                add_new=data.add_new,
-                add_old=data.add_old,
-                latitude=data.latitude,
-                longitude=data.longitude,
+            # 이미지/동영상을 DB 작업 전에 동시에 업로드
+            image_paths, video_path = MediaUploadService.upload_product_media(
+                images, video
             )
+            image_urls = [default_storage.url(path) for path in image_paths]
+            video_url = default_storage.url(video_path) if video_path else None
 
-            # ProductVideo 객체 생성
-            product_video = None
-            if video:
-                product_video = ProductVideo.objects.create(video_url=video)
+            try:
+                with transaction.atomic():
+                    # ProductAddress 객체 생성
+                    product_address = ProductAddress.objects.create(
+                        add_new=data.add_new,
+                        add_old=data.add_old,
+                        latitude=data.latitude,
+                        longitude=data.longitude,
+                    )
 
-            # ProductDetail 객체 생성
-            product_detail = ProductDetail.objects.create(
-                user=user,
-                pro_title=data.pro_title,
-                pro_price=data.pro_price,
-                management_cost=data.management_cost,
-                pro_floor=data.pro_floor,
-                description=data.description,
-                sale=getattr(
-                    data, "sale", True
-                ),  # getattr이 True를 반환해서 DB에 sale=True로 저장
-                pro_supply_a=data.pro_supply_a,
-                pro_site_a=data.pro_site_a,
-                pro_heat=data.pro_heat,
-                pro_type=data.pro_type,
-                pro_rooms=data.pro_rooms,
-                pro_bathrooms=data.pro_bathrooms,
-                pro_construction_year=data.pro_construction_year,
-                address=product_address,  # 주소 필드 설정
-                video=product_video,  # 동영상 필드 설정
-            )
-
-            image_urls = []
-            for image in images:
-                # S3에 파일 업로드
-                file_extension = image.name.split(".")[-1]
-                file_path = f"products/images/{str(uuid.uuid4())[:8]}.{file_extension}"
-                saved_path = default_storage.save(file_path, image)
-                image_url = default_storage.url(saved_path)
-                image_urls.append(image_url)
-                ProductImg.objects.create(
-                    product_detail=product_detail, img_url=image_url
-                )
+                    # ProductVideo 객체 생성
+                    product_video = None
+                    if video_path:
+                        product_video = ProductVideo.objects.create(
+                            video_url=video_path
+                        )
+
+                    # ProductDetail 객체 생성
+                    product_detail = ProductDetail.objects.create(
+                        user=user,
+                        pro_title=data.pro_title,
+                        pro_price=data.pro_price,
+                        management_cost=data.management_cost,
+                        pro_floor=data.pro_floor,
+                        description=data.description,
+                        sale=getattr(
+                            data, "sale", True
+                        ),  # getattr이 True를 반환해서 DB에 sale=True로 저장
+                        pro_supply_a=data.pro_supply_a,
+                        pro_site_a=data.pro_site_a,
+                        pro_heat=data.pro_heat,
+                        pro_type=data.pro_type,
+                        pro_rooms=data.pro_rooms,
+                        pro_bathrooms=data.pro_bathrooms,
+                        pro_construction_year=data.pro_construction_year,
+                        address=product_address,  # 주소 필드 설정
+                        video=product_video,  # 동영상 필드 설정
+                        # 목록 조회용 대표 이미지(첫 번째 이미지)
+                        cover_image=image_urls[0] if image_urls else None,
+                    )
 
-            # 비디오 처리
-            video_url = None
-            if video:
-                # uuid를 사용하여 고유한 파일명 생성
-                file_extension = video.name.split(".")[-1]
-                file_path = f"products/videos/{str(uuid.uuid4())[:8]}.{file_extension}"
-                saved_path = default_storage.save(file_path, video)
-                video_url = default_storage.url(saved_path)
-                product_video = ProductVideo.objects.create(video_url=video_url)
+                    # 이미지 레코드는 한 번에 생성
+                    product_images = ProductImg.objects.bulk_create(
+                        [
+                            ProductImg(product_detail=product_detail, img_url=url)
+                            for url in image_urls
+                        ]
+                    )
+
+                    # 커밋 이후 백그라운드에서 썸네일/웹 최적화본 생성
+                    ImageDerivativeService.schedule(
+                        product_detail.id,
+                        [
+                            (img.id, path)
+                            for img, path in zip(product_images, image_paths)
+                        ],
+                    )
+            except Exception:
+                # DB 저장 실패 시 업로드한 파일 정리
+                MediaUploadService.delete_files(
+                    image_paths + ([video_path] if video_path else [])
+                )
+                raise
 
             return ProductAllResponseSchema(
                 success=True,
@@ -191,120 +229,142 @@ class ProductService:
                     status=404,
                 )
 
-            with transaction.atomic():
-                # 주소 정보 업데이트
-                product_detail.address.add_new = data.add_new
-                product_detail.address.add_old = data.add_old
-                product_detail.address.latitude = data.latitude
-                product_detail.address.longitude = data.longitude
-                product_detail.address.save()
-
-                # 비디오 처리 - 새 비디오가 제공된 경우에만 업데이트
-                if video:
-                    if product_detail.video:
+            if images and len(images) > 10:
+                raise ValueError("최대 10장의 이미지만 업로드할 수 있습니다.")
+
+            # 새 이미지/동영상을 DB 작업 전에 동시에 업로드
+            image_paths, video_path = MediaUploadService.upload_product_media(
+                images or [], video
+            )
+            image_urls = [default_storage.url(path) for path in image_paths]
+            video_url = default_storage.url(video_path) if video_path else None
+
+            try:
+                with transaction.atomic():
+                    # 주소 정보 업데이트
+                    product_detail.address.add_new = data.add_new
+                    product_detail.address.add_old = data.add_old
+                    product_detail.address.latitude = data.latitude
+                    product_detail.address.longitude = data.longitude
+                    product_detail.address.save()
+
+                    # 비디오 처리 - 새 비디오가 제공된 경우에만 업데이트
+                    old_video = None
+                    if video_path:
                         old_video = product_detail.video
-                        # uuid를 사용하여 고유한 파일명 생성
-                        file_extension = video.name.split(".")[-1]
-                        file_path = (
-                            f"products/videos/{str(uuid.uuid4())[:8]}.{file_extension}"
-                        )
-                        saved_path = default_storage.save(file_path, video)
-                        video_url = default_storage.url(saved_path)
                         product_detail.video = ProductVideo.objects.create(
-                            video_url=video_url
+                            video_url=video_path
                         )
-                        old_video.delete()
 
-                # 기본 정보 업데이트
-                product_detail.pro_title = data.pro_title
-                product_detail.pro_price = data.pro_price
-                product_detail.management_cost = data.management_cost
-                product_detail.pro_floor = data.pro_floor
-                product_detail.description = data.description
-                product_detail.sale = getattr(data, "sale", True)
-                product_detail.pro_supply_a = data.pro_supply_a
-                product_detail.pro_site_a = data.pro_site_a
-                product_detail.pro_heat = data.pro_heat
-                product_detail.pro_type = data.pro_type
-                product_detail.pro_rooms = data.pro_rooms
-                product_detail.pro_bathrooms = data.pro_bathrooms
-                product_detail.pro_construction_year = data.pro_construction_year
-                product_detail.save()
-
-                # 이미지 처리 - 새 이미지가 제공된 경우에만 업데이트
-                if images:
-                    old_images = list(product_detail.product_images.all())
-                    ProductImg.objects.filter(product_detail=product_detail).delete()
-
-                    image_urls = []
-                    for image in images:
-                        # S3에 새 이미지 업로드
-                        file_extension = image.name.split(".")[-1]
-                        file_path = (
-                            f"products/images/{str(uuid.uuid4())[:8]}.{file_extension}"
+                    # 기본 정보 업데이트
+                    product_detail.pro_title = data.pro_title
+                    product_detail.pro_price = data.pro_price
+                    product_detail.management_cost = data.management_cost
+                    product_detail.pro_floor = data.pro_floor
+                    product_detail.description = data.description
+                    product_detail.sale = getattr(data, "sale", True)
+                    product_detail.pro_supply_a = data.pro_supply_a
+                    product_detail.pro_site_a = data.pro_site_a
+                    product_detail.pro_heat = data.pro_heat
+                    product_detail.pro_type = data.pro_type
+                    product_detail.pro_rooms = data.pro_rooms
+                    product_detail.pro_bathrooms = data.pro_bathrooms
+                    product_detail.pro_construction_year = data.pro_construction_year
+
+                    # 이미지 처리 - 새 이미지가 제공된 경우에만 교체
+                    if image_urls:
+                        ProductImg.objects.filter(
+                            product_detail=product_detail
+                        ).delete()
+                        product_images = ProductImg.objects.bulk_create(
+                            [
+                                ProductImg(product_detail=product_detail, img_url=url)
+                                for url in image_urls
+                            ]
                         )
-                        saved_path = default_storage.save(file_path, image)
-                        image_url = default_storage.url(saved_path)
-                        image_urls.append(image_url)
-                        ProductImg.objects.create(
-                            product_detail=product_detail, img_url=image_url
+                        # 목록 조회용 대표 이미지(첫 번째 이미지) 갱신
+                        # 대표 썸네일은 파생본 생성이 끝나면 다시 채워짐
+                        product_detail.cover_image = image_urls[0]
+                        product_detail.cover_thumbnail = None
+                        ImageDerivativeService.schedule(
+                            product_detail.id,
+                            [
+                                (img.id, path)
+                                for img, path in zip(product_images, image_paths)
+                            ],
                         )
 
-                # 현재 로그인한 사용자의 찜 여부 확인
-                # ProductLikes 객체가 없는 경우도 고려
-                try:
-                    like_obj = ProductLikes.objects.get(
-                        user=user, product=product_detail
+                    product_detail.save()
+
+                    # 새 동영상으로 교체된 뒤에 기존 동영상 삭제
+                    # (FK가 CASCADE이므로 매물이 아직 참조 중일 때 삭제하면 매물까지 삭제됨)
+                    if old_video:
+                        old_video.delete()
+
+                    # 커밋 이후 상세 조회 캐시 무효화
+                    transaction.on_commit(
+                        lambda: ProductDetailCache.invalidate(product_detail.id)
                     )
-                    is_liked = like_obj.is_liked
-                except ProductLikes.DoesNotExist:
-                    # 찜한 적이 없으면 False
-                    is_liked = False
+            except Exception:
+                # DB 저장 실패 시 새로 업로드한 파일 정리
+                MediaUploadService.delete_files(
+                    image_paths + ([video_path] if video_path else [])
+                )
+                raise
 
-                return ProductUpdateResponseSchema(
-                    success=True,
-                    message="성공적으로 수정되었습니다.",
-                    product=ProductUpdateResponseDetailSchema(
-                        product_id=product_detail.id,
-                        images=(
-                            image_urls
-                            if images
-                            else [
-                                img.img_url.url
-                                for img in product_detail.product_images.all()
-                            ]
-                        ),
-                        video=(
-                            video_url
-                            if video
-                            else (
-                                product_detail.video.video_url.url
-                                if product_detail.video
-                                else None
-                            )
-                        ),
-                        pro_title=product_detail.pro_title,
-                        pro_price=product_detail.pro_price,
-                        management_cost=product_detail.management_cost,
-                        pro_supply_a=float(product_detail.pro_supply_a),
-                        pro_site_a=float(product_detail.pro_site_a),
-                        pro_heat=product_detail.pro_heat,
-                        pro_type=product_detail.pro_type,
-                        pro_floor=product_detail.pro_floor,
-                        pro_rooms=product_detail.pro_rooms,
-                        pro_bathrooms=product_detail.pro_bathrooms,
-                        pro_construction_year=product_detail.pro_construction_year,
-                        description=product_detail.description,
-                        sale=product_detail.sale,
-                        add_new=product_detail.address.add_new,
-                        add_old=product_detail.address.add_old,
-                        latitude=float(product_detail.address.latitude),
-                        longitude=float(product_detail.address.longitude),
-                        is_liked=is_liked,
-                        created_at=product_detail.created_at,
-                        updated_at=product_detail.updated_at,
+            # 현재 로그인한 사용자의 찜 여부 확인
+            # ProductLikes 객체가 없는 경우도 고려
+            try:
+                like_obj = ProductLikes.objects.get(user=user, product=product_detail)
+                is_liked = like_obj.is_liked
+            except ProductLikes.DoesNotExist:
+                # 찜한 적이 없으면 False
+                is_liked = False
+
+            return ProductUpdateResponseSchema(
+                success=True,
+                message="성공적으로 수정되었습니다.",
+                product=ProductUpdateResponseDetailSchema(
+                    product_id=product_detail.id,
+                    images=(
+                        image_urls
+                        if image_urls
+                        else [
+                            img.img_url.url
+                            for img in product_detail.product_images.all()
+                        ]
                     ),
-                )
+                    video=(
+                        video_url
+                        if video_url
+                        else (
+                            product_detail.video.video_url.url
+                            if product_detail.video
+                            else None
+                        )
+                    ),
+                    pro_title=product_detail.pro_title,
+                    pro_price=product_detail.pro_price,
+                    management_cost=product_detail.management_cost,
+                    pro_supply_a=float(product_detail.pro_supply_a),
+                    pro_site_a=float(product_detail.pro_site_a),
+                    pro_heat=product_detail.pro_heat,
+                    pro_type=product_detail.pro_type,
+                    pro_floor=product_detail.pro_floor,
+                    pro_rooms=product_detail.pro_rooms,
+                    pro_bathrooms=product_detail.pro_bathrooms,
+                    pro_construction_year=product_detail.pro_construction_year,
+                    description=product_detail.description,
+                    sale=product_detail.sale,
+                    add_new=product_detail.address.add_new,
+                    add_old=product_detail.address.add_old,
+                    latitude=float(product_detail.address.latitude),
+                    longitude=float(product_detail.address.longitude),
+                    is_liked=is_liked,
+                    created_at=product_detail.created_at,
+                    updated_at=product_detail.updated_at,
+                ),
+            )
 
         except ValueError as e:
             return Response(
@@ -338,6 +398,9 @@ class ProductService:
                 like_obj.is_liked = not like_obj.is_liked
                 like_obj.save()
 
+            # 찜 여부는 캐시에 저장하지 않지만, 찜 변경 시 해당 매물 캐시만 갱신
+            ProductDetailCache.invalidate(product.id)
+
             return ProductLikeResponseSchema(
                 success=True,
                 message=(
@@ -363,42 +426,39 @@ class ProductService:
 
     # 사용자가 찜한 매물 목록 조회
     @staticmethod
-    def mylist_like_products(user):
+    def mylist_like_products(
+        user, cursor: Optional[str] = None, limit: int = DEFAULT_PAGE_LIMIT
+    ):
         if not user.is_authenticated:
             return Response(
                 {"success": False, "message": "로그인이 필요합니다."}, status=401
             )
 
         try:
-            liked_products = (
-                ProductLikes.objects.filter(
-                    user=user,
-                    product__is_deleted=False,  # 삭제되지 않은 매물만
-                    is_liked=True,  # 실제 찜한 상태인 것만 조회
-                )
-                .select_related("product", "product__address")
-                .prefetch_related("product__product_images")
-                .order_by("-created_at")
+            liked_products = ProductLikes.objects.filter(
+                user=user,
+                product__is_deleted=False,  # 삭제되지 않은 매물만
+                is_liked=True,  # 실제 찜한 상태인 것만 조회
+            ).select_related("product", "product__address")
+            liked_products, next_cursor = KeysetPaginator.paginate(
+                liked_products, cursor, limit
             )
 
             # 찜한 매물이 없는 경우도 정상 응답
-            if not liked_products.exists():
+            if not liked_products and not cursor:
                 return Response(
                     {
                         "success": True,
                         "message": "찜한 매물이 없습니다.",
                         "total_count": 0,
                         "products": [],
+                        "next_cursor": None,
                     },
                     status=200,
                 )
 
             products_data = []
             for like in liked_products:
-                # 첫 번째 이미지를 가져오기
-                first_image = like.product.product_images.first()
-                image_url = str(first_image.img_url) if first_image else None
-
                 # 찜 목록이므로 무조건 True (자신이 찜한 목록)
                 product_data = UserLikedProductsSchema(
                     product_id=like.product.id,
@@ -407,7 +467,7 @@ class ProductService:
                     add_new=like.product.address.add_new,
                     pro_type=like.product.pro_type,
                     pro_supply_a=like.product.pro_supply_a,
-                    images=image_url,
+                    images=like.product.cover_thumbnail or like.product.cover_image,
                     is_liked=True,  # 본인의 찜 목록이므로 항상 True
                     is_deleted=like.product.is_deleted,
                     created_at=like.created_at,
@@ -419,8 +479,13 @@ class ProductService:
                 message="찜한 매물 목록을 성공적으로 조회했습니다.",
                 total_count=len(products_data),
                 products=products_data,
+                next_cursor=next_cursor,
             )
 
+        except ValueError as e:
+            return Response(
+                {"success": False, "message": f"잘못된 요청: {str(e)}"}, status=400
+            )
         except Exception as e:
             return Response(
                 {
@@ -432,48 +497,43 @@ class ProductService:
 
     @staticmethod
     # 사용자가 등록한 매물 목록 조회
-    def mylist_products(user):
+    def mylist_products(
+        user, cursor: Optional[str] = None, limit: int = DEFAULT_PAGE_LIMIT
+    ):
         if not user.is_authenticated:
             return Response(
                 {"success": False, "message": "로그인이 필요합니다."}, status=401
             )
 
         try:
-            registered_products = (
-                ProductDetail.objects.filter(
-                    user=user,
-                    is_deleted=False,  # 삭제되지 않은 매물만
-                )
-                .select_related("address")
-                .prefetch_related("product_images")
-                .order_by("-created_at")
+            registered_products = ProductDetail.objects.filter(
+                user=user,
+                is_deleted=False,  # 삭제되지 않은 매물만
+            ).select_related("address")
+            registered_products, next_cursor = KeysetPaginator.paginate(
+                registered_products, cursor, limit
             )
 
-            if not registered_products.exists():
+            if not registered_products and not cursor:
                 return Response(
                     {
                         "success": True,
                         "message": "등록한 매물이 없습니다.",
                         "total_count": 0,
                         "products": [],
+                        "next_cursor": None,
                     },
                     status=200,
                 )
 
+            # 현재 로그인한 사용자(본인)의 찜 여부를 한 번에 조회
+            liked_product_ids = ProductService.get_liked_product_ids(
+                user, [product.id for product in registered_products]
+            )
+
             products_data = []
             for product_detail in registered_products:
-                # 첫 번째 이미지를 가져오기
-                first_image = product_detail.product_images.first()
-                image_url = str(first_image.img_url) if first_image else None
-
-                # 현재 로그인한 사용자(본인)의 찜 여부 확인
-                is_liked = (
-                    ProductLikes.objects.filter(
-                        user=user, product=product_detail, is_liked=True
-                    ).exists()
-                    if user.is_authenticated
-                    else False
-                )
+                is_liked = product_detail.id in liked_product_ids
 
                 product_data = MyProductsSchema(
                     product_id=product_detail.id,
@@ -484,7 +544,7 @@ class ProductService:
                     add_new=product_detail.address.add_new,
                     latitude=float(product_detail.address.latitude),
                     longitude=float(product_detail.address.longitude),
-                    images=image_url,
+                    images=product_detail.cover_thumbnail or product_detail.cover_image,
                     is_liked=is_liked,
                     is_deleted=product_detail.is_deleted,
                     created_at=product_detail.created_at,
@@ -496,8 +556,13 @@ class ProductService:
                 message="등록한 매물 목록을 성공적으로 조회했습니다.",
                 total_count=len(products_data),
                 products=products_data,
+                next_cursor=next_cursor,
             )
 
+        except ValueError as e:
+            return Response(
+                {"success": False, "message": f"잘못된 요청: {str(e)}"}, status=400
+            )
         except Exception as e:
             return Response(
                 {
@@ -507,6 +572,48 @@ class ProductService:
                 status=500,
             )
 
+    @staticmethod
+    # 매물 상세 응답 데이터 구성 (찜 여부, 판매자 정보 제외 - 캐시 저장용)
+    # 판매자 정보는 회원 정보 수정 시 바로 반영되도록 요청 시 UserCache에서 합침
+    def _build_detail_data(product: ProductDetail) -> dict:
+        # 이미지 URL 리스트 생성 - str()로 단순 변환
+        # 웹 최적화본이 준비된 이미지는 최적화본을, 아니면 원본을 사용
+        image_urls = [
+            img.web_url or str(img.img_url) for img in product.product_images.all()
+        ]
+
+        # 비디오 URL - default_storage.url()을 사용하여 전체 URL 생성
+        video_url = (
+            default_storage.url(product.video.video_url.name) if product.video else None
+        )
+
+        return {
+            "product_id": product.id,
+            "seller_id": product.user_id,
+            "images": image_urls,
+            "video": video_url,
+            "pro_title": product.pro_title,
+            "pro_price": product.pro_price,
+            "management_cost": product.management_cost,
+            "pro_supply_a": float(product.pro_supply_a),
+            "pro_site_a": float(product.pro_site_a),
+            "pro_heat": product.pro_heat,
+            "pro_type": product.pro_type,
+            "pro_floor": product.pro_floor,
+            "description": product.description,
+            "sale": product.sale,
+            "pro_rooms": product.pro_rooms,
+            "pro_bathrooms": product.pro_bathrooms,
+            "pro_construction_year": product.pro_construction_year,
+            "add_new": product.address.add_new,
+            "add_old": product.address.add_old,
+            "latitude": float(product.address.latitude),
+            "longitude": float(product.address.longitude),
+            "is_deleted": product.is_deleted,
+            "created_at": product.created_at,
+            "updated_at": product.updated_at,
+        }
+
     @staticmethod
     # 매물 상세 조회
     def get_product_detail(user, product_id: int):
@@ -514,65 +621,42 @@ class ProductService:
             print(
                 f"Service user: {user}, is_authenticated: {user.is_authenticated if user else False}"
             )
-            # select_related와 prefetch_related를 사용하여 쿼리 최적화
-            product = (
-                ProductDetail.objects.filter(is_deleted=False)  # 삭제되지 않은 매물만
-                .select_related("user", "address", "video")
-                .prefetch_related("product_images", "likes")  # likes 추가
-                .get(id=product_id)
-            )
+            # 사용자와 무관한 상세 정보는 캐시에서 조회
+            product_data = ProductDetailCache.get(product_id)
+            # 판매자 정보가 포함된 이전 형식의 캐시는 다시 구성
+            if product_data is None or "seller_id" not in product_data:
+                # select_related와 prefetch_related를 사용하여 쿼리 최적화
+                product = (
+                    ProductDetail.objects.filter(
+                        is_deleted=False
+                    )  # 삭제되지 않은 매물만
+                    .select_related("address", "video")
+                    .prefetch_related("product_images")
+                    .get(id=product_id)
+                )
+                product_data = ProductService._build_detail_data(product)
+                ProductDetailCache.set(product_id, product_data)
 
-            # 이미지 URL 리스트 생성 - str()로 단순 변환
-            image_urls = [str(img.img_url) for img in product.product_images.all()]
+            # 판매자 정보는 회원 정보 수정 시 무효화되는 UserCache에서 조회
+            product_data = dict(product_data)
+            seller = UserCache.get(product_data.pop("seller_id"))
 
-            # 비디오 URL - default_storage.url()을 사용하여 전체 URL 생성
-            video_url = (
-                default_storage.url(product.video.video_url.name)
-                if product.video
-                else None
+            # 찜 여부는 요청한 사용자 기준으로 매번 확인
+            is_liked = product_id in ProductService.get_liked_product_ids(
+                user, [product_id]
             )
 
-            # 찜 여부 체크 로직 수정
-            is_liked = False
-            if user and user.is_authenticated:
-                is_liked = ProductLikes.objects.filter(
-                    user=user, product=product, is_liked=True
-                ).exists()
-
-            # response 구성 부분은 동일
             return ProductDetailAllResponseSchema(
                 success=True,
                 message="매물 상세 정보를 성공적으로 조회했습니다.",
                 product=ProductInformationResponseSchema(
-                    product_id=product.id,
-                    user=UserDetailSchema(
-                        email=product.user.email,
-                        username=product.user.username,
-                        phone_number=product.user.phone_number,
-                    ),
-                    images=image_urls,
-                    video=video_url,
-                    pro_title=product.pro_title,
-                    pro_price=product.pro_price,
-                    management_cost=product.management_cost,
-                    pro_supply_a=float(product.pro_supply_a),
-                    pro_site_a=float(product.pro_site_a),
-                    pro_heat=product.pro_heat,
-                    pro_type=product.pro_type,
-                    pro_floor=product.pro_floor,
-                    description=product.description,
-                    sale=product.sale,
-                    pro_rooms=product.pro_rooms,
-                    pro_bathrooms=product.pro_bathrooms,
-                    pro_construction_year=product.pro_construction_year,
-                    add_new=product.address.add_new,
-                    add_old=product.address.add_old,
-                    latitude=float(product.address.latitude),
-                    longitude=float(product.address.longitude),
+                    **product_data,
+                    user={
+                        "email": seller.email,
+                        "username": seller.username,
+                        "phone_number": seller.phone_number,
+                    },
                     is_liked=is_liked,
-                    is_deleted=product.is_deleted,
-                    created_at=product.created_at,
-                    updated_at=product.updated_at,
                 ),
             )
 
@@ -592,7 +676,12 @@ class ProductService:
     @staticmethod
     # 지도 주변 매물 조회
     def get_nearby_products(
-        user: Optional[User], latitude: float, longitude: float, zoom: int
+        user: Optional[User],
+        latitude: float,
+        longitude: float,
+        zoom: int,
+        cursor: Optional[str] = None,
+        limit: int = DEFAULT_PAGE_LIMIT,
     ):
         try:
             # 줌 레벨에 따른 검색 반경 설정 (km)
@@ -617,40 +706,68 @@ class ProductService:
             distance = distance_map[zoom]
 
             # 위도/경도 범위 계산 (근사값)
-            lat_range = distance / 111.0
-            lon_range = distance / (111.0 * cos(radians(latitude)))
-
-            # 주어진 범위 내의 매물 조회
-            nearby_products = (
-                ProductDetail.objects.filter(
-                    is_deleted=False,  # 삭제되지 않은 매물만
-                    address__latitude__range=(
-                        latitude - lat_range,
-                        latitude + lat_range,
-                    ),
-                    address__longitude__range=(
-                        longitude - lon_range,
-                        longitude + lon_range,
-                    ),
-                    sale=True,  # 판매 중인 매물만 조회
+            min_lat, min_lon, max_lat, max_lon = GeoService.bounding_box(
+                latitude, longitude, distance
+            )
+
+            # geohash 인덱스 범위로 후보를 좁힌 뒤, 위경도 범위로 정확히 필터링
+            nearby_queryset = ProductDetail.objects.filter(
+                GeoService.bbox_q(
+                    min_lat, min_lon, max_lat, max_lon, field="address__geohash"
+                ),
+                is_deleted=False,  # 삭제되지 않은 매물만
+                address__latitude__range=(min_lat, max_lat),
+                address__longitude__range=(min_lon, max_lon),
+                sale=True,  # 판매 중인 매물만 조회
+            )
+
+            # 낮은 줌 레벨에서는 개별 마커 대신 격자 셀 단위 클러스터만 반환
+            if zoom <= CLUSTER_MAX_ZOOM:
+                precision = GeoService.covering_precision(
+                    min_lat,
+                    min_lon,
+                    max_lat,
+                    max_lon,
+                    max_cells=CLUSTER_MAX_CELLS,
+                )
+                clusters = (
+                    nearby_queryset.annotate(
+                        cell=Substr("address__geohash", 1, precision)
+                    )
+                    .values("cell")
+                    .annotate(
+                        count=Count("id"),
+                        latitude=Avg("address__latitude"),
+                        longitude=Avg("address__longitude"),
+                        min_price=Min("pro_price"),
+                        max_price=Max("pro_price"),
+                        product_id=Max("id"),  # 셀의 대표 매물 (가장 최근 등록)
+                    )
+                    .order_by("cell")
                 )
-                .select_related("address")
-                .prefetch_related("product_images", "likes")
-                .order_by("-created_at")
+                clusters_data = [ProductClusterSchema(**c) for c in clusters]
+
+                return NearbyProductsResponseSchema(
+                    success=True,
+                    message="주변 매물 조회가 완료되었습니다.",
+                    total_count=sum(c.count for c in clusters_data),
+                    clustered=True,
+                    products=[],
+                    clusters=clusters_data,
+                )
+
+            nearby_products, next_cursor = KeysetPaginator.paginate(
+                nearby_queryset.select_related("address"), cursor, limit
+            )
+
+            # 찜 여부는 사용자 기준으로 한 번만 조회
+            liked_product_ids = ProductService.get_liked_product_ids(
+                user, [product.id for product in nearby_products]
             )
 
             products_data = []
             for product in nearby_products:
-                # 첫 번째 이미지 가져오기
-                first_image = product.product_images.first()
-                image_url = str(first_image.img_url) if first_image else None
-
-                # 찜 여부 확인
-                is_liked = False
-                if user and user.is_authenticated:
-                    is_liked = ProductLikes.objects.filter(
-                        user=user, product=product, is_liked=True
-                    ).exists()
+                is_liked = product.id in liked_product_ids
 
                 product_data = MyProductsSchema(
                     product_id=product.id,
@@ -661,20 +778,25 @@ class ProductService:
                     add_new=product.address.add_new,
                     latitude=float(product.address.latitude),
                     longitude=float(product.address.longitude),
-                    images=image_url,
+                    images=product.cover_thumbnail or product.cover_image,
                     is_liked=is_liked,
                     is_deleted=product.is_deleted,
                     created_at=product.created_at,
                 )
                 products_data.append(product_data)
 
-            return MyProductsSchemaResponseSchema(
+            return NearbyProductsResponseSchema(
                 success=True,
                 message="주변 매물 조회가 완료되었습니다.",
                 total_count=len(products_data),
                 products=products_data,
+                next_cursor=next_cursor,
             )
 
+        except ValueError as e:
+            return Response(
+                {"success": False, "message": f"잘못된 요청: {str(e)}"}, status=400
+            )
         except Exception as e:
             return Response(
                 {
@@ -735,6 +857,9 @@ class ProductService:
                 product.is_deleted = True
                 product.save()
 
+                # 6. 커밋 이후 상세 조회 캐시 무효화
+                transaction.on_commit(lambda: ProductDetailCache.invalidate(product.id))
+
                 return ProductDeleteResponseSchema(
                     success=True,
                     message="매물이 성공적으로 삭제되었습니다.",
@@ -1,9 +1,11 @@
 import random
 import re
 import string
+from datetime import datetime
+from logging import getLogger
 
 from a_apis.auth.cookies import create_auth_response
-from a_apis.models.email_verification import EmailVerification
+from a_apis.auth.user_cache import UserCache, resolve_request_user
 from a_apis.schema.users import (
     LoginSchema,
     LogoutSchema,
@@ -11,6 +13,7 @@ from a_apis.schema.users import (
     UpdateProfileSchema,
     WithdrawalSchema,
 )
+from a_apis.service.email_verification import get_verification_store
 from ninja.responses import Response
 from rest_framework_simplejwt.exceptions import TokenError
 from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
@@ -18,11 +21,16 @@ from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
 from django.contrib.auth import authenticate, get_user_model, login
 from django.core.exceptions import ValidationError
 from django.core.validators import validate_email
+from django.db import transaction
 
 User = get_user_model()
+logger = getLogger(__name__)
 
 
 class UserService:
+    # /users/me?check=false(토큰 발급) 제거 예정일
+    TOKEN_ISSUE_SUNSET = "Sun, 31 Jan 2027 00:00:00 GMT"
+
     @staticmethod
     def _generate_random_password(length=12):
         characters = string.ascii_letters + string.digits + string.punctuation
@@ -125,7 +133,12 @@ class UserService:
             )
 
     @staticmethod
-    def get_user(request):
+    def get_user(request, check: bool = True):
+        """
+        토큰을 새로 발급하지 않고 캐시된 유저 정보와 현재 토큰 만료 시간만 반환
+        토큰 재발급은 /refresh 사용
+        check=False(토큰 발급)는 지원 중단 예정 - TOKEN_ISSUE_SUNSET 이후 제거
+        """
         try:
             user = request.auth
             if not user:
@@ -137,12 +150,7 @@ class UserService:
                     },
                 )
 
-            access_token = AccessToken(user)
-            user_id = access_token["user_id"]
-
-            user = User.objects.get(id=user_id)
-
-            refresh = RefreshToken.for_user(user)
+            user = resolve_request_user(request)
 
             if not user.is_active:
                 return Response(
@@ -155,8 +163,32 @@ class UserService:
                         },
                     },
                 )
-            else:
+
+            user_data = {
+                "email": user.email,
+                "username": user.username,
+                "phone_number": user.phone_number,
+                "is_active": user.is_active,
+            }
+            if check:
+                access_token = getattr(request, "_access_token", None) or AccessToken(
+                    request.auth
+                )
                 return Response(
+                    status=200,
+                    data={
+                        "success": True,
+                        "message": "인증된 사용자입니다.",
+                        "user": user_data,
+                        "expires_at": datetime.fromtimestamp(access_token["exp"]),
+                    },
+                )
+            else:
+                logger.warning(
+                    f"Deprecated /users/me?check=false called (user {user.id})"
+                )
+                refresh = RefreshToken.for_user(user)
+                response = Response(
                     status=200,
                     data={
                         "success": True,
@@ -165,14 +197,14 @@ class UserService:
                             "access": str(refresh.access_token),
                             "refresh": str(refresh),
                         },
-                        "user": {
-                            "email": user.email,
-                            "username": user.username,
-                            "phone_number": user.phone_number,
-                            "is_active": user.is_active,
-                        },
+                        "user": user_data,
                     },
                 )
+                # 지원 중단 안내 (RFC 8594) - 토큰 재발급은 /refresh로 이전
+                response["Deprecation"] = "true"
+                response["Sunset"] = UserService.TOKEN_ISSUE_SUNSET
+                response["Link"] = '</api/users/refresh>; rel="successor-version"'
+                return response
         except Exception as e:
             return Response(
                 status=500,
@@ -186,11 +218,7 @@ class UserService:
     def signup(data: SignupSchema):
         try:
             # 이메일 인증 확인
-            verification = EmailVerification.objects.filter(
-                email=data.email, is_verified=True
-            ).exists()
-
-            if not verification:
+            if not get_verification_store().is_verified(data.email):
                 raise ValueError("이메일 인증이 필요합니다.")
 
             # 이메일 유효성 검사
@@ -231,6 +259,7 @@ class UserService:
                     deleted_user.set_password(data.password)
                 deleted_user.is_social_login = user.is_social_login
                 deleted_user.save()
+                UserCache.invalidate(deleted_user.id)
                 user = deleted_user
             else:
                 # 새 사용자 생성
@@ -254,7 +283,7 @@ class UserService:
             refresh = RefreshToken.for_user(user)
 
             # 이메일 인증 데이터 삭제
-            EmailVerification.objects.filter(email=data.email).delete()
+            get_verification_store().clear(data.email)
 
             return Response(
                 status=200,
@@ -300,10 +329,7 @@ class UserService:
                     },
                 )
 
-            access_token = AccessToken(user)
-            user_id = access_token["user_id"]
-
-            user = User.objects.get(id=user_id)
+            user = resolve_request_user(request)
 
             # 인증되지 않은 사용자 체크
             if not user.is_authenticated:
@@ -315,9 +341,12 @@ class UserService:
                     },
                 )
 
-            # 소프트 딜리트 처리
-            user.is_active = False
-            user.save()
+            # 소프트 딜리트 처리 (캐시된 유저가 아닌 DB의 최신 유저를 잠가서 수정)
+            with transaction.atomic():
+                user = User.objects.select_for_update().get(id=user.id)
+                user.is_active = False
+                user.save(update_fields=["is_active", "updated_at"])
+            UserCache.invalidate(user.id)
 
             # 로그아웃 처리를 위한 토큰 무효화
             RefreshToken.for_user(user)
@@ -373,32 +402,39 @@ class UserService:
     @staticmethod
     def update_user_profile(request, data: UpdateProfileSchema):
         try:
-            user = request.auth
-            access_token = AccessToken(user)
-            user_id = access_token["user_id"]
-            user = User.objects.get(id=user_id)
-
-            if data.username:
-                # 자신의 현재 username이 아닌 다른 username으로 변경하려는 경우에만 중복 체크
-                if (
-                    user.username != data.username
-                    and User.objects.filter(username=data.username).exists()
-                ):
-                    return Response(
-                        status=400,
-                        data={
-                            "success": False,
-                            "message": "이미 사용 중인 사용자 이름입니다.",
-                        },
-                    )
-                user.username = data.username
-
-            if data.password:
-                user.set_password(data.password)
-            if data.phone_number:
-                user.phone_number = data.phone_number
-
-            user.save()
+            user_id = resolve_request_user(request).id
+
+            # 캐시된 유저로 저장하면 다른 요청의 변경을 덮어쓸 수 있으므로 DB에서 잠가서 수정
+            with transaction.atomic():
+                user = User.objects.select_for_update().get(id=user_id)
+                update_fields = []
+
+                if data.username:
+                    # 자신의 현재 username이 아닌 다른 username으로 변경하려는 경우에만 중복 체크
+                    if (
+                        user.username != data.username
+                        and User.objects.filter(username=data.username).exists()
+                    ):
+                        return Response(
+                            status=400,
+                            data={
+                                "success": False,
+                                "message": "이미 사용 중인 사용자 이름입니다.",
+                            },
+                        )
+                    user.username = data.username
+                    update_fields.append("username")
+
+                if data.password:
+                    user.set_password(data.password)
+                    update_fields.append("password")
+                if data.phone_number:
+                    user.phone_number = data.phone_number
+                    update_fields.append("phone_number")
+
+                if update_fields:
+                    user.save(update_fields=[*update_fields, "updated_at"])
+            UserCache.invalidate(user_id)
             return Response(
                 status=200,
                 data={"success": True, "message": "회원 정보가 수정되었습니다."},
@@ -0,0 +1,287 @@
+import hashlib
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+from urllib.parse import parse_qs, urlparse
+
+from a_apis.models.email_verification import EmailVerification
+from a_apis.service.auth import (
+    CALLBACK_DONE,
+    CALLBACK_PROCESSING,
+    GoogleAuthService,
+    SocialLoginService,
+)
+from a_apis.service.oauth_client import OAuthHttpClient
+from a_user.models import SocialUser, User
+from asgiref.sync import async_to_sync
+from ninja.errors import HttpError
+
+from django.core.cache import cache
+from django.db import DatabaseError
+from django.test import TestCase, override_settings
+
+
+class FakeOAuthHandler(BaseHTTPRequestHandler):
+    # keep-alive 지원 (연결 재사용 확인용)
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def send_json(self, status: int, data: dict):
+        body = json.dumps(data).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        try:
+            self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            # timeout 테스트에서 클라이언트가 먼저 연결을 끊은 경우
+            pass
+
+    def do_POST(self):
+        self.server.connections.add(self.client_address)
+        self.server.token_calls += 1
+        length = int(self.headers.get("Content-Length", 0))
+        form = parse_qs(self.rfile.read(length).decode())
+        if form.get("code") != ["valid-code"]:
+            return self.send_json(400, {"error": "invalid_grant"})
+        self.send_json(200, {"access_token": "fake-access-token"})
+
+    def do_GET(self):
+        self.server.connections.add(self.client_address)
+        url = urlparse(self.path)
+        if url.path == "/slow":
+            time.sleep(0.5)
+        elif url.path == "/flaky":
+            self.server.flaky_calls += 1
+            if self.server.flaky_calls == 1:
+                return self.send_json(503, {})
+        elif parse_qs(url.query).get("access_token") != ["fake-access-token"]:
+            return self.send_json(401, {})
+        self.send_json(200, {"email": "google-user@example.com", "name": "구글유저"})
+
+
+class OAuthHttpClientTest(TestCase):
+    """로컬 가짜 OAuth 서버로 소셜 로그인 HTTP 클라이언트 테스트"""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), FakeOAuthHandler)
+        cls.server.daemon_threads = True
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_address[1]}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        super().tearDownClass()
+
+    def setUp(self):
+        self.server.connections = set()
+        self.server.flaky_calls = 0
+        self.server.token_calls = 0
+        cache.clear()
+        providers = {
+            "google": {
+                "token_url": f"{self.base_url}/token",
+                "userinfo_url": f"{self.base_url}/userinfo",
+                "timeout": (1, 0.2),
+            }
+        }
+        settings_override = override_settings(
+            OAUTH_PROVIDERS=providers, OAUTH_HTTP_BACKOFF=0
+        )
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        # 설정이 바뀌었으므로 Session을 새로 만들도록 닫음
+        OAuthHttpClient.close()
+        self.addCleanup(OAuthHttpClient.close)
+
+    def callback(self, code: str):
+        return GoogleAuthService.callback_google_auth(
+            code=code,
+            server_base_url="http://testserver",
+            client_id="client-id",
+            client_secret="client-secret",
+            login_redirect_url="http://frontend/login",
+        )
+
+    def test_google_callback_reuses_connection(self):
+        """코드 교환과 사용자 정보 조회가 하나의 keep-alive 연결을 재사용하는지 테스트"""
+        response = self.callback("valid-code")
+
+        self.assertTrue(response["success"])
+        self.assertEqual(response["user"]["email"], "google-user@example.com")
+        user = User.objects.get(email="google-user@example.com")
+        self.assertTrue(
+            SocialUser.objects.filter(user=user, social_type="google").exists()
+        )
+        self.assertEqual(len(self.server.connections), 1)
+
+    def test_token_exchange_failure(self):
+        """제공자가 코드 교환을 거부하면 400 응답"""
+        with self.assertRaises(HttpError) as ctx:
+            self.callback("invalid-code")
+        self.assertEqual(ctx.exception.status_code, 400)
+
+    def test_duplicate_callback_exchanges_code_once(self):
+        """같은 인가 코드로 콜백이 다시 들어오면 코드 교환 없이 409 응답 (토큰을 받지 않음)"""
+        first = self.callback("valid-code")
+        with self.assertRaises(HttpError) as ctx:
+            self.callback("valid-code")
+
+        self.assertTrue(first["success"])
+        self.assertEqual(ctx.exception.status_code, 409)
+        self.assertEqual(self.server.token_calls, 1)
+        self.assertEqual(
+            User.objects.filter(email="google-user@example.com").count(), 1
+        )
+
+    def test_duplicate_callback_cache_holds_no_tokens(self):
+        """중복 처리용 캐시에는 처리 상태만 저장하고 토큰은 저장하지 않음"""
+        self.callback("valid-code")
+        code_hash = hashlib.sha256(b"valid-code").hexdigest()
+
+        self.assertEqual(cache.get(f"oauth:callback:google:{code_hash}"), CALLBACK_DONE)
+
+    def test_in_flight_duplicate_rejected_immediately(self):
+        """먼저 온 요청이 처리 중이면 기다리지 않고 바로 409 (코드 교환 없음)"""
+        code_hash = hashlib.sha256(b"valid-code").hexdigest()
+        cache.set(f"oauth:callback:google:{code_hash}", CALLBACK_PROCESSING)
+
+        started = time.monotonic()
+        with self.assertRaises(HttpError) as ctx:
+            self.callback("valid-code")
+
+        self.assertEqual(ctx.exception.status_code, 409)
+        self.assertLess(time.monotonic() - started, 0.5)
+        self.assertEqual(self.server.token_calls, 0)
+
+    def test_positional_code_is_deduplicated(self):
+        """code를 위치 인자로 넘겨도 중복 처리"""
+        args = (
+            "valid-code",
+            "http://testserver",
+            "client-id",
+            "client-secret",
+            "http://frontend/login",
+        )
+        GoogleAuthService.callback_google_auth(*args)
+        with self.assertRaises(HttpError) as ctx:
+            GoogleAuthService.callback_google_auth(*args)
+
+        self.assertEqual(ctx.exception.status_code, 409)
+        self.assertEqual(self.server.token_calls, 1)
+
+    def test_failed_callback_can_retry(self):
+        """처리에 실패한 코드는 결과를 저장하지 않고 다시 시도할 수 있음"""
+        for _ in range(2):
+            with self.assertRaises(HttpError):
+                self.callback("invalid-code")
+        self.assertEqual(self.server.token_calls, 2)
+
+    def test_slow_provider_times_out(self):
+        """응답이 timeout보다 늦으면 워커를 붙잡지 않고 504 응답"""
+        with self.assertRaises(HttpError) as ctx:
+            OAuthHttpClient.get("google", f"{self.base_url}/slow")
+        self.assertEqual(ctx.exception.status_code, 504)
+
+    def test_get_retries_on_5xx(self):
+        """사용자 정보 조회(GET)는 5xx 응답 시 재시도"""
+        response = OAuthHttpClient.get("google", f"{self.base_url}/flaky")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.server.flaky_calls, 2)
+
+    def test_async_get(self):
+        """ASGI 뷰용 비동기 요청"""
+        response = async_to_sync(OAuthHttpClient.aget)(
+            "google",
+            f"{self.base_url}/userinfo",
+            params={"access_token": "fake-access-token"},
+        )
+        self.assertEqual(response.json()["email"], "google-user@example.com")
+
+
+class SocialLoginProvisioningTest(TestCase):
+    def test_links_existing_user_once(self):
+        """일반 회원이 소셜 로그인하면 SocialUser를 한 번만 연결"""
+        user = User.objects.create_user(
+            username="member", email="member@example.com", password="testpass123"
+        )
+
+        for _ in range(2):
+            SocialLoginService.create_or_get_user(
+                email=user.email, username="", social_type="kakao", phone_number=None
+            )
+
+        user.refresh_from_db()
+        self.assertTrue(user.is_social_login)
+        self.assertTrue(user.is_active)
+        self.assertEqual(SocialUser.objects.filter(user=user).count(), 1)
+
+    def test_new_user_created_inactive(self):
+        """처음 소셜 로그인한 회원은 비활성 상태로 생성되고 이메일 인증 처리"""
+        user = SocialLoginService.create_or_get_user(
+            email="new@example.com",
+            username="new",
+            social_type="naver",
+            phone_number="",
+        )
+
+        self.assertFalse(user.is_active)
+        self.assertTrue(
+            EmailVerification.objects.filter(
+                email="new@example.com", is_verified=True
+            ).exists()
+        )
+        self.assertEqual(SocialUser.objects.filter(user=user).count(), 1)
+
+    def test_returning_social_user_single_query(self):
+        """가입을 마친 소셜 로그인 회원은 조회 쿼리 한 번으로 처리"""
+        user = SocialLoginService.create_or_get_user(
+            email="done@example.com",
+            username="done",
+            social_type="google",
+            phone_number="",
+        )
+        User.objects.filter(id=user.id).update(is_active=True)
+
+        with self.assertNumQueries(1):
+            SocialLoginService.create_or_get_user(
+                email="done@example.com",
+                username="done",
+                social_type="google",
+                phone_number="",
+            )
+
+    def test_social_user_failure_rolls_back_user(self):
+        """SocialUser 연결이 실패하면 User 생성도 롤백되어 연결되지 않은 회원이 남지 않음"""
+        with patch.object(
+            SocialUser.objects, "bulk_create", side_effect=DatabaseError("down")
+        ):
+            with self.assertRaises(DatabaseError):
+                SocialLoginService.create_or_get_user(
+                    email="orphan@example.com",
+                    username="orphan",
+                    social_type="kakao",
+                    phone_number="",
+                )
+
+        self.assertFalse(User.objects.filter(email="orphan@example.com").exists())
+
+        # 다시 로그인하면 User와 SocialUser가 함께 생성됨
+        user = SocialLoginService.create_or_get_user(
+            email="orphan@example.com",
+            username="orphan",
+            social_type="kakao",
+            phone_number="",
+        )
+        self.assertEqual(SocialUser.objects.filter(user=user).count(), 1)
@@ -0,0 +1,389 @@
+import asyncio
+import json
+import random
+import re
+import time
+from datetime import datetime
+from unittest.mock import AsyncMock, patch
+
+from a_apis.models.chat import ChatMessage, ChatRoom
+from a_apis.models.products import ProductAddress, ProductDetail
+from a_apis.service.chat import ChatService
+from a_chat.consumers import ChatConsumer
+from a_chat.presence import PresenceService, TypingThrottle
+from a_chat.writer import ChatMessageWriter
+from a_core.db import QUERIES
+from a_user.models import User
+from asgiref.sync import async_to_sync, sync_to_async
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import RequestFactory, SimpleTestCase, TestCase
+
+
+def create_product(user):
+    address = ProductAddress.objects.create(
+        add_new="서울특별시 중구 세종대로 110",
+        add_old="서울특별시 중구 태평로1가 31",
+        latitude=37.5665,
+        longitude=126.9780,
+    )
+    return ProductDetail.objects.create(
+        user=user,
+        pro_title="테스트 매물",
+        pro_price=10000,
+        pro_supply_a=20,
+        pro_site_a=30,
+        pro_heat="gas",
+        pro_type="detached",
+        pro_floor=1,
+        description="테스트 설명",
+        pro_rooms=2,
+        pro_bathrooms=1,
+        pro_construction_year=2000,
+        address=address,
+    )
+
+
+class ChatRoomListTest(TestCase):
+    def setUp(self):
+        self.seller = User.objects.create_user(
+            username="seller", email="seller@example.com", password="testpass123"
+        )
+        self.buyers = []
+
+    def create_room(self):
+        buyer = User.objects.create_user(
+            username=f"buyer{len(self.buyers)}",
+            email=f"buyer{len(self.buyers)}@example.com",
+            password="testpass123",
+        )
+        self.buyers.append(buyer)
+        return ChatRoom.objects.create(item=create_product(self.seller), buyer=buyer)
+
+    def request(self, user):
+        request = RequestFactory().get("/api/v1/chat/list")
+        request.auth = "token"
+        request._auth_user = user
+        return request
+
+    def get_chat_rooms(self, user):
+        response = ChatService.get_chat_rooms(self.request(user))
+        return json.loads(response.content)
+
+    def test_chat_rooms_query_count_is_constant(self):
+        """채팅방 수와 관계없이 목록 조회 쿼리가 한 번인지 테스트"""
+        for _ in range(5):
+            room = self.create_room()
+            ChatMessage.objects.create(
+                chat_room=room, sender=room.buyer, message="안녕하세요"
+            )
+
+        with self.assertNumQueries(1):
+            data = self.get_chat_rooms(self.seller)
+        self.assertEqual(len(data["chat_rooms"]), 5)
+
+    def test_chat_rooms_last_message_and_unread_count(self):
+        """마지막 메시지, 안 읽은 메시지 수, 최근 대화순 정렬 테스트"""
+        quiet_room = self.create_room()
+        active_room = self.create_room()
+        ChatMessage.objects.create(
+            chat_room=active_room, sender=active_room.buyer, message="첫 메시지"
+        )
+        reply = ChatMessage.objects.create(
+            chat_room=active_room, sender=self.seller, message="답장"
+        )
+        ChatMessage.objects.create(
+            chat_room=active_room, sender=active_room.buyer, message="가격 조정 되나요?"
+        )
+        ChatMessage.objects.create(
+            chat_room=active_room, sender=active_room.buyer, message="연락주세요"
+        )
+
+        # 판매자는 자신의 답장까지 읽음
+        active_room.seller_last_read_id = reply.id
+        active_room.save()
+
+        data = self.get_chat_rooms(self.seller)
+
+        rooms = data["chat_rooms"]
+        self.assertEqual(
+            [room["id"] for room in rooms], [active_room.id, quiet_room.id]
+        )
+        self.assertEqual(rooms[0]["last_message"], "연락주세요")
+        self.assertEqual(rooms[0]["unread_count"], 2)
+        self.assertIsNone(rooms[1]["last_message"])
+        self.assertEqual(rooms[1]["unread_count"], 0)
+
+    def test_unread_badge_uses_read_cursor(self):
+        """전체 안 읽은 메시지 수가 채팅방별 읽음 커서 기준으로 계산되는지 테스트"""
+        rooms = [self.create_room() for _ in range(2)]
+        messages = [
+            ChatMessage.objects.create(
+                chat_room=room, sender=room.buyer, message="문의"
+            )
+            for room in rooms
+            for _ in range(3)
+        ]
+        rooms[0].seller_last_read_id = messages[1].id
+        rooms[0].save()
+        # 구매자 쪽 커서는 판매자 배지에 영향 없음
+        rooms[1].buyer_last_read_id = messages[-1].id
+        rooms[1].save()
+
+        response = ChatService.get_unread_count(self.request(self.seller))
+        self.assertEqual(json.loads(response.content)["unread_count"], 1 + 3)
+
+        response = ChatService.get_unread_count(self.request(rooms[0].buyer))
+        self.assertEqual(json.loads(response.content)["unread_count"], 0)
+
+
+def fetchrow_on_test_db(name: str, *args):
+    """
+    등록된 asyncpg 쿼리를 테스트 DB(SQLite)에서 실행
+    GREATEST/LEAST는 SQLite의 다중 인자 MAX/MIN과 같고, $n은 순서대로 바인딩
+    """
+    params = []
+
+    def bind(match):
+        params.append(args[int(match.group(1)) - 1])
+        return "%s"
+
+    sql = re.sub(r"\$(\d+)", bind, QUERIES[name])
+    sql = sql.replace("GREATEST(", "MAX(").replace("LEAST(", "MIN(")
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        columns = [column[0] for column in cursor.description]
+        row = cursor.fetchone()
+    return dict(zip(columns, row)) if row else None
+
+
+class ChatReadCursorTest(TestCase):
+    def setUp(self):
+        seller = User.objects.create_user(
+            username="seller", email="seller@example.com", password="testpass123"
+        )
+        buyer = User.objects.create_user(
+            username="buyer", email="buyer@example.com", password="testpass123"
+        )
+        self.room = ChatRoom.objects.create(item=create_product(seller), buyer=buyer)
+        self.messages = [
+            ChatMessage.objects.create(
+                chat_room=self.room, sender=buyer, message="문의"
+            )
+            for _ in range(3)
+        ]
+        # 다른 채팅방의 최신 메시지
+        other_room = ChatRoom.objects.create(
+            item=create_product(seller),
+            buyer=User.objects.create_user(
+                username="other", email="other@example.com", password="testpass123"
+            ),
+        )
+        self.other_message = ChatMessage.objects.create(
+            chat_room=other_room, sender=seller, message="다른 방"
+        )
+
+        self.consumer = ChatConsumer()
+        self.consumer.room_id = str(self.room.id)
+        self.consumer.room_group_name = f"chat_{self.room.id}"
+        self.consumer.is_buyer = False
+        self.consumer.user_info = {"id": seller.id}
+        self.consumer.pending_read_id = 0
+        self.consumer.saved_read_id = 0
+        self.consumer.channel_layer = AsyncMock()
+
+    def flush_read(self, message_id: int):
+        self.consumer.pending_read_id = message_id
+        with patch("a_chat.consumers.fetchrow", sync_to_async(fetchrow_on_test_db)):
+            async_to_sync(self.consumer.flush_read)()
+
+    def test_out_of_range_message_id_is_clamped(self):
+        """채팅방에 없는 message_id로 읽음 처리해도 커서가 마지막 메시지를 넘지 않는지 테스트"""
+        last_id = self.messages[-1].id
+
+        self.flush_read(self.other_message.id + 1000)
+
+        self.room.refresh_from_db()
+        self.assertEqual(self.room.seller_last_read_id, last_id)
+        self.assertEqual(self.consumer.saved_read_id, last_id)
+        event = self.consumer.channel_layer.group_send.call_args.args[1]
+        self.assertEqual(event["message_id"], last_id)
+
+        # 이후 새 메시지는 정상적으로 읽음 처리
+        new_message = ChatMessage.objects.create(
+            chat_room=self.room, sender=self.room.buyer, message="추가 문의"
+        )
+        self.flush_read(new_message.id)
+        self.room.refresh_from_db()
+        self.assertEqual(self.room.seller_last_read_id, new_message.id)
+
+    def test_cursor_never_moves_back(self):
+        """더 작은 message_id는 커서를 되돌리지 않고 읽음 표시도 보내지 않음"""
+        self.flush_read(self.messages[1].id)
+        self.consumer.channel_layer.group_send.reset_mock()
+
+        self.flush_read(self.messages[0].id)
+
+        self.room.refresh_from_db()
+        self.assertEqual(self.room.seller_last_read_id, self.messages[1].id)
+        self.consumer.channel_layer.group_send.assert_not_called()
+
+
+class PresenceServiceTest(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+
+    async def test_offline_only_when_last_connection_drops(self):
+        """두 탭으로 접속하면 한 탭을 닫아도 온라인, 마지막 탭을 닫을 때만 오프라인"""
+        self.assertTrue(await PresenceService.mark_online(1, 7, "tab-1"))
+        self.assertFalse(await PresenceService.mark_online(1, 7, "tab-2"))
+
+        self.assertFalse(await PresenceService.mark_offline(1, 7, "tab-1"))
+        self.assertTrue(await PresenceService.is_online(1, 7))
+
+        self.assertTrue(await PresenceService.mark_offline(1, 7, "tab-2"))
+        self.assertFalse(await PresenceService.is_online(1, 7))
+
+    async def test_connection_expires_without_heartbeat(self):
+        """heartbeat가 없는 연결은 TTL이 지나면 빠지고 남은 연결만 온라인으로 유지"""
+        # 워커가 종료되어 정리되지 않은 연결
+        await cache.aset(PresenceService.key(1, 7), {"stale": time.time() - 1})
+        await PresenceService.mark_online(1, 7, "live")
+
+        self.assertEqual(list(await PresenceService.get_connections(1, 7)), ["live"])
+        self.assertTrue(await PresenceService.mark_offline(1, 7, "live"))
+
+    async def test_heartbeat_reports_expired_peer(self):
+        """상대방 연결이 종료 알림 없이 만료되면 heartbeat 때 오프라인을 전송"""
+        consumer = ChatConsumer()
+        consumer.room_id = "1"
+        consumer.channel_name = "buyer-tab"
+        consumer.user_info = {"id": 7}
+        consumer.peer_id = 8
+        consumer.peer_online = True
+        consumer.send = AsyncMock()
+        await cache.aset(PresenceService.key(1, 8), {"seller-tab": time.time() - 1})
+
+        await consumer.receive(json.dumps({"type": "heartbeat"}))
+        await consumer.receive(json.dumps({"type": "heartbeat"}))
+
+        consumer.send.assert_awaited_once()
+        sent = json.loads(consumer.send.call_args.kwargs["text_data"])
+        self.assertEqual(sent, {"type": "presence", "user_id": 8, "online": False})
+        self.assertTrue(await PresenceService.is_online(1, 7))
+
+
+class TypingThrottleTest(SimpleTestCase):
+    def test_typing_events_coalesced(self):
+        """입력 중 이벤트는 제한 간격 안에서 한 번만, 종료는 시작 후에만 전송되는지 테스트"""
+        throttle = TypingThrottle()
+
+        self.assertFalse(throttle.should_send(False))
+        sent = [throttle.should_send(True) for _ in range(20)]
+        self.assertEqual(sent.count(True), 1)
+        self.assertTrue(throttle.should_send(False))
+        self.assertFalse(throttle.should_send(False))
+        self.assertTrue(throttle.should_send(True))
+
+
+class FakeMessageTable:
+    """
+    chat_message 테이블 대용 - 문장 하나가 id를 순서대로 할당하고 한 번에 커밋
+    네트워크 왕복을 흉내내 다른 워커의 문장과 섞여 실행됨
+    """
+
+    def __init__(self, latency: float = 0):
+        self.rows = []
+        self.next_id = 1
+        self.statements = 0
+        self.latency = latency
+        # 테스트에서 INSERT를 진행 중인 상태로 붙잡아 둘 때 사용
+        self.started = asyncio.Event()
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def fetch(self, query, senders, rooms, messages):
+        self.started.set()
+        await self.release.wait()
+        await asyncio.sleep(self.latency / 2)
+        inserted = []
+        for sender_id, room_id, message in zip(senders, rooms, messages):
+            inserted.append(
+                {
+                    "id": self.next_id,
+                    "sender_id": sender_id,
+                    "chat_room_id": room_id,
+                    "message": message,
+                    "created_at": datetime.now(),
+                }
+            )
+            self.next_id += 1
+        self.rows.extend(inserted)
+        self.statements += 1
+        await asyncio.sleep(self.latency / 2)
+        # RETURNING 순서는 보장되지 않음
+        return list(reversed(inserted))
+
+    def since(self, message_id: int) -> list[dict]:
+        return [row for row in self.rows if row["id"] > message_id]
+
+
+class ChatMessageWriterTest(SimpleTestCase):
+    async def test_interleaved_writers_lose_no_message(self):
+        """
+        두 워커의 묶음 저장이 섞여도 전송된 메시지는 이미 저장되어 있고,
+        since_message_id 동기화로 받는 클라이언트가 메시지를 놓치지 않는지 테스트
+        """
+        table = FakeMessageTable(latency=0.002)
+        writers = [ChatMessageWriter(), ChatMessageWriter()]
+        client = {"cursor": 0, "seen": set()}
+        sent = {}
+
+        async def sender(index: int):
+            await asyncio.sleep(random.random() * 0.01)
+            writer = writers[index % 2]
+            message = f"메시지 {index}"
+            message_id, _ = await writer.write(index, 1, message)
+            sent[message_id] = message
+
+            # 전송 시점에 메시지가 이미 저장되어 있어야 함
+            self.assertIn(message_id, {row["id"] for row in table.rows})
+            # 클라이언트는 알림을 받으면 커서 이후 메시지를 동기화하고 커서를 이동
+            for row in table.since(client["cursor"]):
+                client["seen"].add(row["id"])
+            client["cursor"] = max([client["cursor"], message_id, *client["seen"]])
+
+        with patch("a_chat.writer.fetch", table.fetch):
+            await asyncio.gather(*(sender(i) for i in range(60)))
+            for writer in writers:
+                await writer.close()
+
+        self.assertEqual(len(sent), 60)
+        self.assertEqual(client["seen"], {row["id"] for row in table.rows})
+        self.assertEqual({row["id"]: row["message"] for row in table.rows}, sent)
+        # 동시에 들어온 메시지는 묶어서 저장
+        self.assertLess(table.statements, 60)
+
+    async def test_close_waits_for_in_flight_insert(self):
+        """INSERT가 진행 중일 때 종료해도 그 배치와 뒤에 들어온 메시지를 모두 저장"""
+        table = FakeMessageTable()
+        table.release.clear()
+        writer = ChatMessageWriter()
+
+        with patch("a_chat.writer.fetch", table.fetch):
+            first = asyncio.create_task(writer.write(1, 1, "진행 중"))
+            await table.started.wait()
+            second = asyncio.create_task(writer.write(2, 1, "대기 중"))
+            await asyncio.sleep(0)
+
+            closing = asyncio.create_task(writer.close())
+            await asyncio.sleep(0.01)
+            self.assertFalse(closing.done())
+
+            table.release.set()
+            await asyncio.wait_for(closing, timeout=1)
+            results = await asyncio.wait_for(asyncio.gather(first, second), timeout=1)
+
+        self.assertEqual([row["message"] for row in table.rows], ["진행 중", "대기 중"])
+        self.assertEqual([message_id for message_id, _ in results], [1, 2])
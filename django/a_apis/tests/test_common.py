@@ -0,0 +1,199 @@
+import json
+from datetime import date, datetime, time, timedelta, timezone
+from decimal import Decimal
+
+from a_apis.middleware import ProcessPUTPatchMiddleware
+from a_apis.service.common_parser import CommonParser
+from a_apis.service.common_renderer import CommonRenderer
+from a_user.models import User
+from ninja import Schema
+from ninja.errors import HttpError
+from ninja.renderers import JSONRenderer
+from rest_framework_simplejwt.tokens import AccessToken
+
+from django.core.files.uploadedfile import (
+    InMemoryUploadedFile,
+    SimpleUploadedFile,
+    TemporaryUploadedFile,
+)
+from django.http import HttpResponse
+from django.test import (
+    Client,
+    RequestFactory,
+    SimpleTestCase,
+    TestCase,
+    override_settings,
+)
+from django.test.client import BOUNDARY, MULTIPART_CONTENT, encode_multipart
+
+
+class SampleSchema(Schema):
+    name: str
+
+
+class CommonRendererTest(SimpleTestCase):
+    def test_render_matches_default_renderer(self):
+        """기존 JSONRenderer와 같은 JSON을 만드는지 테스트 (datetime, Decimal 포함)"""
+        data = {
+            "created_at": datetime(2024, 1, 1, 12, 30, 15),
+            "price": Decimal("84.25"),
+            "schema": SampleSchema(name="매물"),
+            "items": [1, 2.5, None, True],
+        }
+
+        rendered = CommonRenderer().render(None, data, response_status=200)
+        expected = JSONRenderer().render(None, data, response_status=200)
+
+        self.assertEqual(json.loads(rendered), json.loads(expected))
+
+    def test_datetime_format_unchanged(self):
+        """datetime 형식이 기존(DjangoJSONEncoder)과 같은지 테스트 (밀리초, UTC는 Z)"""
+        data = {
+            "aware": datetime(2024, 1, 1, 12, 30, 15, 123456, tzinfo=timezone.utc),
+            "naive": datetime(2024, 1, 1, 12, 30, 15, 123456),
+            "offset": datetime(
+                2024, 1, 1, 12, 30, 15, tzinfo=timezone(timedelta(hours=9))
+            ),
+            "date": date(2024, 1, 1),
+            "time": time(12, 30, 15, 123456),
+        }
+
+        rendered = CommonRenderer().render(None, data, response_status=200)
+
+        self.assertEqual(
+            json.loads(rendered),
+            {
+                "aware": "2024-01-01T12:30:15.123Z",
+                "naive": "2024-01-01T12:30:15.123",
+                "offset": "2024-01-01T12:30:15+09:00",
+                "date": "2024-01-01",
+                "time": "12:30:15.123",
+            },
+        )
+        expected = JSONRenderer().render(None, data, response_status=200)
+        self.assertEqual(json.loads(rendered), json.loads(expected))
+
+
+class CommonParserTest(SimpleTestCase):
+    def parse(self, body: bytes):
+        request = RequestFactory().post(
+            "/api/v1/", data=body, content_type="application/json"
+        )
+        return CommonParser().parse_body(request)
+
+    def test_parse_body(self):
+        """문자열 안에 ':'가 있어도 정상적으로 파싱되는지 테스트"""
+        body = '{"url": "https://example.com:8000", "nested": {"time": "18:00"}}'
+        self.assertEqual(
+            self.parse(body.encode()),
+            {"url": "https://example.com:8000", "nested": {"time": "18:00"}},
+        )
+
+    def test_duplicate_keys_rejected(self):
+        """중첩 객체나 문자열 속 ':'와 관계없이 중복 키를 거부하는지 테스트"""
+        bodies = [
+            b'{"email": "a@example.com", "email": "b@example.com"}',
+            b'{"user": {"id": 1, "id": 2}}',
+            b'[{"note": "10:30"}, {"a": 1, "a": 2}]',
+            b'{"a\\u003a": 1, "b": 2, "b": 3}',
+        ]
+        for body in bodies:
+            with self.subTest(body=body):
+                with self.assertRaises(HttpError) as context:
+                    self.parse(body)
+                self.assertEqual(context.exception.status_code, 400)
+
+    @override_settings(API_JSON_MAX_BODY_SIZE=32)
+    def test_large_body_rejected(self):
+        """최대 크기를 넘는 본문은 파싱하지 않고 413으로 거부하는지 테스트"""
+        with self.assertRaises(HttpError) as context:
+            self.parse(b'{"description": "' + b"x" * 64 + b'"}')
+        self.assertEqual(context.exception.status_code, 413)
+
+
+@override_settings(
+    PUT_UPLOAD_MEMORY_THRESHOLD=1024,
+    PUT_UPLOAD_MAX_FILE_SIZE=4096,
+    PUT_UPLOAD_MAX_TOTAL_SIZE=8192,
+)
+class ProcessPUTPatchMiddlewareTest(SimpleTestCase):
+    def put(self, files, read_body: bool = False):
+        data = {"pro_title": "수정된 매물", "images": files}
+        request = RequestFactory().put(
+            "/api/v1/product/update/1",
+            data=encode_multipart(BOUNDARY, data),
+            content_type=MULTIPART_CONTENT,
+        )
+        if read_body:
+            # 앞선 미들웨어가 request.body를 읽고, 스트림까지 소비한 경우
+            request.body
+            request.read()
+        middleware = ProcessPUTPatchMiddleware(lambda request: HttpResponse())
+        return request, middleware(request)
+
+    def image(self, size):
+        return SimpleUploadedFile("photo.jpg", b"x" * size, "image/jpeg")
+
+    def test_multipart_parsed_once(self):
+        """PUT multipart 요청이 request.POST/FILES로 파싱되고 큰 파일은 임시 파일에 저장되는지 테스트"""
+        request, response = self.put([self.image(100)])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(request.POST["pro_title"], "수정된 매물")
+        self.assertIsInstance(request.FILES["images"], InMemoryUploadedFile)
+
+        request, response = self.put([self.image(3000), self.image(3000)])
+        self.assertEqual(response.status_code, 200)
+        images = request.FILES.getlist("images")
+        self.assertEqual([image.size for image in images], [3000, 3000])
+        self.assertTrue(all(isinstance(i, TemporaryUploadedFile) for i in images))
+
+    def test_multipart_parsed_after_body_read(self):
+        """앞선 미들웨어가 request.body를 읽은 뒤에도 읽어둔 본문으로 파싱되는지 테스트"""
+        request, response = self.put([self.image(100)], read_body=True)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(request.POST["pro_title"], "수정된 매물")
+        self.assertEqual(request.FILES["images"].size, 100)
+
+    def test_upload_limits(self):
+        """파일별/전체 크기 제한을 넘으면 413을 반환하는지 테스트"""
+        _, response = self.put([self.image(5000)])
+        self.assertEqual(response.status_code, 413)
+
+        _, response = self.put([self.image(3000) for _ in range(3)])
+        self.assertEqual(response.status_code, 413)
+
+
+class HealthStatsAuthTest(TestCase):
+    def setUp(self):
+        self.client = Client()
+
+    def get(self, path: str, user: User = None):
+        headers = {}
+        if user:
+            headers["HTTP_AUTHORIZATION"] = f"Bearer {AccessToken.for_user(user)}"
+        return self.client.get(path, **headers)
+
+    def test_internal_stats_require_staff(self):
+        """내부 통계는 스태프 계정만 조회 가능"""
+        member = User.objects.create_user(
+            username="member", email="member@example.com", password="testpass123"
+        )
+        staff = User.objects.create_user(
+            username="staff",
+            email="staff@example.com",
+            password="testpass123",
+            is_staff=True,
+        )
+
+        for path in (
+            "/api/health/db-pool",
+            "/api/health/db-queries",
+            "/api/health/email-outbox",
+        ):
+            with self.subTest(path=path):
+                self.assertEqual(self.get(path).status_code, 401)
+                self.assertEqual(self.get(path, member).status_code, 401)
+
+        self.assertEqual(self.get("/api/health/email-outbox", staff).status_code, 200)
+        self.assertEqual(self.get("/api/health").status_code, 200)
@@ -0,0 +1,379 @@
+import json
+import os
+import shutil
+import tempfile
+from io import BytesIO
+from unittest import mock
+
+from a_apis.models.products import (
+    ProductAddress,
+    ProductDetail,
+    ProductImg,
+    ProductLikes,
+)
+from a_apis.schema.products import ProductRequestBodySchema
+from a_apis.service.geo import GeoService
+from a_apis.service.media import ImageDerivativeService
+from a_apis.service.products import ProductService
+from a_user.models import User
+from PIL import Image
+from rest_framework_simplejwt.tokens import AccessToken
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files.storage import FileSystemStorage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+
+def create_product(user, latitude, longitude, **kwargs):
+    address = ProductAddress.objects.create(
+        add_new="서울특별시 중구 세종대로 110",
+        add_old="서울특별시 중구 태평로1가 31",
+        latitude=latitude,
+        longitude=longitude,
+    )
+    data = {
+        "user": user,
+        "pro_title": "테스트 매물",
+        "pro_price": 10000,
+        "pro_supply_a": 20,
+        "pro_site_a": 30,
+        "pro_heat": "gas",
+        "pro_type": "detached",
+        "pro_floor": 1,
+        "description": "테스트 설명",
+        "pro_rooms": 2,
+        "pro_bathrooms": 1,
+        "pro_construction_year": 2000,
+        "address": address,
+    }
+    data.update(kwargs)
+    return ProductDetail.objects.create(**data)
+
+
+class GeoServiceTest(TestCase):
+    def test_encode_geohash(self):
+        """알려진 좌표의 geohash 인코딩 테스트"""
+        self.assertEqual(
+            GeoService.encode_geohash(57.64911, 10.40744, 11), "u4pruydqqvj"
+        )
+
+    def test_address_geohash_synced_on_save(self):
+        """주소 저장 시 geohash가 위경도와 함께 갱신되는지 테스트"""
+        user = User.objects.create_user(
+            username="seller", email="seller@example.com", password="testpass123"
+        )
+        product = create_product(user, 37.5665, 126.9780)
+        address = product.address
+        self.assertEqual(address.geohash, GeoService.encode_geohash(37.5665, 126.9780))
+
+        address.latitude = 35.1796
+        address.longitude = 129.0756
+        address.save()
+        address.refresh_from_db()
+        self.assertEqual(address.geohash, GeoService.encode_geohash(35.1796, 129.0756))
+
+
+class NearbyProductsTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="seller", email="seller@example.com", password="testpass123"
+        )
+
+    def test_nearby_products_uses_geohash_cells(self):
+        """geohash 셀 범위 조회로 반경 안의 매물만 조회되는지 테스트"""
+        seoul = create_product(self.user, 37.5665, 126.9780)
+        create_product(self.user, 35.1796, 129.0756)  # 부산
+
+        response = ProductService.get_nearby_products(None, 37.5660, 126.9770, 16)
+
+        self.assertTrue(response.success)
+        self.assertEqual([p.product_id for p in response.products], [seoul.id])
+
+    def test_nearby_products_clustered_at_low_zoom(self):
+        """낮은 줌 레벨에서는 개별 매물 대신 셀 단위 클러스터를 반환하는지 테스트"""
+        create_product(self.user, 37.5665, 126.9780, pro_price=10000)
+        create_product(self.user, 37.5666, 126.9781, pro_price=30000)
+        create_product(self.user, 35.1796, 129.0756, pro_price=20000)  # 부산
+
+        response = ProductService.get_nearby_products(None, 37.5660, 126.9770, 9)
+
+        self.assertTrue(response.success)
+        self.assertTrue(response.clustered)
+        self.assertEqual(response.products, [])
+        self.assertEqual(response.total_count, 3)
+        self.assertEqual(sum(c.count for c in response.clusters), 3)
+
+        seoul = next(c for c in response.clusters if c.count == 2)
+        self.assertEqual((seoul.min_price, seoul.max_price), (10000, 30000))
+
+
+class ProductLikeStatusTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="seller", email="seller@example.com", password="testpass123"
+        )
+
+    def create_products(self, count):
+        products = [create_product(self.user, 37.5665, 126.9780) for _ in range(count)]
+        ProductLikes.objects.create(user=self.user, product=products[0], is_liked=True)
+        return products
+
+    def count_like_queries(self, func):
+        with CaptureQueriesContext(connection) as context:
+            response = func()
+        like_queries = [
+            q for q in context.captured_queries if "product_like" in q["sql"]
+        ]
+        return response, len(like_queries)
+
+    def test_like_status_query_count_is_constant(self):
+        """목록 크기와 관계없이 찜 여부 조회 쿼리 수가 일정한지 테스트"""
+        products = self.create_products(2)
+        _, small_count = self.count_like_queries(
+            lambda: ProductService.mylist_products(self.user)
+        )
+
+        products += self.create_products(8)
+        response, large_count = self.count_like_queries(
+            lambda: ProductService.mylist_products(self.user)
+        )
+
+        self.assertEqual(small_count, 1)
+        self.assertEqual(large_count, small_count)
+
+        liked = {p.product_id for p in response.products if p.is_liked}
+        self.assertEqual(liked, {products[0].id, products[2].id})
+
+    def test_nearby_like_status_query_count_is_constant(self):
+        """주변 매물 조회에서도 찜 여부 조회 쿼리 수가 일정한지 테스트"""
+        self.create_products(2)
+        _, small_count = self.count_like_queries(
+            lambda: ProductService.get_nearby_products(self.user, 37.566, 126.977, 16)
+        )
+
+        self.create_products(8)
+        response, large_count = self.count_like_queries(
+            lambda: ProductService.get_nearby_products(self.user, 37.566, 126.977, 16)
+        )
+
+        self.assertEqual(len(response.products), 10)
+        self.assertEqual(large_count, small_count)
+
+    def test_list_query_count_is_constant(self):
+        """목록 조회 시 매물마다 이미지를 조회하지 않고 쿼리 수가 일정한지 테스트"""
+        self.create_products(2)
+        with CaptureQueriesContext(connection) as small:
+            ProductService.mylist_products(self.user)
+
+        self.create_products(8)
+        with CaptureQueriesContext(connection) as large:
+            ProductService.mylist_products(self.user)
+
+        self.assertEqual(len(large), len(small))
+        self.assertFalse(any("product_img" in q["sql"] for q in large.captured_queries))
+
+
+class ProductPaginationTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="seller", email="seller@example.com", password="testpass123"
+        )
+        self.products = [create_product(self.user, 37.5665, 126.9780) for _ in range(5)]
+
+    def test_mylist_products_cursor_pagination(self):
+        """커서를 따라가며 중복/누락 없이 최신순으로 조회되는지 테스트"""
+        seen = []
+        cursor = None
+        while True:
+            response = ProductService.mylist_products(self.user, cursor, 2)
+            seen += [p.product_id for p in response.products]
+            cursor = response.next_cursor
+            if not cursor:
+                break
+
+        expected = [
+            p.id
+            for p in sorted(
+                self.products, key=lambda p: (p.created_at, p.id), reverse=True
+            )
+        ]
+        self.assertEqual(seen, expected)
+
+    def test_invalid_cursor(self):
+        """잘못된 커서는 400 응답을 반환하는지 테스트"""
+        response = ProductService.mylist_products(self.user, "invalid-cursor", 2)
+        self.assertEqual(response.status_code, 400)
+
+
+class ProductDetailCacheTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.seller = User.objects.create_user(
+            username="seller",
+            email="seller@example.com",
+            password="testpass123",
+            phone_number="01012345678",
+        )
+        self.buyer = User.objects.create_user(
+            username="buyer", email="buyer@example.com", password="testpass123"
+        )
+        self.product = create_product(self.seller, 37.5665, 126.9780)
+
+    def test_detail_cached_with_per_user_like(self):
+        """상세 정보는 캐시에서 읽고, 찜 여부만 사용자별로 조회하는지 테스트"""
+        ProductService.get_product_detail(self.buyer, self.product.id)
+        ProductLikes.objects.create(
+            user=self.buyer, product=self.product, is_liked=True
+        )
+
+        with self.assertNumQueries(1):
+            liked = ProductService.get_product_detail(self.buyer, self.product.id)
+        with self.assertNumQueries(0):
+            anonymous = ProductService.get_product_detail(None, self.product.id)
+
+        self.assertTrue(liked.product.is_liked)
+        self.assertFalse(anonymous.product.is_liked)
+        self.assertEqual(liked.product.pro_title, self.product.pro_title)
+
+    def test_seller_profile_update_reflected(self):
+        """판매자가 회원 정보를 수정하면 캐시된 매물 상세에도 바로 반영되는지 테스트"""
+        ProductService.get_product_detail(None, self.product.id)
+
+        response = self.client.put(
+            "/api/users/update-profile",
+            data=json.dumps({"username": "renamed", "phone_number": "01099998888"}),
+            content_type="application/json",
+            HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(self.seller)}",
+        )
+        self.assertEqual(response.status_code, 200)
+
+        detail = ProductService.get_product_detail(None, self.product.id)
+        self.assertEqual(detail.product.user.username, "renamed")
+        self.assertEqual(detail.product.user.phone_number, "01099998888")
+
+    def test_detail_cache_invalidated_on_delete(self):
+        """매물 삭제 시 상세 캐시가 무효화되는지 테스트"""
+        ProductService.get_product_detail(None, self.product.id)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            ProductService.delete_product(self.seller, self.product.id)
+
+        response = ProductService.get_product_detail(None, self.product.id)
+        self.assertEqual(response.status_code, 404)
+
+
+class ProductMediaUploadTest(TestCase):
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.settings_override = override_settings(MEDIA_ROOT=self.media_root)
+        self.settings_override.enable()
+        self.user = User.objects.create_user(
+            username="seller", email="seller@example.com", password="testpass123"
+        )
+        self.data = ProductRequestBodySchema(
+            pro_title="테스트 매물",
+            pro_price=10000,
+            pro_supply_a=20,
+            pro_site_a=30,
+            pro_heat="gas",
+            pro_type="detached",
+            pro_floor=1,
+            description="테스트 설명",
+            pro_rooms=2,
+            pro_bathrooms=1,
+            pro_construction_year=2000,
+            add_new="서울특별시 중구 세종대로 110",
+            add_old="서울특별시 중구 태평로1가 31",
+            latitude=37.5665,
+            longitude=126.9780,
+        )
+
+    def tearDown(self):
+        self.settings_override.disable()
+        shutil.rmtree(self.media_root, ignore_errors=True)
+
+    def uploaded_files(self):
+        files = []
+        for root, _, names in os.walk(self.media_root):
+            files += [os.path.join(root, name) for name in names]
+        return files
+
+    def images(self, *names):
+        return [SimpleUploadedFile(name, b"image-data", "image/jpeg") for name in names]
+
+    def test_create_product_uploads_media(self):
+        """이미지/동영상이 모두 업로드되고 이미지 레코드가 생성되는지 테스트"""
+        video = SimpleUploadedFile("tour.mp4", b"video-data", "video/mp4")
+
+        response = ProductService.create_product(
+            self.user, self.data, self.images("a.jpg", "b.jpg", "c.jpg"), video
+        )
+
+        self.assertTrue(response.success)
+        self.assertEqual(len(self.uploaded_files()), 4)
+        product = ProductDetail.objects.get(id=response.product.product_id)
+        self.assertEqual(
+            [img.img_url.name for img in product.product_images.order_by("id")],
+            response.product.images,
+        )
+        self.assertEqual(product.cover_image, response.product.images[0])
+        self.assertIsNotNone(response.product.video)
+
+    def test_create_product_cleans_up_failed_upload(self):
+        """업로드 중 하나라도 실패하면 올라간 파일과 DB 레코드를 남기지 않는지 테스트"""
+        original_save = FileSystemStorage._save
+
+        def failing_save(storage, name, content):
+            if content.name == "broken.jpg":
+                raise OSError("upload failed")
+            return original_save(storage, name, content)
+
+        with mock.patch.object(FileSystemStorage, "_save", failing_save):
+            response = ProductService.create_product(
+                self.user, self.data, self.images("a.jpg", "broken.jpg"), None
+            )
+
+        self.assertEqual(response.status_code, 500)
+        self.assertEqual(self.uploaded_files(), [])
+        self.assertFalse(ProductDetail.objects.exists())
+        self.assertFalse(ProductImg.objects.exists())
+
+    def test_image_derivatives_generated_after_commit(self):
+        """커밋 이후 썸네일/웹 최적화본이 생성되고 목록에서 썸네일을 사용하는지 테스트"""
+        buffer = BytesIO()
+        Image.new("RGB", (2000, 1000), "red").save(buffer, format="JPEG")
+        photo = SimpleUploadedFile("photo.jpg", buffer.getvalue(), "image/jpeg")
+        # 백그라운드 스레드 대신 즉시 실행
+        executor = mock.Mock(
+            submit=lambda func, *args: ImageDerivativeService.generate(*args)
+        )
+
+        with mock.patch.object(
+            ImageDerivativeService, "_get_executor", return_value=executor
+        ):
+            with self.captureOnCommitCallbacks() as callbacks:
+                response = ProductService.create_product(
+                    self.user, self.data, [photo], None
+                )
+            # 요청 처리 시점에는 아직 원본 이미지를 사용
+            listing = ProductService.mylist_products(self.user)
+            self.assertEqual(listing.products[0].images, response.product.images[0])
+
+            for callback in callbacks:
+                callback()
+
+        img = ProductImg.objects.get(product_detail_id=response.product.product_id)
+        media_url = len(settings.MEDIA_URL)
+        with Image.open(
+            os.path.join(self.media_root, img.thumbnail_url[media_url:])
+        ) as f:
+            self.assertEqual(f.size, (320, 320))
+        with Image.open(os.path.join(self.media_root, img.web_url[media_url:])) as f:
+            self.assertEqual(f.size, (1280, 640))
+
+        listing = ProductService.mylist_products(self.user)
+        self.assertEqual(listing.products[0].images, img.thumbnail_url)
@@ -1,15 +1,51 @@
 import json
 from datetime import timedelta
+from io import StringIO
+from unittest.mock import patch
 
+from a_apis.auth.bearer import AuthBearer
+from a_apis.auth.user_cache import UserCache
+from a_apis.management.commands.drain_email_outbox import (
+    Command as DrainEmailOutboxCommand,
+)
+from a_apis.models.email_outbox import EmailOutbox
 from a_apis.models.email_verification import EmailVerification
+from a_apis.service.email_outbox import EmailOutboxService
+from a_apis.service.email_verification import (
+    EXPIRED,
+    INVALID,
+    VERIFIED,
+    CacheVerificationStore,
+    DatabaseVerificationStore,
+    get_verification_store,
+)
+from a_apis.service.users import UserService
 from a_user.models import User
+from rest_framework_simplejwt.tokens import AccessToken
 
 from django.core import mail
-from django.test import Client, TestCase
+from django.core.cache import cache
+from django.core.mail.backends.locmem import EmailBackend as LocmemEmailBackend
+from django.core.management import call_command
+from django.test import Client, RequestFactory, TestCase
 from django.test.utils import override_settings
 from django.utils import timezone
 
 
+class CountingEmailBackend(LocmemEmailBackend):
+    # 배치마다 SMTP 연결을 몇 번 만드는지 확인용
+    connections = 0
+
+    def open(self):
+        CountingEmailBackend.connections += 1
+        return super().open()
+
+
+class FailingEmailBackend(LocmemEmailBackend):
+    def send_messages(self, messages):
+        raise ConnectionError("SMTP unavailable")
+
+
 @override_settings(EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend")
 class UserLoginTest(TestCase):
     def setUp(self):
@@ -30,8 +66,13 @@ class UserLoginTest(TestCase):
             content_type="application/json",
         )
 
-        # 이메일 발송 여부 및 내용 확인
+        # 요청 안에서는 발송하지 않고 대기열에만 저장
         self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(mail.outbox), 0)
+        self.assertEqual(EmailOutbox.objects.filter(to_email=self.email).count(), 1)
+
+        # 워커가 대기열을 발송한 뒤 이메일 발송 여부 및 내용 확인
+        EmailOutboxService.drain()
         self.assertTrue(
             len(mail.outbox) > 0, "이메일이 발송되지 않았습니다"
         )  # 수정된 부분
@@ -42,6 +83,20 @@ class UserLoginTest(TestCase):
                 0
             ]
 
+    @override_settings(EMAIL_VERIFICATION_CODE_TTL=60 * 10)
+    def test_verification_email_states_code_ttl(self):
+        """인증 메일의 유효 시간 안내가 EMAIL_VERIFICATION_CODE_TTL을 따르는지 테스트"""
+        self.client.post(
+            "/api/users/request-email-verification",
+            data=json.dumps({"email": self.email}),
+            content_type="application/json",
+        )
+        EmailOutboxService.drain()
+
+        sent_mail = mail.outbox[0]
+        self.assertIn("10분 동안 유효합니다", sent_mail.body)
+        self.assertIn("10분 동안 유효합니다", sent_mail.alternatives[0][0])
+
     def test_verify_email_success(self):
         """이메일 인증 테스트"""
         # 먼저 이메일 인증 요청을 보내서 인증번호를 받아옴
@@ -85,3 +140,283 @@ class UserLoginTest(TestCase):
         self.assertIn("user", response_data)
         self.assertEqual(response_data["user"]["email"], signup_data["email"])
         self.assertEqual(response_data["user"]["username"], signup_data["username"])
+
+
+@override_settings(EMAIL_BACKEND="a_apis.tests.test_users.CountingEmailBackend")
+class EmailOutboxTest(TestCase):
+    def setUp(self):
+        mail.outbox = []
+        CountingEmailBackend.connections = 0
+
+    def test_drain_reuses_one_connection(self):
+        """배치 하나를 SMTP 연결 하나로 발송"""
+        for i in range(3):
+            EmailOutboxService.enqueue(
+                f"user{i}@example.com", "제목", "본문", "<p>본문</p>"
+            )
+
+        result = EmailOutboxService.drain()
+
+        self.assertEqual(result["sent"], 3)
+        self.assertEqual(len(mail.outbox), 3)
+        self.assertEqual(CountingEmailBackend.connections, 1)
+        self.assertEqual(
+            EmailOutbox.objects.filter(status=EmailOutbox.STATUS_SENT).count(), 3
+        )
+        self.assertEqual(EmailOutboxService.drain()["claimed"], 0)
+
+    @override_settings(
+        EMAIL_BACKEND="a_apis.tests.test_users.FailingEmailBackend",
+        EMAIL_OUTBOX_MAX_ATTEMPTS=2,
+    )
+    def test_failed_send_retries_with_backoff(self):
+        """발송 실패 시 backoff 후 재시도하고, 최대 횟수를 넘으면 실패 처리"""
+        message = EmailOutboxService.enqueue("user@example.com", "제목", "본문")
+
+        self.assertEqual(EmailOutboxService.drain()["retried"], 1)
+        message.refresh_from_db()
+        self.assertEqual(message.status, EmailOutbox.STATUS_PENDING)
+        self.assertEqual(message.attempts, 1)
+        self.assertGreater(message.next_attempt_at, timezone.now())
+        # backoff 동안은 다시 발송하지 않음
+        self.assertEqual(EmailOutboxService.drain()["claimed"], 0)
+
+        EmailOutbox.objects.filter(id=message.id).update(next_attempt_at=timezone.now())
+        self.assertEqual(EmailOutboxService.drain()["failed"], 1)
+        message.refresh_from_db()
+        self.assertEqual(message.status, EmailOutbox.STATUS_FAILED)
+        self.assertIn("SMTP unavailable", message.last_error)
+        self.assertEqual(EmailOutboxService.get_stats()["failed"], 1)
+
+    def test_prune_deletes_old_sent_and_failed(self):
+        """보관 기간이 지난 발송 완료/실패 이메일만 삭제하고 대기 중인 이메일은 유지"""
+        old = timezone.now() - timedelta(days=40)
+        for status in (
+            EmailOutbox.STATUS_SENT,
+            EmailOutbox.STATUS_FAILED,
+            EmailOutbox.STATUS_PENDING,
+        ):
+            message = EmailOutboxService.enqueue("user@example.com", "제목", "본문")
+            EmailOutbox.objects.filter(id=message.id).update(
+                status=status, created_at=old
+            )
+        recent = EmailOutboxService.enqueue("user@example.com", "제목", "본문")
+        EmailOutbox.objects.filter(id=recent.id).update(status=EmailOutbox.STATUS_SENT)
+
+        result = EmailOutboxService.prune(batch_size=1)
+
+        self.assertEqual(result, {"sent": 1, "failed": 1})
+        self.assertEqual(
+            set(EmailOutbox.objects.values_list("status", flat=True)),
+            {EmailOutbox.STATUS_PENDING, EmailOutbox.STATUS_SENT},
+        )
+        self.assertTrue(EmailOutbox.objects.filter(id=recent.id).exists())
+
+    def test_worker_loop_prunes_periodically(self):
+        """발송 워커는 EMAIL_OUTBOX_PRUNE_INTERVAL마다 한 번만 정리"""
+        command = DrainEmailOutboxCommand(stdout=StringIO(), stderr=StringIO())
+        with patch.object(
+            EmailOutboxService, "prune", return_value={"sent": 0, "failed": 0}
+        ) as prune:
+            last_pruned = command.prune_if_due(float("-inf"))
+            self.assertEqual(command.prune_if_due(last_pruned), last_pruned)
+        prune.assert_called_once()
+
+    def test_worker_loop_prunes_expired_verifications(self):
+        """발송 워커가 만료된 이메일 인증도 함께 정리"""
+        verification = EmailVerification.objects.create(email="old@example.com")
+        EmailVerification.objects.filter(id=verification.id).update(
+            expires_at=timezone.now() - timedelta(minutes=1)
+        )
+
+        command = DrainEmailOutboxCommand(stdout=StringIO(), stderr=StringIO())
+        command.prune_if_due(float("-inf"))
+
+        self.assertFalse(EmailVerification.objects.filter(id=verification.id).exists())
+
+    @override_settings(EMAIL_OUTBOX_POLL_INTERVAL=5)
+    def test_retry_scheduled_without_new_email(self):
+        """backoff 중인 이메일이 남아 있으면 새 이메일이 없어도 다음 시도 시간에 발송 예약"""
+        message = EmailOutboxService.enqueue("user@example.com", "제목", "본문")
+        EmailOutbox.objects.filter(id=message.id).update(
+            next_attempt_at=timezone.now() + timedelta(seconds=120)
+        )
+
+        with patch("a_apis.service.email_outbox.threading.Timer") as timer:
+            timer.return_value.is_alive.return_value = True
+            self.addCleanup(setattr, EmailOutboxService, "_retry_timer", None)
+            EmailOutboxService.schedule_retry()
+            # 이미 더 빠른 예약이 있으면 다시 예약하지 않음
+            EmailOutboxService.schedule_retry()
+
+        timer.assert_called_once()
+        delay, callback = timer.call_args.args
+        self.assertAlmostEqual(delay, 120, delta=2)
+        self.assertEqual(callback, EmailOutboxService.schedule_drain)
+        timer.return_value.start.assert_called_once()
+
+    def test_no_retry_scheduled_when_queue_empty(self):
+        """발송할 이메일이 없으면 예약하지 않음"""
+        with patch("a_apis.service.email_outbox.threading.Timer") as timer:
+            EmailOutboxService.schedule_retry()
+        timer.assert_not_called()
+
+
+@override_settings(EMAIL_VERIFICATION_STORE="cache")
+class CacheVerificationStoreLoginTest(UserLoginTest):
+    """Redis(캐시) 인증 저장소로 같은 인증/회원가입 흐름 테스트"""
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+
+    def test_verification_not_stored_in_database(self):
+        self.test_verify_email_success()
+
+        self.assertFalse(EmailVerification.objects.exists())
+        self.assertTrue(get_verification_store().is_verified(self.email))
+
+
+class EmailVerificationStoreTest(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_verify_results(self):
+        """저장소별 인증번호 확인 결과 (잘못된 번호, 만료, 성공)"""
+        for store in (DatabaseVerificationStore, CacheVerificationStore):
+            with self.subTest(store=store.__name__):
+                email = f"{store.__name__}@example.com"
+                code = store.issue(email)
+                wrong = "000000" if code != "000000" else "111111"
+
+                self.assertEqual(store.verify(email, wrong), INVALID)
+                with override_settings(EMAIL_VERIFICATION_CODE_TTL=-1):
+                    expired_code = store.issue(email)
+                self.assertEqual(store.verify(email, expired_code), EXPIRED)
+                self.assertFalse(store.is_verified(email))
+
+                code = store.issue(email)
+                self.assertEqual(store.verify(email, code), VERIFIED)
+                self.assertTrue(store.is_verified(email))
+
+                store.clear(email)
+                self.assertFalse(store.is_verified(email))
+
+    def test_prune_email_verifications(self):
+        """만료된 미인증과 오래된 인증 완료 데이터만 삭제"""
+        now = timezone.now()
+        EmailVerification.objects.create(email="expired@example.com")
+        EmailVerification.objects.create(email="active@example.com")
+        EmailVerification.objects.create(email="old@example.com", is_verified=True)
+        EmailVerification.objects.create(email="recent@example.com", is_verified=True)
+        EmailVerification.objects.filter(email="expired@example.com").update(
+            expires_at=now - timedelta(minutes=1)
+        )
+        EmailVerification.objects.filter(email="old@example.com").update(
+            expires_at=now - timedelta(days=2)
+        )
+
+        call_command("prune_email_verifications", "--batch-size=1", stdout=StringIO())
+
+        self.assertEqual(
+            set(EmailVerification.objects.values_list("email", flat=True)),
+            {"active@example.com", "recent@example.com"},
+        )
+
+
+class AuthUserCacheTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username="testuser", email="test@example.com", password="testpass123"
+        )
+        self.token = str(AccessToken.for_user(self.user))
+
+    def test_authenticated_user_cached(self):
+        """두 번째 요청부터는 DB 조회 없이 캐시된 유저로 인증되는지 테스트"""
+        factory = RequestFactory()
+        AuthBearer().authenticate(factory.get("/"), self.token)
+
+        request = factory.get("/")
+        with self.assertNumQueries(0):
+            AuthBearer().authenticate(request, self.token)
+        self.assertEqual(request.user.id, self.user.id)
+
+    def test_user_cache_invalidated_on_profile_update(self):
+        """회원 정보 수정 후에는 변경된 유저 정보로 인증되는지 테스트"""
+        headers = {"HTTP_AUTHORIZATION": f"Bearer {self.token}"}
+        response = self.client.put(
+            "/api/users/update-profile",
+            data=json.dumps({"username": "renamed"}),
+            content_type="application/json",
+            **headers,
+        )
+        self.assertEqual(response.status_code, 200)
+
+        request = RequestFactory().get("/")
+        AuthBearer().authenticate(request, self.token)
+        self.assertEqual(request.user.username, "renamed")
+
+    def test_cache_holds_no_password(self):
+        """캐시에는 인증에 필요한 필드만 저장하고 비밀번호 해시는 저장하지 않음"""
+        AuthBearer().authenticate(RequestFactory().get("/"), self.token)
+
+        cached = cache.get(UserCache.key(self.user.id))
+        self.assertEqual(set(cached), set(UserCache.FIELDS))
+        self.assertNotIn("password", cached)
+
+    def test_profile_update_keeps_newer_fields(self):
+        """캐시된 유저가 오래되어도 회원 정보 수정이 다른 필드의 최신 값을 덮어쓰지 않음"""
+        headers = {"HTTP_AUTHORIZATION": f"Bearer {self.token}"}
+        AuthBearer().authenticate(RequestFactory().get("/"), self.token)
+        # 캐시된 뒤 다른 요청에서 변경된 값
+        User.objects.filter(id=self.user.id).update(phone_number="01099998888")
+
+        response = self.client.put(
+            "/api/users/update-profile",
+            data=json.dumps({"username": "renamed"}),
+            content_type="application/json",
+            **headers,
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.username, "renamed")
+        self.assertEqual(self.user.phone_number, "01099998888")
+        self.assertTrue(self.user.check_password("testpass123"))
+
+
+class UserSessionCheckTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username="testuser",
+            email="test@example.com",
+            password="testpass123",
+            phone_number="01012345678",
+        )
+        self.headers = {
+            "HTTP_AUTHORIZATION": f"Bearer {AccessToken.for_user(self.user)}"
+        }
+
+    def test_me_does_not_issue_tokens_by_default(self):
+        """기본(check) 모드는 토큰 발급/DB 조회 없이 사용자 정보와 만료 시간만 반환하는지 테스트"""
+        self.client.get("/api/users/me", **self.headers)
+
+        with self.assertNumQueries(0):
+            response = self.client.get("/api/users/me", **self.headers)
+
+        data = response.json()
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("tokens", data)
+        self.assertIsNotNone(data["expires_at"])
+        self.assertEqual(data["user"]["email"], self.user.email)
+        self.assertNotIn("Deprecation", response)
+
+    def test_me_token_issue_is_deprecated(self):
+        """check=false는 제거 전까지 토큰을 발급하고 지원 중단 헤더를 함께 반환"""
+        response = self.client.get("/api/users/me?check=false", **self.headers)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("access", response.json()["tokens"])
+        self.assertEqual(response["Deprecation"], "true")
+        self.assertEqual(response["Sunset"], UserService.TOKEN_ISSUE_SUNSET)
@@ -1,8 +1,13 @@
+import asyncio
 import json
 from logging import getLogger
 
 import jwt
-from a_core.db import execute_query, init_db
+from a_apis.service.common_renderer import dumps_str
+from a_chat.membership import RoomMembershipCache
+from a_chat.presence import PresenceService, TypingThrottle
+from a_chat.writer import INSERT_MESSAGE_QUERY, ChatMessageWriter
+from a_core.db import fetch, fetchrow, register_query
 from channels.exceptions import StopConsumer
 from channels.generic.websocket import AsyncWebsocketConsumer
 
@@ -10,6 +15,58 @@ from django.conf import settings
 
 logger = getLogger(__name__)
 
+HISTORY_COLUMNS = """
+    SELECT cm.id, cm.message, cm.sender_id, cm.chat_room_id,
+           cm.created_at, cm.updated_at,
+           u.username as sender_username, u.email as sender_email
+    FROM chat_message cm
+    JOIN users u ON cm.sender_id = u.id
+"""
+# 최근 메시지 (재연결 시 $2 이후만)
+HISTORY_QUERY = register_query(
+    "chat.history",
+    HISTORY_COLUMNS
+    + """
+    WHERE cm.chat_room_id = $1 AND cm.id > $2
+    ORDER BY cm.id DESC
+    LIMIT $3
+    """,
+)
+# $2 이전 메시지 페이지
+HISTORY_BEFORE_QUERY = register_query(
+    "chat.history_before",
+    HISTORY_COLUMNS
+    + """
+    WHERE cm.chat_room_id = $1 AND cm.id < $2
+    ORDER BY cm.id DESC
+    LIMIT $3
+    """,
+)
+# 읽음 커서는 앞으로만 이동하고, 채팅방의 마지막 메시지를 넘지 않음
+# (클라이언트가 보낸 message_id가 다른 채팅방이나 아직 없는 메시지를 가리켜도 커서가 앞서가지 않도록)
+MARK_READ_BUYER_QUERY = register_query(
+    "chat.mark_read_buyer",
+    """
+    UPDATE chat_room SET buyer_last_read_id = GREATEST(
+        buyer_last_read_id,
+        LEAST($2, (SELECT COALESCE(MAX(id), 0) FROM chat_message WHERE chat_room_id = $1))
+    )
+    WHERE id = $1
+    RETURNING buyer_last_read_id AS last_read_id
+    """,
+)
+MARK_READ_SELLER_QUERY = register_query(
+    "chat.mark_read_seller",
+    """
+    UPDATE chat_room SET seller_last_read_id = GREATEST(
+        seller_last_read_id,
+        LEAST($2, (SELECT COALESCE(MAX(id), 0) FROM chat_message WHERE chat_room_id = $1))
+    )
+    WHERE id = $1
+    RETURNING seller_last_read_id AS last_read_id
+    """,
+)
+
 
 class ChatConsumer(AsyncWebsocketConsumer):
     async def connect(self):
@@ -34,80 +91,31 @@ class ChatConsumer(AsyncWebsocketConsumer):
                 # 유저 정보 저장
                 self.user_id = user_id
 
-                # 여기서부터 DB 연결 로직
-                await init_db()
+                # 여기서부터 DB 연결 로직 (커넥션 풀은 lifespan/첫 쿼리에서 한 번만 생성)
                 self.room_id = self.scope["url_route"]["kwargs"]["room_id"]
                 self.room_group_name = f"chat_{self.room_id}"
 
-                # 유저정보 가져오기
-                user_record = await execute_query(
-                    """
-                    SELECT * FROM users WHERE id = $1
-                """,
-                    int(self.user_id),
-                )
-
-                self.user_info = {}
-                self.user_info["id"] = user_record[0]["id"]
-                self.user_info["username"] = user_record[0]["username"]
-                self.user_info["email"] = user_record[0]["email"]
-
-                # 채팅방이 있는지 검사해서, 없으면 연결끊기
-                chat_room = await execute_query(
-                    """
-                    SELECT * FROM chat_room WHERE id = $1
-                """,
-                    int(self.room_id),
-                )
-
-                item = await execute_query(
-                    """
-                    SELECT * FROM product_detail WHERE id = $1
-                """,
-                    int(chat_room[0]["item_id"]),
+                # 유저 정보와 채팅방 권한(구매자/판매자)을 한 번에 확인
+                # 채팅방이 없거나 권한이 없으면 연결끊기
+                member = await RoomMembershipCache.get_member(
+                    int(self.user_id), int(self.room_id)
                 )
-
-                prev_messages = await execute_query(
-                    """
-                    SELECT cm.*, u.username as sender_username, u.email as sender_email 
-                    FROM chat_message cm
-                    JOIN users u ON cm.sender_id = u.id
-                    WHERE cm.chat_room_id = $1
-                    """,
-                    int(self.room_id),
-                )
-
-                # Record 객체를 딕셔너리로 변환
-                formatted_messages = []
-                for msg in prev_messages:
-                    formatted_messages.append(
-                        {
-                            "id": msg["id"],
-                            "message": msg["message"],
-                            "sender": {
-                                "id": msg["sender_id"],
-                                "username": msg["sender_username"],
-                                "email": msg["sender_email"],
-                            },
-                            "chat_room_id": msg["chat_room_id"],
-                            "created_at": msg["created_at"].isoformat(),
-                            "updated_at": msg["updated_at"].isoformat(),
-                        }
-                    )
-
-                buyer_id = chat_room[0]["buyer_id"]
-                seller_id = item[0]["user"]
-
-                if (not buyer_id == self.user_id) and (not seller_id == self.user_id):
-                    logger.error("접근 권한이 없습니다.")
+                if not member:
+                    logger.error("채팅방이 없거나 접근 권한이 없습니다.")
                     await self.close()
                     return
+                self.is_buyer = member["is_buyer"]
+                self.peer_id = member["peer_id"]
+                self.user_info = {
+                    "id": member["id"],
+                    "username": member["username"],
+                    "email": member["email"],
+                }
 
-                # chat_room이 리스트로 반환되므로, 존재 여부만 확인
-                if not chat_room:
-                    logger.error("채팅방이 없습니다.")
-                    await self.close()
-                    return
+                # 읽음 커서 (짧은 시간 동안의 읽음 이벤트는 가장 큰 id 하나만 저장)
+                self.pending_read_id = 0
+                self.saved_read_id = 0
+                self.read_flush_task = None
 
                 # 채널 레이어 연결 상태 확인
                 if not self.channel_layer:
@@ -125,14 +133,44 @@ class ChatConsumer(AsyncWebsocketConsumer):
                     await self.close()
                     return
 
+                # 재연결 시 마지막으로 받은 메시지 이후만 조회 (델타 동기화)
+                since_message_id = int(query_params.get("since_message_id") or 0)
+                formatted_messages, has_more = await self.fetch_messages(
+                    after_id=since_message_id
+                )
+
+                # 접속 상태는 캐시 TTL로만 관리 (DB 저장 없음)
+                self.typing_throttle = TypingThrottle()
+                became_online = await PresenceService.mark_online(
+                    int(self.room_id), self.user_info["id"], self.channel_name
+                )
+                peer_online = await PresenceService.is_online(
+                    int(self.room_id), self.peer_id
+                )
+                # heartbeat 때 상대방 상태 변화(연결 만료)를 확인하기 위해 보관
+                self.peer_online = peer_online
+                # 다른 탭으로 이미 접속 중이면 알리지 않음
+                if became_online:
+                    await self.channel_layer.group_send(
+                        self.room_group_name,
+                        {
+                            "type": "presence_event",
+                            "user_id": self.user_info["id"],
+                            "online": True,
+                        },
+                    )
+
                 await self.accept()
                 await self.send(
-                    text_data=json.dumps(
+                    text_data=dumps_str(
                         {
                             "type": "connection_established",
                             "message": "Connected to chat room",
                             "user_info": self.user_info,
                             "prev_messages": formatted_messages,  # 변환된 메시지 사용
+                            # 더 오래된 메시지가 있으면 fetch_history로 추가 조회
+                            "has_more": has_more,
+                            "peer_online": peer_online,
                         }
                     )
                 )
@@ -140,7 +178,7 @@ class ChatConsumer(AsyncWebsocketConsumer):
             except jwt.ExpiredSignatureError:
                 logger.error("Token has expired. 토큰이 만료되었습니다.")
                 await self.send(
-                    text_data=json.dumps(
+                    text_data=dumps_str(
                         {
                             "type": "error",
                             "message": "토큰이 만료되었습니다. 다시 로그인해주세요.",
@@ -152,7 +190,7 @@ class ChatConsumer(AsyncWebsocketConsumer):
             except jwt.InvalidTokenError:
                 logger.error("Invalid token. 유효하지 않은 토큰입니다.")
                 await self.send(
-                    text_data=json.dumps(
+                    text_data=dumps_str(
                         {"type": "error", "message": "유효하지 않은 토큰입니다."}
                     )
                 )
@@ -163,7 +201,134 @@ class ChatConsumer(AsyncWebsocketConsumer):
             logger.error(f"Connection error: {str(e)}")
             await self.close()
 
+    async def fetch_messages(self, after_id: int = 0, before_id=None):
+        """
+        채팅방 메시지를 id 역순으로 최대 CHAT_HISTORY_PAGE_SIZE 개 조회
+        (chat_room_id, id) 인덱스 범위 조회만 수행하고, 화면 표시 순서(오래된 순)로 반환
+        """
+        page_size = getattr(settings, "CHAT_HISTORY_PAGE_SIZE", 50)
+
+        # 다음 페이지 존재 여부 확인을 위해 하나 더 조회
+        if before_id is not None:
+            rows = await fetch(
+                HISTORY_BEFORE_QUERY, int(self.room_id), int(before_id), page_size + 1
+            )
+        else:
+            rows = await fetch(
+                HISTORY_QUERY, int(self.room_id), int(after_id), page_size + 1
+            )
+        has_more = len(rows) > page_size
+
+        # Record 객체를 딕셔너리로 변환
+        formatted_messages = []
+        for msg in reversed(rows[:page_size]):
+            formatted_messages.append(
+                {
+                    "id": msg["id"],
+                    "message": msg["message"],
+                    "sender": {
+                        "id": msg["sender_id"],
+                        "username": msg["sender_username"],
+                        "email": msg["sender_email"],
+                    },
+                    "chat_room_id": msg["chat_room_id"],
+                    "created_at": msg["created_at"].isoformat(),
+                    "updated_at": msg["updated_at"].isoformat(),
+                }
+            )
+        return formatted_messages, has_more
+
+    async def send_history(self, before_message_id):
+        if before_message_id is None:
+            raise ValueError("before_message_id is required")
+
+        messages, has_more = await self.fetch_messages(before_id=before_message_id)
+        await self.send(
+            text_data=dumps_str(
+                {"type": "history", "messages": messages, "has_more": has_more}
+            )
+        )
+
+    async def mark_read(self, message_id):
+        if message_id is None:
+            raise ValueError("message_id is required")
+
+        message_id = int(message_id)
+        if message_id <= max(self.pending_read_id, self.saved_read_id):
+            return
+        self.pending_read_id = message_id
+        if self.read_flush_task is None:
+            self.read_flush_task = asyncio.create_task(self.flush_read_later())
+
+    async def flush_read_later(self):
+        await asyncio.sleep(getattr(settings, "CHAT_READ_FLUSH_INTERVAL", 1.0))
+        self.read_flush_task = None
+        await self.flush_read()
+
+    async def flush_read(self):
+        """모아둔 읽음 위치를 저장하고 채팅방에 읽음 표시 전송"""
+        message_id = self.pending_read_id
+        if message_id <= self.saved_read_id:
+            return
+
+        query = MARK_READ_BUYER_QUERY if self.is_buyer else MARK_READ_SELLER_QUERY
+        row = await fetchrow(query, int(self.room_id), message_id)
+        if row is None:
+            return
+        # 저장된(보정된) 커서 기준으로 이후 읽음 이벤트를 비교
+        previous_id = self.saved_read_id
+        message_id = row["last_read_id"]
+        self.pending_read_id = self.saved_read_id = message_id
+        if message_id <= previous_id:
+            return
+        await self.channel_layer.group_send(
+            self.room_group_name,
+            {
+                "type": "read_receipt",
+                "user_id": self.user_info["id"],
+                "message_id": message_id,
+            },
+        )
+
+    async def send_typing(self, is_typing: bool):
+        if not self.typing_throttle.should_send(is_typing):
+            return
+        await self.channel_layer.group_send(
+            self.room_group_name,
+            {
+                "type": "typing_event",
+                "user_id": self.user_info["id"],
+                "is_typing": is_typing,
+            },
+        )
+
     async def disconnect(self, close_code):
+        try:
+            # 아직 저장되지 않은 읽음 위치 저장
+            if getattr(self, "read_flush_task", None):
+                self.read_flush_task.cancel()
+                self.read_flush_task = None
+            if getattr(self, "pending_read_id", 0):
+                await self.flush_read()
+        except Exception as e:
+            logger.error(f"Read cursor flush error: {str(e)}")
+
+        try:
+            # 접속 종료 알림 (다른 탭의 연결이 남아 있으면 알리지 않음)
+            if getattr(self, "user_info", None) and await PresenceService.mark_offline(
+                int(self.room_id), self.user_info["id"], self.channel_name
+            ):
+                await self.channel_layer.group_send(
+                    self.room_group_name,
+                    {
+                        "type": "presence_event",
+                        "user_id": self.user_info["id"],
+                        "online": False,
+                    },
+                )
+        except Exception as e:
+            logger.error(f"Presence update error: {str(e)}")
+
         try:
             # 그룹에서 채널 제거
             await self.channel_layer.group_discard(
@@ -177,22 +342,47 @@ class ChatConsumer(AsyncWebsocketConsumer):
     async def receive(self, text_data):
         try:
             data = json.loads(text_data)
+
+            # 이전 메시지 페이지 요청
+            if data.get("type") == "fetch_history":
+                await self.send_history(data.get("before_message_id"))
+                return
+
+            # 접속 유지 (CHAT_PRESENCE_TTL 안에 주기적으로 전송)
+            if data.get("type") == "heartbeat":
+                await PresenceService.mark_online(
+                    int(self.room_id), self.user_info["id"], self.channel_name
+                )
+                await self.check_peer_presence()
+                return
+
+            # 입력 중 표시 (서버에서 전송 횟수 제한)
+            if data.get("type") == "typing":
+                await self.send_typing(bool(data.get("is_typing", True)))
+                return
+
+            # 읽음 처리 (가장 최근에 읽은 메시지 id)
+            if data.get("type") == "read":
+                await self.mark_read(data.get("message_id"))
+                return
+
             message = data.get("message")
             sender = self.user_id
 
             if not message or not sender:
                 raise ValueError("Message and sender are required")
 
-            # SQL 인젝션 방지를 위해 execute_query 사용
-            await execute_query(
-                """
-                INSERT INTO chat_message (sender_id, chat_room_id, message, created_at, updated_at)
-                VALUES ($1, $2, $3, NOW(), NOW())
-            """,
-                int(sender),
-                int(self.room_id),
-                message,
-            )
+            if ChatMessageWriter.enabled():
+                # 동시에 들어온 메시지와 함께 저장 (커밋된 뒤에 반환)
+                message_id, created_at = await ChatMessageWriter.get().write(
+                    int(sender), int(self.room_id), message
+                )
+            else:
+                # SQL 인젝션 방지를 위해 파라미터 바인딩 사용
+                inserted = await fetchrow(
+                    INSERT_MESSAGE_QUERY, int(sender), int(self.room_id), message
+                )
+                message_id, created_at = inserted["id"], inserted["created_at"]
 
             print(self.user_info)
 
@@ -201,22 +391,31 @@ class ChatConsumer(AsyncWebsocketConsumer):
 
             await self.channel_layer.group_send(
                 self.room_group_name,
-                {"type": "chat_message", "message": message, "sender": self.user_info},
+                {
+                    "type": "chat_message",
+                    # 클라이언트가 재연결 시 since_message_id로 사용할 메시지 ID
+                    "id": message_id,
+                    "message": message,
+                    "sender": self.user_info,
+                    "created_at": created_at.isoformat(),
+                },
             )
+            # 메시지를 보내면 입력 중 상태도 끝난 것으로 처리
+            self.typing_throttle.is_typing = False
         except json.JSONDecodeError:
             logger.error("Invalid JSON format")
             await self.send(
-                text_data=json.dumps(
+                text_data=dumps_str(
                     {"type": "error", "message": "Invalid message format"}
                 )
             )
         except ValueError as e:
             logger.error(f"Validation error: {e}")
-            await self.send(text_data=json.dumps({"type": "error", "message": str(e)}))
+            await self.send(text_data=dumps_str({"type": "error", "message": str(e)}))
         except Exception as e:
             logger.error(f"Message processing error: {e}")
             await self.send(
-                text_data=json.dumps(
+                text_data=dumps_str(
                     {"type": "error", "message": "Failed to process message"}
                 )
             )
@@ -224,9 +423,71 @@ class ChatConsumer(AsyncWebsocketConsumer):
     async def chat_message(self, event):
         try:
             await self.send(
-                text_data=json.dumps(
-                    {"message": event["message"], "sender": event["sender"]}
+                text_data=dumps_str(
+                    {
+                        "id": event.get("id"),
+                        "message": event["message"],
+                        "sender": event["sender"],
+                        "created_at": event.get("created_at"),
+                    }
                 )
             )
         except Exception as e:
             print(f"Message send error: {str(e)}")
+
+    async def read_receipt(self, event):
+        try:
+            await self.send(
+                text_data=dumps_str(
+                    {
+                        "type": "read",
+                        "user_id": event["user_id"],
+                        "message_id": event["message_id"],
+                    }
+                )
+            )
+        except Exception as e:
+            logger.error(f"Read receipt send error: {str(e)}")
+
+    async def check_peer_presence(self):
+        """
+        상대방 연결이 heartbeat 없이 만료되면 (브라우저 강제 종료, 워커 종료 등)
+        종료 알림이 오지 않으므로 heartbeat 때 상태를 확인해 오프라인을 전송
+        """
+        peer_online = await PresenceService.is_online(int(self.room_id), self.peer_id)
+        if peer_online == self.peer_online:
+            return
+        self.peer_online = peer_online
+        await self.send(
+            text_data=dumps_str(
+                {"type": "presence", "user_id": self.peer_id, "online": peer_online}
+            )
+        )
+
+    async def presence_event(self, event):
+        # 본인 상태는 보내지 않음
+        if event["user_id"] == self.user_info["id"]:
+            return
+        self.peer_online = event["online"]
+        await self.send(
+            text_data=dumps_str(
+                {
+                    "type": "presence",
+                    "user_id": event["user_id"],
+                    "online": event["online"],
+                }
+            )
+        )
+
+    async def typing_event(self, event):
+        if event["user_id"] == self.user_info["id"]:
+            return
+        await self.send(
+            text_data=dumps_str(
+                {
+                    "type": "typing",
+                    "user_id": event["user_id"],
+                    "is_typing": event["is_typing"],
+                }
+            )
+        )
@@ -0,0 +1,82 @@
+import time
+from typing import Optional
+
+from a_core.db import fetchrow, register_query
+
+from django.conf import settings
+
+MEMBER_QUERY = register_query(
+    "chat.room_member",
+    """
+    SELECT u.id, u.username, u.email, cr.buyer_id, pd."user" AS seller_id
+    FROM chat_room cr
+    JOIN product_detail pd ON pd.id = cr.item_id
+    JOIN users u ON u.id = $1
+    WHERE cr.id = $2
+    """,
+)
+
+
+# 채팅방 접속 권한 캐시 (프로세스 단위)
+# 배포 직후 재연결이 몰려도 같은 (유저, 채팅방) 권한 조회가 DB로 반복되지 않도록 짧게 보관
+class RoomMembershipCache:
+    _entries: dict[tuple[int, int], tuple[float, dict]] = {}
+
+    @staticmethod
+    def _timeout() -> int:
+        return getattr(settings, "CHAT_MEMBERSHIP_CACHE_TIMEOUT", 30)
+
+    @staticmethod
+    def _prune(now: float):
+        # 최대 개수를 넘으면 만료된 항목을 정리하고, 그래도 많으면 전체 비움
+        max_entries = getattr(settings, "CHAT_MEMBERSHIP_CACHE_MAX_ENTRIES", 10000)
+        if len(RoomMembershipCache._entries) < max_entries:
+            return
+        RoomMembershipCache._entries = {
+            key: entry
+            for key, entry in RoomMembershipCache._entries.items()
+            if entry[0] > now
+        }
+        if len(RoomMembershipCache._entries) >= max_entries:
+            RoomMembershipCache._entries.clear()
+
+    @staticmethod
+    async def fetch_member(user_id: int, room_id: int) -> Optional[dict]:
+        """
+        유저 정보, 채팅방, 판매자를 한 번의 쿼리로 조회해 접속 권한 확인
+        채팅방의 구매자/판매자이면 유저 정보(id, username, email, is_buyer, peer_id)를, 아니면 None을 반환
+        """
+        row = await fetchrow(MEMBER_QUERY, user_id, room_id)
+        if not row or user_id not in (row["buyer_id"], row["seller_id"]):
+            return None
+        return {
+            "id": row["id"],
+            "username": row["username"],
+            "email": row["email"],
+            "is_buyer": row["buyer_id"] == user_id,
+            # 대화 상대 (접속 상태 확인용)
+            "peer_id": (
+                row["seller_id"] if row["buyer_id"] == user_id else row["buyer_id"]
+            ),
+        }
+
+    @staticmethod
+    async def get_member(user_id: int, room_id: int) -> Optional[dict]:
+        """
+        캐시를 먼저 확인하고, 없으면 DB에서 접속 권한을 조회
+        방금 생성된 채팅방에 바로 접속할 수 있도록 권한이 있는 경우만 저장
+        """
+        key = (user_id, room_id)
+        now = time.monotonic()
+        entry = RoomMembershipCache._entries.get(key)
+        if entry and entry[0] > now:
+            return entry[1]
+
+        member = await RoomMembershipCache.fetch_member(user_id, room_id)
+        if member:
+            RoomMembershipCache._prune(now)
+            RoomMembershipCache._entries[key] = (
+                now + RoomMembershipCache._timeout(),
+                member,
+            )
+        return member
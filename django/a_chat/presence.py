@@ -0,0 +1,93 @@
+import time
+from logging import getLogger
+
+from django.conf import settings
+from django.core.cache import cache
+
+logger = getLogger(__name__)
+
+
+# 채팅방 접속 상태 (DB에 저장하지 않고 캐시 TTL로만 관리)
+# 사용자별로 연결(channel_name)마다 만료 시간을 저장 - 여러 탭으로 접속해도 마지막 연결이 끊길 때만 오프라인
+# 클라이언트가 heartbeat를 보내지 않으면 그 연결은 만료 시간이 지나 자동으로 빠지고,
+# 상대방 연결이 heartbeat 때 상태 변화를 확인해 오프라인을 알림
+# 연결 목록은 읽고 다시 쓰므로 동시에 갱신되면 한쪽이 빠질 수 있지만 다음 heartbeat에서 다시 등록됨
+class PresenceService:
+    KEY_PREFIX = "chat:presence"
+
+    @staticmethod
+    def key(room_id: int, user_id: int) -> str:
+        return f"{PresenceService.KEY_PREFIX}:{room_id}:{user_id}"
+
+    @staticmethod
+    async def get_connections(room_id: int, user_id: int) -> dict[str, float]:
+        """만료되지 않은 연결 {channel_name: 만료 시간}"""
+        connections = await cache.aget(PresenceService.key(room_id, user_id)) or {}
+        now = time.time()
+        return {
+            channel: expires_at
+            for channel, expires_at in connections.items()
+            if expires_at > now
+        }
+
+    @staticmethod
+    async def mark_online(room_id: int, user_id: int, channel_name: str) -> bool:
+        """연결을 등록(갱신)하고, 이 연결로 새로 온라인이 되었으면 True 반환"""
+        ttl = getattr(settings, "CHAT_PRESENCE_TTL", 60)
+        try:
+            connections = await PresenceService.get_connections(room_id, user_id)
+            was_online = bool(connections)
+            connections[channel_name] = time.time() + ttl
+            await cache.aset(
+                PresenceService.key(room_id, user_id), connections, timeout=ttl
+            )
+            return not was_online
+        except Exception as e:
+            logger.warning(f"Presence set failed: {e}")
+            return True
+
+    @staticmethod
+    async def mark_offline(room_id: int, user_id: int, channel_name: str) -> bool:
+        """연결을 제거하고, 마지막 연결이 끊겨 오프라인이 되었으면 True 반환"""
+        key = PresenceService.key(room_id, user_id)
+        try:
+            connections = await PresenceService.get_connections(room_id, user_id)
+            connections.pop(channel_name, None)
+            if not connections:
+                await cache.adelete(key)
+                return True
+            await cache.aset(
+                key, connections, timeout=getattr(settings, "CHAT_PRESENCE_TTL", 60)
+            )
+            return False
+        except Exception as e:
+            logger.warning(f"Presence delete failed: {e}")
+            return True
+
+    @staticmethod
+    async def is_online(room_id: int, user_id: int) -> bool:
+        try:
+            return bool(await PresenceService.get_connections(room_id, user_id))
+        except Exception as e:
+            logger.warning(f"Presence get failed: {e}")
+            return False
+
+
+# 입력 중 이벤트 제한 (연결 단위)
+# 입력 시작은 CHAT_TYPING_THROTTLE 초에 한 번만 전송하고, 입력 종료는 시작을 보낸 경우에만 전송
+class TypingThrottle:
+    def __init__(self):
+        self.last_sent = 0.0
+        self.is_typing = False
+
+    def should_send(self, is_typing: bool) -> bool:
+        now = time.monotonic()
+        if is_typing:
+            interval = getattr(settings, "CHAT_TYPING_THROTTLE", 2.0)
+            if self.is_typing and now - self.last_sent < interval:
+                return False
+            self.last_sent = now
+        elif not self.is_typing:
+            return False
+        self.is_typing = is_typing
+        return True
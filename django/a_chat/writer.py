@@ -0,0 +1,138 @@
+import asyncio
+from datetime import datetime
+from logging import getLogger
+from typing import Optional
+
+import asyncpg
+from a_core.db import fetch, fetchrow, register_query
+
+from django.conf import settings
+
+logger = getLogger(__name__)
+
+INSERT_MESSAGE_QUERY = register_query(
+    "chat.insert_message",
+    """
+    INSERT INTO chat_message (sender_id, chat_room_id, message, created_at, updated_at)
+    VALUES ($1, $2, $3, NOW(), NOW())
+    RETURNING id, created_at
+    """,
+)
+# 여러 메시지를 INSERT 한 번으로 저장
+# ORDER BY ord로 입력 순서대로 삽입하므로 id도 입력 순서대로 증가 (RETURNING 순서는 보장되지 않음)
+INSERT_MESSAGES_QUERY = register_query(
+    "chat.insert_messages",
+    """
+    INSERT INTO chat_message (sender_id, chat_room_id, message, created_at, updated_at)
+    SELECT t.sender_id, t.chat_room_id, t.message, NOW(), NOW()
+    FROM unnest($1::bigint[], $2::bigint[], $3::text[]) WITH ORDINALITY
+         AS t(sender_id, chat_room_id, message, ord)
+    ORDER BY t.ord
+    RETURNING id, created_at
+    """,
+)
+
+
+# 채팅 메시지 묶음 저장 (워커 프로세스 단위, group commit)
+# INSERT가 진행 중인 동안 들어온 메시지를 모아 다음 INSERT 한 번으로 저장
+# 진행 중인 INSERT가 없으면 바로 저장하므로 혼자 보낸 메시지는 추가로 기다리지 않음
+# 메시지는 커밋된 뒤에 id를 돌려받아 전송하므로, 전송된 메시지는 항상 DB에 있고
+# id 순서가 커밋 순서와 같아 since_message_id 동기화/읽음 커서가 메시지를 건너뛰지 않음
+class ChatMessageWriter:
+    _default: Optional["ChatMessageWriter"] = None
+
+    def __init__(self):
+        self._pending: list[tuple[int, int, str, asyncio.Future]] = []
+        self._flusher: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._closing = False
+
+    @staticmethod
+    def enabled() -> bool:
+        return getattr(settings, "CHAT_MESSAGE_BATCH_INSERT", False)
+
+    @classmethod
+    def get(cls) -> "ChatMessageWriter":
+        if cls._default is None:
+            cls._default = cls()
+        return cls._default
+
+    def _ensure_flusher(self):
+        if self._flusher is None or self._flusher.done():
+            self._wakeup = asyncio.Event()
+            self._flusher = asyncio.get_running_loop().create_task(self._flush_loop())
+
+    async def write(
+        self, sender_id: int, room_id: int, message: str
+    ) -> tuple[int, datetime]:
+        """메시지를 저장 대기열에 넣고, 묶음 INSERT가 커밋되면 (id, 생성 시간)을 반환"""
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((sender_id, room_id, message, future))
+        self._ensure_flusher()
+        self._wakeup.set()
+        return await future
+
+    async def _flush_loop(self):
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            await self.flush()
+            if self._closing and not self._pending:
+                return
+
+    async def flush(self):
+        batch_size = getattr(settings, "CHAT_MESSAGE_BATCH_SIZE", 100)
+        while self._pending:
+            batch = self._pending[:batch_size]
+            del self._pending[: len(batch)]
+            await self._insert(batch)
+
+    async def _insert(self, batch: list[tuple[int, int, str, asyncio.Future]]):
+        try:
+            rows = await fetch(
+                INSERT_MESSAGES_QUERY,
+                [row[0] for row in batch],
+                [row[1] for row in batch],
+                [row[2] for row in batch],
+            )
+        except asyncpg.exceptions.PostgresError:
+            # 삭제된 채팅방 등 일부 행 때문에 배치 전체가 실패하면 한 건씩 저장
+            await self._insert_one_by_one(batch)
+            return
+        except Exception as e:
+            # 연결 오류 등은 배치 전체를 실패 처리 (보낸 쪽에 오류 응답)
+            logger.error(f"Chat message batch insert failed: {e}")
+            for *_, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (*_, future), row in zip(batch, sorted(rows, key=lambda r: r["id"])):
+            if not future.done():
+                future.set_result((row["id"], row["created_at"]))
+
+    async def _insert_one_by_one(
+        self, batch: list[tuple[int, int, str, asyncio.Future]]
+    ):
+        for sender_id, room_id, message, future in batch:
+            try:
+                row = await fetchrow(INSERT_MESSAGE_QUERY, sender_id, room_id, message)
+            except Exception as e:
+                logger.error(f"Chat message insert failed (room {room_id}): {e}")
+                if not future.done():
+                    future.set_exception(e)
+                continue
+            if not future.done():
+                future.set_result((row["id"], row["created_at"]))
+
+    async def close(self):
+        """
+        lifespan 종료 시 대기 중인 메시지를 모두 저장하고 flusher를 종료
+        진행 중인 INSERT를 취소하지 않고 끝까지 기다림 (취소하면 그 배치가 저장되지 않을 수 있음)
+        """
+        self._closing = True
+        if self._flusher is not None and not self._flusher.done():
+            self._wakeup.set()
+            await self._flusher
+        self._flusher = None
+        await self.flush()
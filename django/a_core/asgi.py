@@ -5,6 +5,7 @@ import django
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "a_core.settings.product_asgi")
 django.setup()
 import a_chat.routing
+from a_chat.writer import ChatMessageWriter
 from a_core.db import close_db, init_db
 from channels.auth import AuthMiddlewareStack
 from channels.routing import ProtocolTypeRouter, URLRouter
@@ -20,6 +21,8 @@ async def lifespan(scope, receive, send):
                 await init_db()
                 await send({"type": "lifespan.startup.complete"})
             elif message["type"] == "lifespan.shutdown":
+                # 풀을 닫기 전에 저장 대기 중인 채팅 메시지를 모두 저장
+                await ChatMessageWriter.get().close()
                 await close_db()
                 await send({"type": "lifespan.shutdown.complete"})
                 return
@@ -1,4 +1,7 @@
+import asyncio
 import logging
+import time
+from typing import Optional
 
 import asyncpg
 
@@ -7,47 +10,205 @@ from django.conf import settings
 logger = logging.getLogger(__name__)
 
 db_pool = None
+_pool_lock = asyncio.Lock()
+
+# ASYNC_DB_CONFIG에 값이 없을 때 사용하는 풀 설정
+DEFAULT_POOL_CONFIG = {
+    "min_size": 5,
+    "max_size": 20,
+    "timeout": 30,
+    "command_timeout": 60,
+}
+
+# 커넥션 획득 대기 통계
+_acquire_stats = {"acquire_count": 0, "wait_total": 0.0, "wait_max": 0.0}
 
 
 async def init_db():
+    """
+    워커(프로세스)당 한 번만 커넥션 풀 생성
+    동시에 여러 번 호출되어도 락으로 보호되어 풀이 중복 생성되지 않음
+    """
     global db_pool
-    try:
-        if db_pool is None:
-            db_pool = await asyncpg.create_pool(
-                **settings.ASYNC_DB_CONFIG,
-                min_size=5,
-                max_size=20,
-                timeout=30,
-                command_timeout=60,
+    if db_pool is not None:
+        return db_pool
+
+    async with _pool_lock:
+        if db_pool is not None:
+            return db_pool
+        try:
+            config = {**DEFAULT_POOL_CONFIG, **settings.ASYNC_DB_CONFIG}
+            db_pool = await asyncpg.create_pool(**config)
+            logger.info(
+                "Database connection pool initialized successfully "
+                f"(min_size={config['min_size']}, max_size={config['max_size']})"
             )
-            logger.info("Database connection pool initialized successfully")
-    except asyncpg.exceptions.PostgresError as e:
-        logger.error(f"Failed to initialize database pool: {e}")
-        raise
+        except asyncpg.exceptions.PostgresError as e:
+            logger.error(f"Failed to initialize database pool: {e}")
+            raise
+    return db_pool
+
+
+async def get_pool():
+    # lifespan 없이 실행된 경우(runserver 등)를 위해 첫 사용 시 풀 생성
+    if db_pool is None:
+        return await init_db()
+    return db_pool
 
 
 async def close_db():
     global db_pool
-    try:
-        if db_pool:
-            await db_pool.close()
-            db_pool = None
-            logger.info("Database connection pool closed successfully")
-    except asyncpg.exceptions.PostgresError as e:
-        logger.error(f"Error closing database pool: {e}")
-        raise
+    async with _pool_lock:
+        try:
+            if db_pool:
+                await db_pool.close()
+                db_pool = None
+                logger.info("Database connection pool closed successfully")
+        except asyncpg.exceptions.PostgresError as e:
+            logger.error(f"Error closing database pool: {e}")
+            raise
 
 
-async def execute_query(query: str, *args):
+def get_pool_stats() -> dict:
+    """풀 크기와 사용 중/유휴 커넥션 수, 커넥션 획득 대기 시간(ms) 통계"""
+    count = _acquire_stats["acquire_count"]
+    stats = {
+        "initialized": db_pool is not None,
+        "acquire_count": count,
+        "wait_avg_ms": (
+            round(_acquire_stats["wait_total"] / count * 1000, 3) if count else 0.0
+        ),
+        "wait_max_ms": round(_acquire_stats["wait_max"] * 1000, 3),
+    }
+    if db_pool is not None:
+        size = db_pool.get_size()
+        idle = db_pool.get_idle_size()
+        stats.update(
+            {
+                "min_size": db_pool.get_min_size(),
+                "max_size": db_pool.get_max_size(),
+                "size": size,
+                "idle": idle,
+                "acquired": size - idle,
+            }
+        )
+    return stats
+
+
+def _record_acquire_wait(wait: float):
+    _acquire_stats["acquire_count"] += 1
+    _acquire_stats["wait_total"] += wait
+    _acquire_stats["wait_max"] = max(_acquire_stats["wait_max"], wait)
+
+
+# 이름이 붙은 쿼리 목록 (name -> SQL)
+# 항상 같은 SQL 문자열이 사용되므로 asyncpg의 커넥션별 prepared statement 캐시에 적중
+QUERIES: dict[str, str] = {}
+
+# 쿼리 실행 시간 히스토그램 구간 (ms, 마지막 구간은 그 이상)
+LATENCY_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500)
+
+# 쿼리 이름별 실행 통계
+_query_stats: dict[str, dict] = {}
+
+
+def register_query(name: str, sql: str) -> str:
+    if QUERIES.get(name, sql) != sql:
+        raise ValueError(f"이미 다른 SQL로 등록된 쿼리 이름입니다: {name}")
+    QUERIES[name] = sql
+    return name
+
+
+def _slow_query_threshold_ms(name: str) -> float:
+    overrides = getattr(settings, "ASYNC_DB_SLOW_QUERY_OVERRIDES_MS", {})
+    if name in overrides:
+        return overrides[name]
+    return getattr(settings, "ASYNC_DB_SLOW_QUERY_MS", 200)
+
+
+def _record_query(name: str, elapsed_ms: float):
+    stats = _query_stats.get(name)
+    if stats is None:
+        stats = _query_stats[name] = {
+            "count": 0,
+            "total_ms": 0.0,
+            "max_ms": 0.0,
+            "buckets": [0] * (len(LATENCY_BUCKETS_MS) + 1),
+        }
+    stats["count"] += 1
+    stats["total_ms"] += elapsed_ms
+    stats["max_ms"] = max(stats["max_ms"], elapsed_ms)
+    for index, bound in enumerate(LATENCY_BUCKETS_MS):
+        if elapsed_ms <= bound:
+            stats["buckets"][index] += 1
+            break
+    else:
+        stats["buckets"][-1] += 1
+
+    if elapsed_ms >= _slow_query_threshold_ms(name):
+        logger.warning(f"Slow query [{name}]: {elapsed_ms:.1f}ms")
+
+
+def get_query_stats() -> dict:
+    """쿼리 이름별 호출 수, 평균/최대 실행 시간(ms), 실행 시간 히스토그램"""
+    labels = [f"le_{bound}" for bound in LATENCY_BUCKETS_MS] + ["inf"]
+    return {
+        name: {
+            "count": stats["count"],
+            "avg_ms": round(stats["total_ms"] / stats["count"], 3),
+            "max_ms": round(stats["max_ms"], 3),
+            "histogram": dict(zip(labels, stats["buckets"])),
+        }
+        for name, stats in _query_stats.items()
+    }
+
+
+async def _run(method: str, name: str, query: str, *args, **kwargs):
     try:
-        async with db_pool.acquire() as conn:
-            return await conn.fetch(query, *args)
+        pool = await get_pool()
+        started = time.perf_counter()
+        async with pool.acquire() as conn:
+            _record_acquire_wait(time.perf_counter() - started)
+            query_started = time.perf_counter()
+            try:
+                return await getattr(conn, method)(query, *args, **kwargs)
+            finally:
+                _record_query(name, (time.perf_counter() - query_started) * 1000)
     except (
         asyncpg.exceptions.ConnectionDoesNotExistError,
         asyncpg.exceptions.ConnectionFailureError,
     ) as e:
-        logger.error(f"Database connection error: {e}")
+        logger.error(f"Database connection error [{name}]: {e}")
         raise
     except Exception as e:
-        logger.error(f"Query execution error: {e}")
+        logger.error(f"Query execution error [{name}]: {e}")
         raise
+
+
+async def fetch(name: str, *args) -> list[asyncpg.Record]:
+    return await _run("fetch", name, QUERIES[name], *args)
+
+
+async def fetchrow(name: str, *args) -> Optional[asyncpg.Record]:
+    # 단일 행 조회 (Record 리스트를 만들지 않음)
+    return await _run("fetchrow", name, QUERIES[name], *args)
+
+
+async def fetchval(name: str, *args, column: int = 0):
+    # 단일 값 조회
+    return await _run("fetchval", name, QUERIES[name], *args, column=column)
+
+
+async def execute(name: str, *args) -> str:
+    # 결과 행이 필요 없는 INSERT/UPDATE/DELETE
+    return await _run("execute", name, QUERIES[name], *args)
+
+
+async def executemany(name: str, args) -> None:
+    # 같은 쿼리를 여러 인자 묶음으로 실행
+    return await _run("executemany", name, QUERIES[name], args)
+
+
+async def execute_query(query: str, *args):
+    # 이름 없는 SQL 실행 (통계는 "adhoc"으로 집계)
+    return await _run("fetch", "adhoc", query, *args)
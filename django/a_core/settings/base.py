@@ -219,3 +219,112 @@ SESSION_COOKIE_HTTPONLY = True
 CSRF_COOKIE_HTTPONLY = True
 SESSION_COOKIE_SAMESITE = "Lax"
 CSRF_COOKIE_SAMESITE = "Lax"
+
+# 매물 상세 조회 캐시 유지 시간 (초)
+PRODUCT_DETAIL_CACHE_TIMEOUT = 60 * 5
+
+# 인증 유저 캐시 유지 시간 (초) - 회원정보 수정/탈퇴 시 즉시 무효화
+AUTH_USER_CACHE_TIMEOUT = 60
+
+# 매물 이미지/동영상 동시 업로드 스레드 수
+MEDIA_UPLOAD_MAX_WORKERS = 4
+
+# 매물 이미지 파생본(썸네일/웹 최적화본) 설정
+IMAGE_DERIVATIVE_MAX_WORKERS = 2  # 백그라운드 생성 스레드 수
+PRODUCT_THUMBNAIL_SIZE = (320, 320)  # 목록/지도용 썸네일 (고정 크기로 잘라냄)
+PRODUCT_WEB_IMAGE_SIZE = (1280, 1280)  # 상세 조회용 최대 크기 (비율 유지)
+IMAGE_DERIVATIVE_QUALITY = 80  # JPEG 품질
+
+# 채팅 접속/이전 메시지 요청 시 한 번에 보내는 메시지 수
+CHAT_HISTORY_PAGE_SIZE = 50
+
+# 채팅방 접속 권한 캐시 (프로세스 단위, 초)
+CHAT_MEMBERSHIP_CACHE_TIMEOUT = 30
+CHAT_MEMBERSHIP_CACHE_MAX_ENTRIES = 10000
+
+# 비동기(asyncpg) 느린 쿼리 로그 기준 (ms) - 쿼리 이름별로 기준을 다르게 줄 수 있음
+ASYNC_DB_SLOW_QUERY_MS = 200
+ASYNC_DB_SLOW_QUERY_OVERRIDES_MS = {}
+
+# 채팅 메시지 묶음 저장 (기본 꺼짐)
+# 켜면 INSERT가 진행 중인 동안 들어온 메시지를 다음 INSERT 한 번으로 저장
+# 저장(커밋)이 끝난 뒤에 전송하므로 유실되지 않음 (전송 전 DB 왕복 한 번은 그대로 남음)
+CHAT_MESSAGE_BATCH_INSERT = False
+CHAT_MESSAGE_BATCH_SIZE = 100  # 한 번에 저장하는 최대 메시지 수
+
+# 채팅 읽음 위치 저장 주기 (초) - 이 시간 동안의 읽음 이벤트는 한 번만 저장
+CHAT_READ_FLUSH_INTERVAL = 1.0
+
+# 채팅 접속 상태 유지 시간 (초) - 클라이언트는 이보다 짧은 주기로 heartbeat 전송
+# heartbeat가 이 시간 동안 없으면 그 연결은 끊긴 것으로 보고, 상대방의 다음 heartbeat 때 오프라인 전송
+CHAT_PRESENCE_TTL = 60
+# 입력 중 이벤트 최소 전송 간격 (초)
+CHAT_TYPING_THROTTLE = 2.0
+
+# API JSON 요청 본문 최대 크기 (바이트) - 초과 시 파싱하지 않고 413 응답
+API_JSON_MAX_BODY_SIZE = 1024 * 1024
+
+# PUT/PATCH multipart 업로드 제한 (바이트)
+PUT_UPLOAD_MAX_FILE_SIZE = 100 * 1024 * 1024  # 파일당 최대 크기
+PUT_UPLOAD_MAX_TOTAL_SIZE = 300 * 1024 * 1024  # 요청 전체 최대 크기
+PUT_UPLOAD_MEMORY_THRESHOLD = (
+    2621440  # 이보다 큰 요청의 파일은 임시 파일에 저장 (2.5MB)
+)
+
+# 소셜 로그인 제공자 HTTP 설정
+# timeout은 (연결, 응답) 초 - 느린 제공자가 워커를 붙잡지 않도록 제한
+OAUTH_PROVIDERS = {
+    "google": {
+        "token_url": "https://oauth2.googleapis.com/token",
+        "userinfo_url": "https://www.googleapis.com/oauth2/v1/userinfo",
+        "timeout": (3, 5),
+    },
+    "kakao": {
+        "token_url": "https://kauth.kakao.com/oauth/token",
+        "userinfo_url": "https://kapi.kakao.com/v2/user/me",
+        "timeout": (3, 5),
+    },
+    "naver": {
+        "token_url": "https://nid.naver.com/oauth2.0/token",
+        "userinfo_url": "https://openapi.naver.com/v1/nid/me",
+        "timeout": (3, 5),
+    },
+}
+OAUTH_HTTP_POOL_MAXSIZE = 10  # 호스트별 keep-alive 연결 수
+OAUTH_HTTP_RETRIES = 2  # 연결 실패/5xx 재시도 횟수 (POST는 연결 실패만 재시도)
+OAUTH_HTTP_BACKOFF = 0.2  # 재시도 간격 (0.2, 0.4, ... 초)
+
+# 소셜 로그인 콜백 중복 처리 방지 (같은 인가 코드의 콜백은 한 번만 처리, 초)
+OAUTH_CALLBACK_LOCK_TIMEOUT = (
+    30  # 처리 중 잠금 유지 시간 - 이 동안 같은 코드의 콜백은 바로 409
+)
+# 처리 완료 표시 보관 시간 - 이 시간 동안 같은 코드의 콜백은 409 (토큰은 저장하지 않음)
+OAUTH_CALLBACK_DONE_TIMEOUT = 600
+
+# 이메일 발송 대기열
+# 켜면 커밋 이후 웹 프로세스의 백그라운드 스레드에서 바로 발송하고,
+# 재시도(backoff) 중인 이메일이 남아 있으면 다음 시도 시간에 다시 발송하도록 예약
+# 프로세스가 재시작되어 예약이 사라져도 발송되도록 email-worker(docker-compose,
+# python manage.py drain_email_outbox --loop)가 주기적으로 대기열을 확인 - 함께 실행해도 중복 발송되지 않음
+EMAIL_OUTBOX_DRAIN_ON_COMMIT = True
+EMAIL_OUTBOX_BATCH_SIZE = 50  # SMTP 연결 하나로 보내는 최대 수
+EMAIL_OUTBOX_MAX_ATTEMPTS = 5  # 최대 발송 시도 횟수
+EMAIL_OUTBOX_RETRY_BACKOFF = 30  # 재시도 간격 (30, 60, 120, ... 초)
+EMAIL_OUTBOX_LEASE_SECONDS = (
+    300  # 워커가 가져간 뒤 다른 워커가 다시 가져갈 수 있기까지의 시간
+)
+EMAIL_OUTBOX_POLL_INTERVAL = 5  # 워커가 빈 대기열을 다시 확인하는 간격 (초)
+# 발송 완료/실패 이메일 보관 기간 (일)
+# drain_email_outbox --loop가 EMAIL_OUTBOX_PRUNE_INTERVAL(초)마다 이 이메일과 만료된 이메일 인증을 정리
+EMAIL_OUTBOX_SENT_RETENTION_DAYS = 7
+EMAIL_OUTBOX_FAILED_RETENTION_DAYS = 30
+EMAIL_OUTBOX_PRUNE_INTERVAL = 60 * 60
+
+# 이메일 인증 저장소 ("database" 또는 "cache")
+# cache는 Redis TTL로 자동 만료되어 테이블이 쌓이지 않음
+# database는 email-worker(drain_email_outbox --loop)가 EMAIL_OUTBOX_PRUNE_INTERVAL마다 정리
+EMAIL_VERIFICATION_STORE = "database"
+EMAIL_VERIFICATION_CODE_TTL = 60 * 30  # 인증번호 유효 시간 (초)
+EMAIL_VERIFICATION_VERIFIED_TTL = (
+    60 * 60 * 24
+)  # 인증 완료 후 회원가입까지 유지 시간 (초)
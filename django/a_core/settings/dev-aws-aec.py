@@ -71,6 +71,9 @@ ASYNC_DB_CONFIG = {
     "database": os.getenv("DEV_AWS_RDS_NAME"),
     "host": os.getenv("DEV_AWS_RDS_HOST"),
     "port": os.getenv("DEV_AWS_RDS_PORT"),
+    # 워커(프로세스)당 커넥션 풀 크기 - 전체 커넥션 수는 워커 수 x max_size
+    "min_size": int(os.getenv("ASYNC_DB_POOL_MIN_SIZE", 2)),
+    "max_size": int(os.getenv("ASYNC_DB_POOL_MAX_SIZE", 10)),
 }
 
 